@@ -0,0 +1,40 @@
+import argparse
+import os
+import sys
+import time
+
+from globals.enums.enums import BatchOutput
+from infrastructure.factories.manager_factory import ManagerFactory
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render stored points or tracks onto videos without the GUI")
+    parser.add_argument("videos", nargs="+", help="videos to process")
+    parser.add_argument("--output-dir", required=True, help="where results are written")
+    parser.add_argument("--format", choices=[output.value for output in BatchOutput], default=BatchOutput.VIDEO.value,
+                        help="overlay video or per-frame coordinates csv")
+    parser.add_argument("--points-dir", help="where <video name>.csv/.npz points are looked up "
+                                             "(default: next to each video)")
+    parser.add_argument("--track", action="store_true", help="follow each stored point from its frame on")
+    parser.add_argument("--workers", type=int, default=0, help="parallel processes (default: one per core)")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    batch_manager = ManagerFactory.create_batch_manager(args.workers)
+    jobs = batch_manager.create_jobs(args.videos, args.output_dir, BatchOutput(args.format),
+                                     args.points_dir, args.track)
+    start = time.perf_counter()
+    total_frames = 0
+    failed = 0
+    for result in batch_manager.run(jobs):
+        if result.error:
+            failed += 1
+            print(f"{result.video_path}: failed ({result.error})")
+            continue
+        total_frames += result.frame_count
+        print(f"{result.video_path}: {result.frame_count} frames in {result.elapsed_seconds:.2f}s "
+              f"({result.fps:.1f} fps) -> {result.output_path}")
+    elapsed = time.perf_counter() - start
+    print(f"{len(jobs) - failed}/{len(jobs)} videos, {total_frames} frames in {elapsed:.2f}s "
+          f"({total_frames / elapsed if elapsed > 0 else 0.0:.1f} fps overall)")
+    sys.exit(1 if failed else 0)
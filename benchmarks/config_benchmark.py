@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.config.json_config_manager import JsonConfigManager
+from infrastructure.config.toml_config_manager import TomlConfigManager
+from infrastructure.config.xml_config_manager import XMLConfigManager
+
+ROOT_NAME = "benchmark"
+
+
+def make_document(sections: int, keys_per_section: int) -> Dict[str, Any]:
+    # ? Mixed value types, like a real configuration
+    rng = np.random.default_rng(0)
+    document = {}
+    for section in range(sections):
+        document[f"section_{section}"] = {
+            f"key_{key}": [str(int(rng.integers(0, 10000))), f"{rng.random():.4f}",
+                           ConstStrings.CONFIG_TRUE, f"value_{section}_{key}"][key % 4]
+            for key in range(keys_per_section)}
+    return {ROOT_NAME: document}
+
+
+def write_xml(path: str, document: Dict[str, Any]) -> None:
+    root = ET.Element(ROOT_NAME)
+    for section, values in document[ROOT_NAME].items():
+        section_element = ET.SubElement(root, section)
+        for key, value in values.items():
+            ET.SubElement(section_element, key).text = value
+    ET.indent(root, space=ConstStrings.CONFIG_INDENT)
+    ET.ElementTree(root).write(path, encoding=ConstStrings.CONFIG_ENCODING, xml_declaration=True)
+
+
+def write_files(directory: str, document: Dict[str, Any]) -> Dict[str, str]:
+    paths = {name: os.path.join(directory, f"benchmark{suffix}") for name, suffix in
+             (("xml", ".xml"), ("json", ConstStrings.CONFIG_JSON_SUFFIX), ("toml", ConstStrings.CONFIG_TOML_SUFFIX))}
+    write_xml(paths["xml"], document)
+    with open(paths["json"], "w") as json_file:
+        json.dump(document, json_file, indent=len(ConstStrings.CONFIG_INDENT))
+    with open(paths["toml"], "wb") as toml_file:
+        toml_file.write(TomlConfigManager._dump_document(TomlConfigManager.__new__(TomlConfigManager), document))
+    return paths
+
+
+def median_ms(action: Callable[[], Any], repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return float(np.median(samples))
+
+
+def run(sections: int, keys_per_section: int, repeats: int) -> None:
+    directory = tempfile.mkdtemp()
+    paths = write_files(directory, make_document(sections, keys_per_section))
+    managers = {"xml": XMLConfigManager, "json": JsonConfigManager, "toml": TomlConfigManager}
+    print(f"{sections * keys_per_section} keys, median of {repeats} loads")
+    print(f"{'backend':<8} {'file KB':>8} {'parse ms':>9} {'cached ms':>10} {'touched ms':>11} {'get us':>7}")
+    rows: List[str] = []
+    for name, manager_class in managers.items():
+        path = paths[name]
+        parse_ms = median_ms(lambda: manager_class(path), repeats)
+        # ? The first cached load writes the cache, later ones only unpickle it
+        manager = manager_class(path, is_cached=True)
+        cached_ms = median_ms(lambda: manager_class(path, is_cached=True), repeats)
+
+        def touched_load() -> None:
+            # ? A new modification time with the same content: hashed, then taken from the cache
+            os.utime(path)
+            manager_class(path, is_cached=True)
+
+        touched_ms = median_ms(touched_load, repeats)
+        key = ("section_0", "key_1")
+        start = time.perf_counter()
+        for _ in range(10000):
+            manager.get(*key)
+        get_us = (time.perf_counter() - start) * 100.0
+        rows.append(f"{name:<8} {os.path.getsize(path) / 1024:>8.0f} {parse_ms:>9.1f} {cached_ms:>10.1f} "
+                    f"{touched_ms:>11.1f} {get_us:>7.2f}")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load time of each config backend, parsed and from the compiled cache")
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=100, help="keys per section")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    run(args.sections, args.keys, args.repeat)
@@ -0,0 +1,86 @@
+import argparse
+import sys
+import time
+from threading import Thread
+from typing import Callable, List
+
+from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
+
+from globals.enums.enums import DeliveryMode, Topic
+from infrastructure.events.event_bus import EventBus
+
+
+class SignalSource(QObject):
+    # ? How the bus used to deliver across threads: one queued event per emit
+    point_signal = pyqtSignal(int, int)
+
+
+class Receiver(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered = 0
+
+    def on_point(self, *_) -> None:
+        self.delivered += 1
+
+
+def run_case(app: QCoreApplication, publish: Callable[[int], None], receiver: Receiver, events: int,
+             rate: float) -> str:
+    publish_seconds = [0.0]
+
+    def producer() -> None:
+        # ? Paced like a tracker or mouse moves when a rate is given, back to back otherwise
+        interval = 1.0 / rate if rate > 0 else 0.0
+        next_event = time.perf_counter()
+        for index in range(events):
+            start = time.perf_counter()
+            publish(index)
+            publish_seconds[0] += time.perf_counter() - start
+            if interval:
+                next_event += interval
+                delay = next_event - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+    thread = Thread(target=producer)
+    thread.start()
+    passes = 0
+    while thread.is_alive():
+        app.processEvents()
+        passes += 1
+    finished = time.perf_counter()
+    # ? Whatever is still queued once the producer is done is the backlog the GUI thread is behind by
+    while app.hasPendingEvents():
+        app.processEvents()
+    drain_ms = (time.perf_counter() - finished) * 1000.0
+    return (f"{publish_seconds[0] / events * 1e6:>10.2f} {receiver.delivered:>10} {drain_ms:>9.1f}")
+
+
+def run(events: int, rate: float) -> None:
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    rows: List[str] = []
+
+    source, receiver = SignalSource(), Receiver()
+    source.point_signal.connect(receiver.on_point)
+    rows.append(f"{'signal, queued':<22} " + run_case(app, lambda index: source.point_signal.emit(index, index),
+                                                      receiver, events, rate))
+    for name, mode, is_coalesced in (("bus gui, queued", DeliveryMode.GUI, False),
+                                     ("bus gui, coalesced", DeliveryMode.GUI, True),
+                                     ("bus worker, coalesced", DeliveryMode.WORKER, True)):
+        bus, receiver = EventBus(), Receiver()
+        subscription = bus.subscribe(Topic.COORDINATES, receiver.on_point, mode, is_coalesced)
+        rows.append(f"{name:<22} " + run_case(app, lambda index: bus.publish(Topic.COORDINATES, (index, index)),
+                                              receiver, events, rate))
+        bus.unsubscribe(subscription)
+        rows[-1] += f" {subscription.dropped:>8} {subscription.coalesced:>9}"
+    print(f"{events} events from a worker thread" + (f" at {rate:.0f}/s" if rate > 0 else ", back to back"))
+    print(f"{'case':<22} {'publish us':>10} {'delivered':>10} {'drain ms':>9} {'dropped':>8} {'coalesced':>9}")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-thread delivery to the GUI thread, per-emit signals vs bus topics")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=0.0, help="events per second, 0 for back to back")
+    args = parser.parse_args()
+    run(args.events, args.rate)
@@ -0,0 +1,99 @@
+import argparse
+import os
+import tempfile
+import time
+from threading import Event
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic_video import ensure_video
+from globals.consts.consts import Consts
+from infrastructure.factories.manager_factory import ManagerFactory
+from model.managers.frame_store_manager import FrameStoreManager
+from model.managers.video_manager import VideoManager
+from model.pipeline.frame_cache import FrameCache
+from model.pipeline.frame_store import FrameStore
+
+
+def build_frame_store(video_path: str, height: int) -> Optional[FrameStore]:
+    # ? Built the way the app builds it, on the shared executor, then opened like a later load would
+    is_complete = Event()
+    frame_store_manager = FrameStoreManager(video_path, height, Consts.FRAME_STORE_MAX_MB * Consts.BYTES_PER_MEGABYTE,
+                                            ManagerFactory.create_task_executor(),
+                                            ManagerFactory.create_keyframe_index(video_path))
+    frame_store_manager.set_complete_callback(is_complete.set)
+    frame_store_manager.start()
+    is_complete.wait()
+    frame_store = FrameStore.open(video_path, height)
+    return frame_store if frame_store is not None and frame_store.is_complete else None
+
+
+def run_case(video_path: str, frame_cache: Optional[FrameCache], frames: int, steps: int,
+             frame_store: Optional[FrameStore] = None) -> str:
+    # ? Plays frames forward like a viewer would, then steps back through them one at a time
+    video_manager = VideoManager(video_path, frame_cache=frame_cache, frame_store=frame_store)
+    if not video_manager.load_video():
+        raise RuntimeError(f"cannot open {video_path}")
+    for _ in range(frames):
+        video_manager.read_frame()
+    capture_position = video_manager._video_capture.get(cv2.CAP_PROP_POS_FRAMES)
+    samples: List[float] = []
+    served = 0
+    for _ in range(steps):
+        start = time.perf_counter()
+        served += video_manager.step_frame(-1)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    # ? Steps served from the cache leave the capture where playback stopped, nothing was decoded
+    is_capture_moved = video_manager._video_capture.get(cv2.CAP_PROP_POS_FRAMES) != capture_position
+    stats = video_manager.get_frame_cache_stats()
+    video_manager.release()
+    p50, p99 = np.percentile(samples, (50, 99)).tolist()
+    return (f"{p50:>9.2f} {p99:>9.2f} {served:>7} {stats.hits:>6} {stats.reduced_hits:>8} {stats.misses:>7} "
+            f"{stats.hit_rate:>6.0%} {stats.used_bytes / Consts.BYTES_PER_MEGABYTE:>8.0f} "
+            f"{'yes' if is_capture_moved else 'no':>8}")
+
+
+def run(video_path: Optional[str], width: int, height: int, frames: int, steps: int, cache_mb: int,
+        video_dir: str, is_frame_store: bool) -> None:
+    if video_path is None:
+        video_path = ensure_video(video_dir, width, height, frames, "mp4v")
+        if video_path is None:
+            print("cannot write a test video with this OpenCV build")
+            return
+    budget_bytes = cache_mb * Consts.BYTES_PER_MEGABYTE
+    cases = (("no cache", None),
+             ("cache", FrameCache(budget_bytes)),
+             ("cache, downscaled", FrameCache(budget_bytes, True)))
+    print(f"{os.path.basename(video_path)}: {frames} frames played, then {steps} steps back, {cache_mb} MB cache")
+    print(f"{'case':<18} {'p50 ms':>9} {'p99 ms':>9} {'cached':>7} {'hits':>6} {'reduced':>8} {'misses':>7} "
+          f"{'hit':>6} {'MB':>8} {'decoded':>8}")
+    for name, frame_cache in cases:
+        print(f"{name:<18} " + run_case(video_path, frame_cache, frames, steps))
+    if not is_frame_store:
+        return
+    for name, height in (("frame store", 0), ("frame store, 360p", 360)):
+        start = time.perf_counter()
+        frame_store = build_frame_store(video_path, height)
+        if frame_store is None:
+            print(f"{name:<18} cannot be stored")
+            continue
+        print(f"{name:<18} " + run_case(video_path, None, frames, steps, frame_store) +
+              f"  built in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stepping backward with and without the decoded frame cache")
+    parser.add_argument("--video", help="step through this video instead of a generated one")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--frames", type=int, default=120, help="frames played before stepping back")
+    parser.add_argument("--steps", type=int, default=30)
+    parser.add_argument("--cache-mb", type=int, default=Consts.FRAME_CACHE_MB)
+    parser.add_argument("--video-dir", default=os.path.join(tempfile.gettempdir(), "pipeline_benchmark_videos"))
+    parser.add_argument("--frame-store", action="store_true",
+                        help="also decode the video into frame stores, in the app's store directory, and step there")
+    args = parser.parse_args()
+    run(args.video, args.width, args.height, args.frames, args.steps, args.cache_mb, args.video_dir,
+        args.frame_store)
@@ -0,0 +1,79 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import LogMode, LogOverflowPolicy
+from infrastructure.logger.logger_manager import LoggerManager
+
+
+def eager_call(manager: LoggerManager, frame_index: int) -> None:
+    # ? How call sites looked before: the message is built whether or not it is written
+    manager.log(ConstStrings.LOG_NAME_DEBUG, f"Video clicked at X={frame_index}, Y={frame_index}")
+
+
+def lazy_call(manager: LoggerManager, frame_index: int) -> None:
+    manager.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_CLICKED, logging.DEBUG, frame_index, frame_index)
+
+
+def measure(manager: LoggerManager, call: Callable[[LoggerManager, int], None], frames: int,
+            fps: float) -> np.ndarray:
+    # ? One message per frame on the calling thread, paced like playback so a writer thread gets
+    # ? the idle time between frames it would get in the app
+    samples = np.empty(frames)
+    frame_interval = 1.0 / fps if fps > 0 else 0.0
+    next_frame = time.perf_counter()
+    for frame_index in range(frames):
+        start = time.perf_counter_ns()
+        call(manager, frame_index)
+        samples[frame_index] = (time.perf_counter_ns() - start) / 1000.0
+        next_frame += frame_interval
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    manager.flush()
+    return samples
+
+
+def run(frames: int, fps: float, queue_size: int, overflow_policy: LogOverflowPolicy, is_console: bool) -> None:
+    os.environ[ConstStrings.LOG_ENV] = os.path.join(tempfile.mkdtemp(), "logging_benchmark.log")
+    stderr = sys.stderr
+    if not is_console:
+        # ? The console handler binds stderr when it is created, here it writes to nowhere
+        sys.stderr = open(os.devnull, "w")
+    cases = [("sync, eager message", LogMode.SYNC, logging.DEBUG, eager_call),
+             ("async, lazy message", LogMode.ASYNC, logging.DEBUG, lazy_call),
+             ("sync, filtered, eager", LogMode.SYNC, logging.INFO, eager_call),
+             ("async, filtered, lazy", LogMode.ASYNC, logging.INFO, lazy_call)]
+    rows: List[str] = []
+    try:
+        for name, mode, level, call in cases:
+            manager = LoggerManager(level, mode, queue_size, overflow_policy)
+            samples = measure(manager, call, frames, fps)
+            manager.configure(level, LogMode.SYNC)
+            budget = f"{np.mean(samples) / (1e6 / fps) * 100.0:.3f}%" if fps > 0 else "-"
+            rows.append(f"{name:<24} {np.percentile(samples, 50):>8.1f} {np.percentile(samples, 99):>8.1f} "
+                        f"{samples.max():>9.1f} {budget:>10}")
+    finally:
+        sys.stderr = stderr
+    print(f"{'case':<24} {'p50 us':>8} {'p99 us':>8} {'max us':>9} {'of frame':>10}")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI-thread cost of one log call per frame, sync vs async")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--fps", type=float, default=60.0, help="pace of the calls, 0 for back to back")
+    parser.add_argument("--queue-size", type=int, default=1024)
+    parser.add_argument("--overflow-policy", default=LogOverflowPolicy.DROP_OLDEST.value,
+                        choices=[policy.value for policy in LogOverflowPolicy])
+    parser.add_argument("--console", action="store_true", help="keep the console handler on the terminal")
+    args = parser.parse_args()
+    run(args.frames, args.fps, args.queue_size, LogOverflowPolicy(args.overflow_policy), args.console)
@@ -0,0 +1,56 @@
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from model.pipeline.display_renderer import DisplayRenderer
+from model.pipeline.overlay_renderer import OverlayRenderer
+
+
+def median_ms(action: Callable[[], None], repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return float(np.median(samples))
+
+
+def run(width: int, height: int, marker_counts: List[int], repeats: int) -> None:
+    rng = np.random.default_rng(0)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    print(f"{'markers':>8} {'per-point ms':>13} {'batched ms':>11} {'cached ms':>10} {'speedup':>8}")
+    for count in marker_counts:
+        xs = rng.integers(0, width, count).astype(np.int32)
+        ys = rng.integers(0, height, count).astype(np.int32)
+        points = list(zip(xs.tolist(), ys.tolist()))
+        renderer = OverlayRenderer()
+
+        def per_point() -> None:
+            for x, y in points:
+                DisplayRenderer.draw_marker(frame, x, y)
+
+        def batched() -> None:
+            renderer.compose((height, width), (xs, ys))
+            renderer.apply(frame)
+
+        def cached() -> None:
+            renderer.compose((height, width), (xs, ys), cache_key=count)
+            renderer.apply(frame)
+
+        per_point_ms = median_ms(per_point, repeats)
+        batched_ms = median_ms(batched, repeats)
+        cached_ms = median_ms(cached, repeats)
+        print(f"{count:>8} {per_point_ms:>13.3f} {batched_ms:>11.3f} {cached_ms:>10.3f} "
+              f"{per_point_ms / max(cached_ms, 1e-6):>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-point vs batched overlay drawing")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--markers", type=int, nargs="+", default=[10, 1000, 50000])
+    parser.add_argument("--repeats", type=int, default=15)
+    args = parser.parse_args()
+    run(args.width, args.height, args.markers, args.repeats)
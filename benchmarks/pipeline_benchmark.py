@@ -0,0 +1,308 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ? Set before anything imports Qt, so the window benchmark runs without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic_video import available_codecs, ensure_video
+from model.annotations.annotation_store import AnnotationStore
+from model.managers.video_manager import VideoManager
+
+try:
+    import resource
+except ImportError:
+    # ? Not available on Windows, peak RSS is then left out
+    resource = None
+
+STAGES = ["read_frame", "display_frame", "update_frame"]
+# ? Differences below these are timer and allocator noise, not regressions
+LATENCY_NOISE_MS = 0.5
+ALLOCATION_NOISE_BYTES = 4096
+RSS_NOISE_MB = 16.0
+WARMUP_FRAMES = 5
+UPDATE_FRAME_TIMEOUT_SECONDS = 60.0
+MAX_STEPS_PER_FRAME = 100
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ? Kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def summarize(samples_ms: List[float], wall_seconds: float) -> Dict[str, float]:
+    samples = np.array(samples_ms) if samples_ms else np.zeros(1)
+    return {
+        "frames": len(samples_ms),
+        "fps": len(samples_ms) / wall_seconds if wall_seconds > 0 else 0.0,
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p99_ms": float(np.percentile(samples, 99)),
+    }
+
+
+def allocations_per_frame(step: Callable[[], bool], frames: int) -> float:
+    # ? Mean high-water mark of traced memory above the starting level, i.e. what one frame allocates
+    # ? on top of what it keeps. Run apart from the timed loop, tracing slows every allocation down.
+    tracemalloc.start()
+    allocated = []
+    try:
+        # ? Bounded, a stage that stops producing frames must not hang the run
+        for _ in range(frames * MAX_STEPS_PER_FRAME):
+            if len(allocated) >= frames:
+                break
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            if step():
+                allocated.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return float(np.mean(allocated)) if allocated else 0.0
+
+
+def make_points(video_path: str, frame_count: int, points_per_frame: int) -> str:
+    width, height = (int(value) for value in video_size(video_path))
+    rng = np.random.default_rng(0)
+    count = frame_count * points_per_frame
+    store = AnnotationStore()
+    store.add_many(np.repeat(np.arange(frame_count), points_per_frame),
+                   rng.integers(0, width, count), rng.integers(0, height, count))
+    points_path = os.path.splitext(video_path)[0] + f"_{points_per_frame}_points.npz"
+    store.export_file(points_path)
+    return points_path
+
+
+def video_size(video_path: str) -> Tuple[float, float]:
+    capture = cv2.VideoCapture(video_path)
+    size = capture.get(cv2.CAP_PROP_FRAME_WIDTH), capture.get(cv2.CAP_PROP_FRAME_HEIGHT)
+    capture.release()
+    return size
+
+
+def open_video_manager(video_path: str, display_size: Tuple[int, int]) -> VideoManager:
+    video_manager = VideoManager(video_path)
+    if not video_manager.load_video():
+        raise RuntimeError(f"cannot open {video_path}")
+    video_manager.set_display_size(*display_size)
+    return video_manager
+
+
+def bench_read_frame(video_path: str, frames: int, display_size: Tuple[int, int],
+                     points_path: str, speed: float) -> Dict[str, float]:
+    video_manager = open_video_manager(video_path, display_size)
+    for _ in range(WARMUP_FRAMES):
+        video_manager.read_frame()
+    samples = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        video_manager.read_frame()
+        samples.append((time.perf_counter() - frame_start) * 1000.0)
+    result = summarize(samples, time.perf_counter() - start)
+    result["alloc_bytes_per_frame"] = allocations_per_frame(video_manager.read_frame, frames)
+    video_manager.release()
+    return result
+
+
+def bench_display_frame(video_path: str, frames: int, display_size: Tuple[int, int],
+                        points_path: str, speed: float) -> Dict[str, float]:
+    video_manager = open_video_manager(video_path, display_size)
+    store = AnnotationStore()
+    store.import_file(points_path)
+
+    def step() -> bool:
+        # ? Only the conversion and overlay are timed, reading the next frame is not
+        annotations = store.get_frame(video_manager.get_frame_position())
+        return video_manager.get_display_frame(None, annotations) is not None
+
+    samples = []
+    wall_seconds = 0.0
+    for frame_index in range(frames + WARMUP_FRAMES):
+        video_manager.read_frame()
+        frame_start = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - frame_start
+        if frame_index >= WARMUP_FRAMES:
+            samples.append(elapsed * 1000.0)
+            wall_seconds += elapsed
+    result = summarize(samples, wall_seconds)
+
+    def read_and_step() -> bool:
+        video_manager.read_frame()
+        return step()
+
+    result["alloc_bytes_per_frame"] = allocations_per_frame(read_and_step, frames)
+    video_manager.release()
+    return result
+
+
+def bench_update_frame(video_path: str, frames: int, display_size: Tuple[int, int],
+                       points_path: str, speed: float) -> Dict[str, float]:
+    # ? The whole GUI path: clock-driven read, render with overlay and the window painting it.
+    # ? Paced by the presentation clock, so fps tops out at the video rate times the speed.
+    from PyQt5.QtWidgets import QApplication
+    from infrastructure.factories.view_factory import ViewFactory
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = ViewFactory.create_main_window()
+    window.show()
+    view_model = window._view_model
+    view_model.load_video(video_path)
+    # ? The window's own timer would consume frames behind the benchmark's back
+    window._timer.stop()
+    app.processEvents()
+    view_model.set_display_size(*display_size)
+    view_model.set_playback_speed(speed)
+    view_model.import_annotations(points_path)
+    rendered = []
+    view_model.frame_ready_signal.connect(lambda _: rendered.append(None))
+
+    def tick() -> Tuple[bool, int]:
+        before = len(rendered)
+        delay_ms = view_model.update_frame()
+        app.processEvents()
+        return len(rendered) > before, delay_ms
+
+    samples = []
+    start = time.perf_counter()
+    warmup = WARMUP_FRAMES
+    while len(samples) < frames and time.perf_counter() - start < UPDATE_FRAME_TIMEOUT_SECONDS:
+        tick_start = time.perf_counter()
+        is_rendered, delay_ms = tick()
+        if is_rendered:
+            if warmup:
+                warmup -= 1
+                start = time.perf_counter()
+            else:
+                samples.append((time.perf_counter() - tick_start) * 1000.0)
+        # ? Same pacing as the window's single-shot timer
+        time.sleep(delay_ms / 1000.0)
+    result = summarize(samples, time.perf_counter() - start)
+    result["dropped_frames"] = view_model.get_playback_stats().dropped_frames
+
+    def step() -> bool:
+        is_rendered, delay_ms = tick()
+        time.sleep(delay_ms / 1000.0)
+        return is_rendered
+
+    result["alloc_bytes_per_frame"] = allocations_per_frame(step, frames)
+    window.close()
+    app.processEvents()
+    return result
+
+
+BENCHMARKS = {
+    "read_frame": bench_read_frame,
+    "display_frame": bench_display_frame,
+    "update_frame": bench_update_frame,
+}
+
+
+def run(resolutions: List[Tuple[int, int]], codecs: List[str], stages: List[str], frames: int,
+        display_size: Tuple[int, int], points_per_frame: int, speed: float, video_dir: str) -> Dict:
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+        },
+        "settings": {"frames": frames, "display_size": list(display_size), "points_per_frame": points_per_frame,
+                     "speed": speed},
+        "cases": {},
+    }
+    codecs = available_codecs(codecs)
+    print(f"{'case':<34} {'fps':>8} {'p50 ms':>8} {'p99 ms':>8} {'alloc KB':>9} {'rss MB':>7}")
+    # ? Smallest first, so the process-wide peak RSS after each case is the peak up to that size
+    for width, height in sorted(resolutions, key=lambda size: size[0] * size[1]):
+        for codec in codecs:
+            # ? Long enough that the timed frames never wrap around to the start
+            video_path = ensure_video(video_dir, width, height, 2 * frames + 4 * WARMUP_FRAMES, codec)
+            if video_path is None:
+                continue
+            points_path = make_points(video_path, 2 * frames + 4 * WARMUP_FRAMES, points_per_frame)
+            for stage in stages:
+                name = f"{stage}/{width}x{height}/{codec}"
+                case = BENCHMARKS[stage](video_path, frames, display_size, points_path, speed)
+                case["peak_rss_mb"] = peak_rss_mb()
+                results["cases"][name] = case
+                rss = f"{case['peak_rss_mb']:.0f}" if case["peak_rss_mb"] is not None else "-"
+                print(f"{name:<34} {case['fps']:>8.1f} {case['p50_ms']:>8.2f} {case['p99_ms']:>8.2f} "
+                      f"{case['alloc_bytes_per_frame'] / 1024:>9.1f} {rss:>7}")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    regressions = []
+    for name, case in results["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        if case["fps"] < reference["fps"] * (1.0 - tolerance):
+            regressions.append(f"{name}: fps {reference['fps']:.1f} -> {case['fps']:.1f}")
+        for key in ("p50_ms", "p99_ms"):
+            if case[key] > reference[key] * (1.0 + tolerance) + LATENCY_NOISE_MS:
+                regressions.append(f"{name}: {key} {reference[key]:.2f} -> {case[key]:.2f}")
+        if (case["alloc_bytes_per_frame"] >
+                reference["alloc_bytes_per_frame"] * (1.0 + tolerance) + ALLOCATION_NOISE_BYTES):
+            regressions.append(f"{name}: alloc_bytes_per_frame {reference['alloc_bytes_per_frame']:.0f} -> "
+                               f"{case['alloc_bytes_per_frame']:.0f}")
+        if (case.get("peak_rss_mb") is not None and reference.get("peak_rss_mb") is not None and
+                case["peak_rss_mb"] > reference["peak_rss_mb"] * (1.0 + tolerance) + RSS_NOISE_MB):
+            regressions.append(f"{name}: peak_rss_mb {reference['peak_rss_mb']:.0f} -> {case['peak_rss_mb']:.0f}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frame pipeline benchmark on generated videos")
+    parser.add_argument("--resolutions", type=parse_size, nargs="+",
+                        default=[(640, 360), (1280, 720), (1920, 1080)], metavar="WIDTHxHEIGHT")
+    parser.add_argument("--codecs", nargs="+", default=["mp4v", "MJPG"],
+                        help="fourcc codes, the ones this OpenCV build cannot write are skipped")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--frames", type=int, default=120, help="timed frames per case")
+    parser.add_argument("--display-size", type=parse_size, default=(960, 540), metavar="WIDTHxHEIGHT")
+    parser.add_argument("--points", type=int, default=50, help="annotation points drawn on every frame")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="playback speed of the update_frame stage, raise it to find where it stops keeping up")
+    parser.add_argument("--video-dir", default=os.path.join(tempfile.gettempdir(), "pipeline_benchmark_videos"),
+                        help="where generated videos are kept between runs")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="results JSON of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed relative slowdown before a case counts as a regression")
+    args = parser.parse_args()
+
+    benchmark_results = run(args.resolutions, args.codecs, args.stages, args.frames, args.display_size,
+                            args.points, args.speed, args.video_dir)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline_results = json.load(baseline_file)
+        if baseline_results.get("environment") != benchmark_results["environment"]:
+            print("warning: baseline was recorded in a different environment")
+        found = compare(benchmark_results, baseline_results, args.tolerance)
+        for regression in found:
+            print(f"REGRESSION {regression}")
+        if found:
+            sys.exit(1)
+        print("no regressions against the baseline")
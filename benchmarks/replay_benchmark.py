@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import tempfile
+from typing import Optional, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from benchmarks.synthetic_video import ensure_video
+from globals.enums.enums import SessionEventType
+from model.session.session_recorder import SessionRecorder
+
+
+def make_session(video_path: str, frames: int, display_size: Tuple[int, int], click_every: int,
+                 is_tracking: bool) -> str:
+    # ? What a recording of someone watching the whole video and clicking now and then contains
+    rng = np.random.default_rng(0)
+    width, height = display_size
+    path = os.path.join(tempfile.mkdtemp(), "replay_benchmark.vses")
+    recorder = SessionRecorder(path)
+    recorder.record(SessionEventType.RESIZE, -1, width, height)
+    recorder.record(SessionEventType.TRACKING, -1, is_tracking)
+    recorder.record(SessionEventType.LOAD_VIDEO, -1, video_path)
+    for frame_index in range(frames):
+        recorder.record(SessionEventType.FRAME, frame_index)
+        if click_every > 0 and frame_index % click_every == 0:
+            recorder.record(SessionEventType.CLICK, frame_index, int(rng.integers(0, width)),
+                            int(rng.integers(0, height)))
+    recorder.close()
+    return path
+
+
+def run(session_path: Optional[str], width: int, height: int, frames: int, click_every: int, is_tracking: bool,
+        repeats: int, video_dir: str) -> None:
+    from PyQt5.QtWidgets import QApplication
+    from view_model.main_window_view_model import MainWindowViewModel
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    if session_path is None:
+        video_path = ensure_video(video_dir, width, height, frames, "mp4v")
+        if video_path is None:
+            print("cannot write a test video with this OpenCV build")
+            return
+        session_path = make_session(video_path, frames, (width, height), click_every, is_tracking)
+    print(f"{'run':>4} {'events':>8} {'frames':>8} {'seconds':>9} {'fps':>9} {'events/s':>10}")
+    for repeat in range(repeats):
+        view_model = MainWindowViewModel()
+        replay_stats = view_model.replay_session_fast(session_path)
+        view_model.release()
+        app.processEvents()
+        if replay_stats is None:
+            print(f"cannot replay '{session_path}'")
+            return
+        print(f"{repeat + 1:>4} {replay_stats.events:>8} {replay_stats.frames:>8} "
+              f"{replay_stats.elapsed_seconds:>9.2f} {replay_stats.fps:>9.1f} {replay_stats.events_per_second:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replays a session log through the view model without rendering")
+    parser.add_argument("--session", help="replay this recording instead of a generated one")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--click-every", type=int, default=30, help="frames between recorded clicks, 0 for none")
+    parser.add_argument("--tracking", action="store_true", help="record the session with tracking on")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--video-dir", default=os.path.join(tempfile.gettempdir(), "pipeline_benchmark_videos"))
+    args = parser.parse_args()
+    run(args.session, args.width, args.height, args.frames, args.click_every, args.tracking, args.repeat,
+        args.video_dir)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# ? Containers OpenCV's own writer pairs with each codec
+CODEC_CONTAINERS: Dict[str, str] = {"mp4v": ".mp4", "MJPG": ".avi", "XVID": ".avi"}
+
+
+def make_video(path: str, width: int, height: int, frame_count: int, codec: str, fps: float = 30.0) -> bool:
+    # ? A blurred noise texture panning diagonally with a frame counter on top: every frame differs
+    # ? and has detail, so the codec does real work, unlike a flat color
+    rng = np.random.default_rng(0)
+    step_x, step_y = 3, 2
+    texture = (rng.random((height + frame_count * step_y, width + frame_count * step_x, 3)) * 255).astype(np.uint8)
+    texture = cv2.GaussianBlur(texture, (7, 7), 2)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, (width, height))
+    if not writer.isOpened():
+        return False
+    for frame_index in range(frame_count):
+        x, y = frame_index * step_x, frame_index * step_y
+        frame = np.ascontiguousarray(texture[y:y + height, x:x + width])
+        cv2.putText(frame, str(frame_index), (width // 20, height // 5), cv2.FONT_HERSHEY_SIMPLEX,
+                    height / 180, (255, 255, 255), max(height // 120, 1))
+        writer.write(frame)
+    writer.release()
+    return os.path.getsize(path) > 0
+
+
+def ensure_video(directory: str, width: int, height: int, frame_count: int, codec: str) -> Optional[str]:
+    # ? Generated once per parameter set and reused by later runs
+    container = CODEC_CONTAINERS.get(codec, ".avi")
+    path = os.path.join(directory, f"synthetic_{width}x{height}_{frame_count}_{codec}{container}")
+    if os.path.isfile(path) and os.path.getsize(path) > 0:
+        return path
+    os.makedirs(directory, exist_ok=True)
+    if make_video(path, width, height, frame_count, codec):
+        return path
+    if os.path.exists(path):
+        os.remove(path)
+    return None
+
+
+def available_codecs(codecs: List[str]) -> List[str]:
+    # ? Builds differ in which encoders they ship, the ones that cannot open are skipped
+    available = []
+    for codec in codecs:
+        container = CODEC_CONTAINERS.get(codec, ".avi")
+        probe_path = os.path.join(tempfile.gettempdir(), f"codec_probe_{os.getpid()}{container}")
+        writer = cv2.VideoWriter(probe_path, cv2.VideoWriter_fourcc(*codec), 30.0, (64, 64))
+        if writer.isOpened():
+            available.append(codec)
+        writer.release()
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+    return available
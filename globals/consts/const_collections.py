@@ -1,6 +1,22 @@
 from globals.consts.const_strings import ConstStrings
+from globals.enums.enums import SessionEventType
 
 
 class ConstCollections:
     LOG_NAMES_WITH_FILE = [ConstStrings.LOG_NAME_DEBUG]
     LOG_NAMES_WITH_CONSOLE = [ConstStrings.LOG_NAME_DEBUG]
+    PLAYBACK_SPEEDS = [0.25, 0.5, 1.0, 2.0, 4.0, 8.0]
+    # ? Column name -> dtype, also the CSV header and the .npz keys
+    ANNOTATION_COLUMNS = {"id": "int64", "frame": "int32", "x": "int32", "y": "int32",
+                          "label": "int32", "timestamp_ms": "float64"}
+    # ? Payload after the common event fields, for the events below its last field is the length of the
+    # ? bytes that follow: the path for LOAD_VIDEO and IMPORT, the store snapshot for ANNOTATIONS
+    SESSION_PAYLOAD_FORMATS = {SessionEventType.LOAD_VIDEO: "H", SessionEventType.FRAME: "",
+                               SessionEventType.CLICK: "ii", SessionEventType.REMOVE: "ii",
+                               SessionEventType.PLAYBACK: "?", SessionEventType.SEEK: "i",
+                               SessionEventType.SPEED: "f", SessionEventType.CLEAR: "",
+                               SessionEventType.UNDO: "", SessionEventType.OVERLAY: "?",
+                               SessionEventType.TRACKING: "?", SessionEventType.RESIZE: "ii",
+                               SessionEventType.ANNOTATIONS: "I", SessionEventType.IMPORT: "?H"}
+    SESSION_SIZED_EVENTS = {SessionEventType.LOAD_VIDEO, SessionEventType.ANNOTATIONS, SessionEventType.IMPORT}
+    SESSION_TEXT_EVENTS = {SessionEventType.LOAD_VIDEO, SessionEventType.IMPORT}
@@ -3,9 +3,135 @@ class ConstStrings:
 
     GLOBAL_CONFIG_PATH = "config/configuration.xml"
 
+    # ? Config keys
+    CONFIG_VIDEO = "video"
+    CONFIG_BUFFER_CAPACITY = "buffer_capacity"
+    CONFIG_DROP_POLICY = "drop_policy"
+    CONFIG_DECODE_WORKERS = "decode_workers"
+    CONFIG_BACKEND = "backend"
+    CONFIG_FRAME_CACHE_MB = "frame_cache_mb"
+    CONFIG_FRAME_CACHE_DOWNSCALE = "frame_cache_downscale"
+    CONFIG_FRAME_STORE = "frame_store"
+    CONFIG_FRAME_STORE_HEIGHT = "frame_store_height"
+    CONFIG_FRAME_STORE_MAX_MB = "frame_store_max_mb"
+    CONFIG_METRICS = "metrics"
+    CONFIG_METRICS_ENABLED = "enabled"
+    CONFIG_METRICS_HUD = "hud"
+    CONFIG_METRICS_EXPORT_INTERVAL = "export_interval_seconds"
+    CONFIG_METRICS_EXPORT_PATH = "export_path"
+    CONFIG_LOG = "log"
+    CONFIG_LOG_MODE = "mode"
+    CONFIG_LOG_LEVEL = "level"
+    CONFIG_LOG_QUEUE_SIZE = "queue_size"
+    CONFIG_LOG_OVERFLOW_POLICY = "overflow_policy"
+    CONFIG_TASKS = "tasks"
+    CONFIG_TASK_WORKERS = "workers"
+    CONFIG_TASK_PROCESS_WORKERS = "process_workers"
+    CONFIG_TRUE = "true"
+    CONFIG_FALSE = "false"
+    CONFIG_INDENT = "    "
+    CONFIG_ENCODING = "UTF-8"
+    CONFIG_JSON_SUFFIX = ".json"
+    CONFIG_TOML_SUFFIX = ".toml"
+    CONFIG_CACHE_SUFFIX = ".cfgcache"
+    CONFIG_TOML_BARE_KEY_PATTERN = r"[A-Za-z0-9_-]+"
+
+    # ? Video
+    DEFAULT_VIDEO_PATH_PARTS = ("videos", "video1.mp4")
+    KEYFRAME_INDEX_DIRECTORY = "keyframe_indexes"
+    KEYFRAME_INDEX_FILE_SUFFIX = ".kfindex.npz"
+    KEYFRAME_INDEX_KEY_ENCODING = "utf-8"
+    TEMP_FILE_SUFFIX = ".tmp"
+    PROCESS_START_METHOD = "spawn"
+    VIDEO_LOADING_TEXT = "Loading video..."
+    VIDEO_NOT_FOUND_TEXT = "Video not found"
+    VIDEO_OPEN_FAILED_TEXT = "Cannot open video"
+
+    # ? Thumbnails
+    THUMBNAIL_DIRECTORY = "thumbnails"
+    THUMBNAIL_FILE_SUFFIX = ".thumbs"
+    THUMBNAIL_MAGIC = b"VTHM"
+    # ? Magic, version, thumbnail count, height and width
+    THUMBNAIL_HEADER_FORMAT = "<4sHIII"
+    THUMBNAIL_KEY_ENCODING = "utf-8"
+
+    # ? Pre-decoded frame store
+    FRAME_STORE_DIRECTORY = "frame_stores"
+    FRAME_STORE_FILE_SUFFIX = ".frames"
+    FRAME_STORE_MAGIC = b"VFRM"
+    # ? Magic, version, frame slots, stored width and height, source width and height, fps
+    FRAME_STORE_HEADER_FORMAT = "<4sHIIIIId"
+    FRAME_STORE_KEY_ENCODING = "utf-8"
+
+    # ? Annotations
+    ANNOTATION_CSV_SUFFIX = ".csv"
+    ANNOTATION_NPZ_SUFFIX = ".npz"
+    ANNOTATION_CSV_DELIMITER = ","
+    ANNOTATION_FILE_FILTER = "Annotations (*.csv *.npz)"
+    # ? Arrays of a store snapshot besides the point columns, undo steps are flattened into them
+    ANNOTATION_SNAPSHOT_NEXT_ID = "next_id"
+    ANNOTATION_SNAPSHOT_ACTIONS = "undo_actions"
+    ANNOTATION_SNAPSHOT_REMOVED_COUNTS = "undo_removed_counts"
+    ANNOTATION_SNAPSHOT_ADDED_COUNTS = "undo_added_counts"
+    ANNOTATION_SNAPSHOT_ADDED_IDS = "undo_added_ids"
+    ANNOTATION_SNAPSHOT_REMOVED_PREFIX = "undo_removed_"
+    BATCH_VIDEO_SUFFIX = "_overlay.mp4"
+    BATCH_VIDEO_FOURCC = "mp4v"
+    BATCH_COORDINATES_SUFFIX = "_coordinates.csv"
+    BATCH_COORDINATES_HEADER = "frame,id,x,y"
+
+    # ? Session recording
+    SESSION_MAGIC = b"VSES"
+    SESSION_DIRECTORY = "sessions"
+    SESSION_FILE_NAME = "session_{}.vses"
+    SESSION_FILE_FILTER = "Sessions (*.vses)"
+    SESSION_HEADER_FORMAT = "<4sH"
+    # ? Every event starts with its type, milliseconds since recording started and the frame on screen
+    SESSION_EVENT_FORMAT = "<BIi"
+    SESSION_TEXT_ENCODING = "utf-8"
+
+    # ? Status messages
+    METRICS_DISABLED_TEXT = "Metrics are disabled in the configuration"
+    TRACKING_ON_TEXT = "Tracking: click points to follow them"
+    TRACKING_OFF_TEXT = "Tracking off"
+    TRACKING_LIMIT_TEXT = "At most {} points can be tracked"
+    TRACKED_POINT_NOT_FOUND_TEXT = "No tracked point here to remove"
+    TRACKED_POINT_REMOVED_TEXT = "Tracked point removed"
+    RECORDING_STARTED_TEXT = "Recording session to {}"
+    RECORDING_SAVED_TEXT = "Session saved to {}"
+    REPLAY_STARTED_TEXT = "Replaying {} events"
+    REPLAY_FINISHED_TEXT = "Replayed {} frames in {:.2f}s ({:.1f} fps)"
+    REPLAY_UNREADABLE_TEXT = "Cannot replay this session"
+    FRAME_STORE_COMPLETE_TEXT = "Frames stored, the video opens from them next time"
+    VIDEO_SETTINGS_CHANGED_TEXT = "Video settings changed, they apply to the next video loaded"
+    POINT_NOT_FOUND_TEXT = "No point here to remove"
+    POINT_REMOVED_TEXT = "Point removed ({} points)"
+    UNDO_EMPTY_TEXT = "Nothing to undo"
+    UNDONE_TEXT = "Undone ({} points)"
+    EXPORT_UNSUPPORTED_TEXT = "Export needs a .csv or .npz file"
+    EXPORT_FAILED_TEXT = "Export failed"
+    EXPORTED_TEXT = "Exported {} points"
+    IMPORT_UNSUPPORTED_TEXT = "Import needs a .csv or .npz file"
+    IMPORT_FAILED_TEXT = "Import failed"
+    IMPORTED_TEXT = "Imported {} points"
+    NO_POINT_TO_CLEAR_TEXT = "No point to clear"
+    POINT_CLEARED_TEXT = "Point cleared"
+
+    # ? Metrics overlay
+    METRICS_PLAYBACK_LINE = "fps {:5.1f}  dropped {}  queue {}"
+    METRICS_MISSING_VALUE = "-"
+    METRICS_STAGE_HEADER = "stage             p50    p99 ms"
+    METRICS_STAGE_LINE = "{:<14}{:7.2f}{:7.2f}"
+    METRICS_TOPIC_HEADER = "topic            pub/s   del/s drop"
+    METRICS_TOPIC_LINE = "{:<14}{:8.0f}{:8.0f} {}"
+    METRICS_TASK_LINE = "tasks queued {}  wait p99 {:.2f}  run p99 {:.2f} ms"
+    METRICS_CACHE_LINE = "cache {} frames  {:.0f}/{:.0f} MB  hit {:.0%}"
+
     # ? Log
     LOG_NAME_DEBUG = "debug"
     LOG_ENV = "LOG_FILE_PATH"
+    LOG_LEVEL_ENV = "LOG_LEVEL"
+    DEFAULT_LOG_LEVEL = "DEBUG"
     LOG_FILEPATH = "./logs/{}_{}.log"
     LOG_MODE = "a"
     LOG_FORMATTER = "%(asctime)s - %(levelname)s - %(message)s"
@@ -19,6 +19,17 @@ class ConstStyles:
                 border-radius: 8px;
                 background-color: #000000;
             }
+            QLabel#TileVideoLabel {
+                border: 2px solid #d1d5db;
+                background-color: #000000;
+            }
+            QLabel#TileVideoLabel[focused="true"] {
+                border: 2px solid #2563eb;
+            }
+            QLabel#TileCoordinatesLabel {
+                font-size: 12px;
+                color: #2563eb;
+            }
             QLabel#CountLabel[valueStatus="positive"] {
                 color: #10b981; /* Green */
             }
@@ -67,3 +78,14 @@ class ConstStyles:
             
             QPushButton#DecButton:hover { background-color: #dc2626; }
         """
+    # ? Set on the overlay itself, the video label's own sheet would otherwise win over the window's
+    METRICS_LABEL_STYLE = """
+            QLabel {
+                background-color: rgba(0, 0, 0, 160);
+                color: #f9fafb;
+                font-family: monospace;
+                font-size: 12px;
+                padding: 6px;
+                border-radius: 4px;
+            }
+        """
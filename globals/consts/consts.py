@@ -1,2 +1,139 @@
 class Consts:
-    WORKING_LOOP_DELAY = 1
+    STARTUP_MEASURE_TIMEOUT_MS = 15000
+
+    # ? Configuration
+    CONFIG_SAVE_DEBOUNCE_SECONDS = 0.5
+    CONFIG_WATCH_INTERVAL_SECONDS = 1.0
+    CONFIG_WATCH_JOIN_TIMEOUT = 2.0
+    CONFIG_CACHE_VERSION = 1
+
+    # ? Event bus
+    EVENT_QUEUE_CAPACITY = 256
+    EVENT_WORKER_JOIN_TIMEOUT = 1.0
+
+    # ? Task executor
+    TASK_WORKERS = 2
+    TASK_EXECUTOR_JOIN_TIMEOUT = 2.0
+
+    # ? Video
+    DEFAULT_FPS = 30.0
+    FRAME_CHANNELS = 3
+    FRAME_BUFFER_CAPACITY = 4
+    MIN_FRAME_BUFFER_CAPACITY = 2
+    DECODE_THREAD_JOIN_TIMEOUT = 2.0
+    RAW_STREAM_FORMAT = -1
+    KEYFRAME_INDEX_VERSION = 2
+    DISPLAY_BUFFER_COUNT = 2
+    BYTES_PER_MEGABYTE = 1 << 20
+
+    # ? Decoded frame cache
+    FRAME_CACHE_MB = 256
+    # ? Older entries are kept at 1/scale of the width and height, in at most this share of the budget
+    FRAME_CACHE_REDUCED_SCALE = 2
+    FRAME_CACHE_REDUCED_SHARE = 0.5
+    FRAME_CACHE_FREE_BUFFERS = 2
+
+    # ? Pre-decoded frame store
+    FRAME_STORE_VERSION = 1
+    # ? Frames start a page in, the progress fields follow the fixed header
+    FRAME_STORE_HEADER_SIZE = 4096
+    FRAME_STORE_PROGRESS_OFFSET = 64
+    FRAME_STORE_MAX_MB = 4096
+    FRAME_STORE_CHUNK_FRAMES = 16
+    # ? Between chunks while the video plays, playback decoding keeps the CPU
+    FRAME_STORE_PLAYING_DELAY_SECONDS = 0.1
+    FRAME_STORE_DECODE_THREADS = 1
+
+    # ? Thumbnails
+    THUMBNAIL_COUNT = 120
+    THUMBNAIL_HEIGHT = 48
+    THUMBNAIL_CACHE_VERSION = 1
+    THUMBNAIL_HEADER_SIZE = 64
+    # ? Between thumbnails while the video plays, playback decoding keeps the CPU
+    THUMBNAIL_PLAYING_DELAY_SECONDS = 0.5
+    THUMBNAIL_FLUSH_INTERVAL = 16
+    THUMBNAIL_DECODE_THREADS = 1
+    THUMBNAIL_MARKER_WIDTH = 2
+
+    # ? Decode worker process
+    MIN_SHARED_FRAME_SLOTS = 4
+    NO_SLOT = -1
+    DECODE_WORKER_JOIN_TIMEOUT = 2.0
+    MAX_DECODE_WORKER_RESTARTS = 3
+    DECODE_WORKER_POLLS_PER_FRAME = 2
+
+    # ? Overlay
+    MARKER_FILL_RADIUS = 8
+    MARKER_RING_RADIUS = 10
+    MARKER_RING_THICKNESS = 2
+    MARKER_FILL_COLOR_RGB = (0, 0, 255)
+    MARKER_RING_COLOR_RGB = (255, 255, 255)
+    ANNOTATION_FILL_COLOR_RGB = (0, 200, 0)
+    TRACK_COLOR_RGB = (255, 200, 0)
+    BOX_COLOR_RGB = (255, 255, 0)
+    OVERLAY_LINE_THICKNESS = 2
+    OVERLAY_CIRCLE_LIMIT = 64
+    OVERLAY_SPARSE_FRACTION = 0.1
+
+    # ? Annotations
+    ANNOTATION_TAIL_CAPACITY = 4096
+    ANNOTATION_UNDO_LIMIT = 256
+    ANNOTATION_HIT_RADIUS = 12
+    DEFAULT_ANNOTATION_LABEL = 0
+
+    # ? Point tracking
+    MAX_TRACKED_POINTS = 64
+    TRACKING_MAX_WIDTH = 960
+    TRACKING_WINDOW_SIZE = 21
+    TRACKING_PYRAMID_LEVELS = 3
+    TRACKING_MAX_ITERATIONS = 20
+    TRACKING_EPSILON = 0.03
+    TRACKING_MAX_ERROR = 40.0
+    TRACKING_MAX_FRAME_GAP = 8
+    TRACKING_QUEUE_SIZE = 4
+    TRACKING_TRAIL_LENGTH = 30
+    TRACKING_JOIN_TIMEOUT = 1.0
+
+    # ? Batch processing
+    BATCH_DECODE_THREADS = 1
+
+    # ? Logging
+    LOG_QUEUE_SIZE = 1024
+    LOG_BATCH_SIZE = 64
+    LOG_FLUSH_INTERVAL_SECONDS = 0.1
+    LOG_WRITER_JOIN_TIMEOUT = 2.0
+
+    # ? Session recording
+    SESSION_FORMAT_VERSION = 2
+    # ? Version 1 has no annotation events and otherwise reads the same
+    SESSION_OLDEST_FORMAT_VERSION = 1
+    SESSION_FLUSH_EVENTS = 256
+
+    # ? Pipeline metrics
+    METRICS_WINDOW_SAMPLES = 512
+    METRICS_BUCKET_COUNT = 40
+    METRICS_FPS_WINDOW = 120
+    METRICS_HUD_INTERVAL_MS = 500
+    METRICS_EXPORT_JOIN_TIMEOUT = 1.0
+    NANOSECONDS_PER_MILLISECOND = 1_000_000
+    NANOSECONDS_PER_SECOND = 1_000_000_000
+
+    # ? Playback
+    MIN_PLAYBACK_SPEED = 0.25
+    MAX_PLAYBACK_SPEED = 8.0
+    FRAME_DUE_TOLERANCE_MS = 2.0
+    MIN_TIMER_INTERVAL_MS = 1
+    MAX_CONSECUTIVE_SKIPS = 8
+    MIN_SEEK_SKIP_FRAMES = 24
+
+    # ? Decode scheduling
+    DECODE_IDLE_WAIT_SECONDS = 0.005
+    # ? Longest wait for a free slot under DropPolicy.BLOCK before the decode loop checks its state
+    DECODE_BLOCK_WAIT_SECONDS = 0.1
+    DECODE_VISIBLE_DELAY_SECONDS = 0.002
+    DECODE_HIDDEN_DELAY_SECONDS = 0.25
+    DECODE_UI_RESERVED_CORES = 1
+    GRID_DECODE_THREADS_PER_STREAM = 1
+    GRID_TICK_INTERVAL_MS = 10
+    GRID_TILE_MIN_WIDTH = 160
+    GRID_TILE_MIN_HEIGHT = 90
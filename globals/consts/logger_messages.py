@@ -1,5 +1,58 @@
 class LoggerMessages:
     DEFAULT_ERROR = 'ERROR'
-    CONFIG_KEY_NOT_FOUND = "xmlconfig: key '{}' not found."
-    CONFIG_DID_YOU_MEAN = "xmlconfig: did you mean '{}'?"
-    CONFIG_NO_MATCHES = "xmlconfig: no close matches found."
+    CONFIG_KEY_NOT_FOUND = "config: key '{}' not found."
+    CONFIG_DID_YOU_MEAN = "config: did you mean '{}'?"
+    CONFIG_NO_MATCHES = "config: no close matches found."
+    CONFIG_SAVED = "config: saved '{}'."
+    CONFIG_SAVE_FAILED = "config: could not save '{}': {}"
+    CONFIG_RELOADED = "config: reloaded '{}', {} keys changed."
+    CONFIG_CACHE_FAILED = "config: could not write the compiled cache '{}': {}"
+    CONFIG_RELOAD_FAILED = "config: keeping the last good configuration, '{}' cannot be read: {}"
+    KEYFRAME_INDEX_LOADED = "keyframes: loaded index for '{}' ({} keyframes)."
+    KEYFRAME_INDEX_BUILT = "keyframes: built index for '{}' ({} keyframes, {} frames)."
+    KEYFRAME_INDEX_UNSUPPORTED = "keyframes: raw stream access unavailable for '{}', using property seeks."
+    KEYFRAME_INDEX_SAVE_FAILED = "keyframes: could not save the index of '{}': {}"
+    THUMBNAILS_OPENED = "thumbnails: '{}' has {} of {} cached."
+    THUMBNAILS_DONE = "thumbnails: '{}' complete, {} generated in {:.2f}s."
+    THUMBNAILS_FAILED = "thumbnails: cannot cache '{}': {}"
+    FRAME_STORE_OPENED = "frame store: '{}' has {} frames at {}x{} stored, complete: {}."
+    FRAME_STORE_DONE = "frame store: '{}' complete, {} frames stored in {:.2f}s."
+    FRAME_STORE_FAILED = "frame store: cannot store '{}': {}"
+    FRAME_STORE_TOO_LARGE = "frame store: '{}' would take {:.0f} MB, {:.0f} MB allowed."
+    DECODE_STEP_FAILED = "decode: stream {} stopped after an error: {}"
+    DECODE_WORKER_STARTED = "decode worker: pid {} started for '{}' at frame {}."
+    DECODE_WORKER_CRASHED = "decode worker: pid {} exited with code {}, restarting at frame {}."
+    DECODE_WORKER_GAVE_UP = "decode worker: '{}' crashed {} times, giving up."
+    EVENT_DELIVERY_FAILED = "events: subscriber of '{}' raised: {}"
+    EVENT_DROPPED = "events: queue of a '{}' subscriber full, {} events dropped so far."
+    TASK_FAILED = "tasks: '{}' raised: {}"
+    TASK_EXECUTOR_STOPPED = "tasks: stopped, {} queued tasks cancelled."
+    METRICS_SNAPSHOT = "metrics: {}"
+    METRICS_EXPORT_FAILED = "metrics: could not write to '{}': {}"
+    LOG_RECORDS_DROPPED = "log: queue full, {} records dropped."
+    VIDEO_LOADING = "Loading video from: {}"
+    VIDEO_EXISTS = "Video exists: {}"
+    VIDEO_LOADED = "Video loaded successfully! FPS: {}"
+    VIDEO_OPEN_FAILED = "Failed to open video file"
+    VIDEO_OPEN_ERROR = "Opening '{}' raised: {!r}"
+    VIDEO_NOT_FOUND = "Video file not found at: {}"
+    PLAYBACK_SPEED_SET = "Playback speed set to {}x"
+    PLAYBACK_PLAYING = "playing"
+    PLAYBACK_PAUSED = "paused"
+    PLAYBACK_STATE = ("Video {} (renders performed={}, skipped={}, dropped={}, late={}, "
+                      "drift={:.1f}ms)")
+    NO_POINT_TO_CLEAR = "No point to clear"
+    POINT_CLEARED = "Point cleared"
+    ANNOTATION_EXPORT_FAILED = "Annotation export failed: {}"
+    ANNOTATIONS_EXPORTED = "Exported {} points to {}"
+    ANNOTATION_RESTORE_FAILED = "Restoring the session's annotations failed: {}"
+    ANNOTATION_IMPORT_FAILED = "Annotation import failed: {}"
+    ANNOTATIONS_IMPORTED = "Imported {} points from {}"
+    VIDEO_CLICKED = "Video clicked at X={}, Y={}"
+    TILE_VIDEO_NOT_FOUND = "Tile {}: video file not found at: {}"
+    TILE_VIDEO_OPEN_FAILED = "Tile {}: failed to open video file"
+    GRID_VIDEOS_LOADED = "Grid {}x{}: {} streams on {} decode workers"
+    SESSION_RECORDING_STARTED = "session: recording to '{}'."
+    SESSION_RECORDING_STOPPED = "session: recorded {} events to '{}'."
+    SESSION_READ_FAILED = "session: cannot replay '{}': {}"
+    SESSION_REPLAYED = "session: replayed {} events, {} frames in {:.2f}s ({:.1f} fps)."
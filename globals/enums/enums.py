@@ -1,6 +1,123 @@
-from enum import Enum
+from enum import Enum, Flag
 
 
 class Example(Enum):
     FIRST_EXAMPLE = 1
     SECOND_EXAMPLE = 3
+
+
+class DropPolicy(Enum):
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class SlotState(Enum):
+    FREE = 0
+    WRITING = 1
+    READY = 2
+    READING = 3
+
+
+class RenderReason(Flag):
+    NONE = 0
+    NEW_FRAME = 1
+    POINT_CHANGED = 2
+    RESIZED = 4
+    OVERLAY_TOGGLED = 8
+
+
+class DecodePriority(Enum):
+    FOCUSED = 0
+    VISIBLE = 1
+    HIDDEN = 2
+
+
+class VideoBackend(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class BatchOutput(Enum):
+    VIDEO = "video"
+    COORDINATES = "coordinates"
+
+
+class PipelineStage(Enum):
+    DECODE = "decode"
+    ACQUIRE = "acquire"
+    COPY = "copy"
+    COLOR_CONVERT = "color_convert"
+    OVERLAY = "overlay"
+    QIMAGE = "qimage"
+    PAINT = "paint"
+
+
+class MetricGauge(Enum):
+    QUEUE_DEPTH = "queue_depth"
+    DROPPED_FRAMES = "dropped_frames"
+    TASK_QUEUE_DEPTH = "task_queue_depth"
+    FRAME_CACHE_MB = "frame_cache_mb"
+    FRAME_CACHE_HIT_RATE = "frame_cache_hit_rate"
+
+
+class LogMode(Enum):
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class LogOverflowPolicy(Enum):
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class SessionEventType(Enum):
+    LOAD_VIDEO = 0
+    FRAME = 1
+    CLICK = 2
+    REMOVE = 3
+    PLAYBACK = 4
+    SEEK = 5
+    SPEED = 6
+    CLEAR = 7
+    UNDO = 8
+    OVERLAY = 9
+    TRACKING = 10
+    RESIZE = 11
+    ANNOTATIONS = 12
+    IMPORT = 13
+
+
+class DecodeCommand(Enum):
+    SEEK = 0
+    PAUSE = 1
+    SPEED = 2
+    RESIZE = 3
+    STOP = 4
+
+
+class Topic(Enum):
+    COORDINATES = "coordinates"
+    TRACKS = "tracks"
+    CONFIG_CHANGED = "config_changed"
+
+
+class DeliveryMode(Enum):
+    # ? On the publishing thread, before publish returns
+    DIRECT = "direct"
+    # ? On the GUI thread, everything queued for it delivered once per event loop pass
+    GUI = "gui"
+    # ? On a thread of the subscription's own, never passing through the GUI thread
+    WORKER = "worker"
+
+
+class TaskPriority(Enum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class AnnotationAction(Enum):
+    ADD = 0
+    REMOVE = 1
+    REPLACE = 2
@@ -1,2 +1,10 @@
+import os
+
+from globals.consts.const_strings import ConstStrings
+
+
 class Utils:
-    pass
+    @staticmethod
+    def get_default_video_path() -> str:
+        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        return os.path.join(base_path, *ConstStrings.DEFAULT_VIDEO_PATH_PARTS)
@@ -0,0 +1,134 @@
+from abc import abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.config.file_config_manager import FileConfigManager
+
+
+class DictConfigManager(FileConfigManager):
+    # ? Formats that parse into nested tables. The document holds one top-level table named like the
+    # ? XML root element, so paths, get_all and the text lookups behave the same as with XML. Values
+    # ? keep their type in the file and are read back as text.
+
+    def __init__(self, config_path: str, is_cached: bool = False) -> None:
+        self._root_name = ""
+        self._document: Dict[str, Any] = {}
+        self._path_index: Dict[Tuple[str, ...], Any] = {}
+        self._text_index: Dict[str, List[Tuple[str, ...]]] = {}
+        super().__init__(config_path, is_cached)
+
+    def get(self, *path: str) -> Any:
+        if len(path) == 1:
+            return path[0] if self._text_index.get(path[0]) else None
+        value = self._path_index.get(path) if path else self._document
+        return None if isinstance(value, dict) else self._to_text(value)
+
+    def set(self, *path: str, value: Any) -> None:
+        with self._lock:
+            table = self._document
+            for depth in range(1, len(path)):
+                # ? Missing tables on the way are created, the last key holds the value
+                next_table = table.get(path[depth - 1])
+                if not isinstance(next_table, dict):
+                    next_table = {}
+                    table[path[depth - 1]] = next_table
+                    self._path_index[path[:depth]] = next_table
+                table = next_table
+            self._unindex_text(path)
+            table[path[-1]] = value
+            self._path_index[path] = value
+            self._index_text(self._text_index, path, value)
+            self._drop_typed(path)
+
+    def exists(self, *path: str) -> bool:
+        current: Tuple[str, ...] = ()
+        for key in path:
+            # ? Searches for the key in the values below the previous match
+            next_path = None
+            for value_path in self._text_index.get(key, ()):
+                if len(value_path) > len(current) and value_path[:len(current)] == current:
+                    next_path = value_path
+                    break
+            if next_path is None:
+                self._log_missing_key(key)
+                return False
+            current = next_path
+        return True
+
+    def get_all(self) -> Dict[str, Any]:
+        def table_to_dict(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return self._to_text(value)
+            return {key: table_to_dict(child) for key, child in value.items()} or None
+        return {self._root_name: table_to_dict(self._document)}
+
+    @abstractmethod
+    def _load_document(self, data: bytes) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def _dump_document(self, document: Dict[str, Any]) -> bytes:
+        pass
+
+    def _parse(self, data: bytes) -> Any:
+        document = self._load_document(data)
+        if not isinstance(document, dict) or len(document) != 1:
+            raise ValueError(f"{self._config_path}': expected a single top-level table")
+        root_name, root = next(iter(document.items()))
+        if not isinstance(root, dict):
+            raise ValueError(f"{self._config_path}': the top-level '{root_name}' is not a table")
+        path_index, text_index = {}, {}
+        self._index(root, (), path_index, text_index)
+        return root_name, root, path_index, text_index
+
+    def _serialize(self) -> bytes:
+        return self._dump_document({self._root_name: self._document})
+
+    def _get_state(self) -> Any:
+        return self._root_name, self._document, self._path_index, self._text_index
+
+    def _set_state(self, state: Any) -> None:
+        self._root_name, self._document, self._path_index, self._text_index = state
+
+    def _get_values(self, state: Any) -> Dict[Tuple[str, ...], Optional[str]]:
+        return {path: None if isinstance(value, dict) else self._to_text(value)
+                for path, value in state[2].items()}
+
+    def _get_texts(self) -> Iterable[str]:
+        return self._text_index.keys()
+
+    @staticmethod
+    def _to_text(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            return ConstStrings.CONFIG_TRUE if value else ConstStrings.CONFIG_FALSE
+        return str(value).strip()
+
+    @staticmethod
+    def _index(table: Dict[str, Any], path: Tuple[str, ...], path_index: Dict[Tuple[str, ...], Any],
+               text_index: Dict[str, List[Tuple[str, ...]]]) -> None:
+        for key, value in table.items():
+            value_path = path + (key,)
+            path_index[value_path] = value
+            if isinstance(value, dict):
+                DictConfigManager._index(value, value_path, path_index, text_index)
+            else:
+                DictConfigManager._index_text(text_index, value_path, value)
+
+    @staticmethod
+    def _index_text(text_index: Dict[str, List[Tuple[str, ...]]], path: Tuple[str, ...], value: Any) -> None:
+        text = DictConfigManager._to_text(value)
+        if text:
+            text_index.setdefault(text, []).append(path)
+
+    def _unindex_text(self, path: Tuple[str, ...]) -> None:
+        value = self._path_index.get(path)
+        if isinstance(value, dict):
+            return
+        text = self._to_text(value)
+        paths = self._text_index.get(text) if text else None
+        if paths is not None and path in paths:
+            paths.remove(path)
+            if not paths:
+                del self._text_index[text]
@@ -0,0 +1,254 @@
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+from abc import abstractmethod
+from difflib import get_close_matches
+from threading import Event, Lock, Thread, Timer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.iconfig_manager import IConfigManager
+
+
+class FileConfigManager(IConfigManager):
+    # ? What every config file format shares: typed getters, debounced atomic saves, watching and
+    # ? reloading, and the compiled cache. Subclasses parse, index and write their own format, and keep
+    # ? everything they parsed in one picklable state, which is what the cache stores.
+
+    def __init__(self, config_path: str, is_cached: bool = False) -> None:
+        self._config_path = config_path
+        self._cache_path = config_path + ConstStrings.CONFIG_CACHE_SUFFIX if is_cached else None
+        self._logger = LoggerFactory.get_logger_manager()
+        self._lock = Lock()
+        # ? Converted values by type and path, dropped when their key changes
+        self._typed_cache: Dict[Tuple[type, Tuple[str, ...]], Any] = {}
+        # ? Bumped under the lock whenever a value changes, a converted value is only kept if none changed
+        # ? while it was being read
+        self._state_generation = 0
+        self._save_timer: Optional[Timer] = None
+        self._is_exit_registered = False
+        self._changes_callback: Optional[Callable[[List[Tuple[str, ...]]], None]] = None
+        self._file_signature = self._get_file_signature()
+        self._watch_thread: Optional[Thread] = None
+        self._watch_stop = Event()
+        self._set_state(self._load_state())
+
+    def get_int(self, *path: str, default: int = 0) -> int:
+        return self._get_typed(int, path, default)
+
+    def get_float(self, *path: str, default: float = 0.0) -> float:
+        return self._get_typed(float, path, default)
+
+    def get_bool(self, *path: str, default: bool = False) -> bool:
+        return self._get_typed(bool, path, default)
+
+    def save(self, is_immediate: bool = False) -> None:
+        # ? Saves in a burst of sets are merged into one write once they stop for the debounce interval
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not is_immediate:
+                self._save_timer = Timer(Consts.CONFIG_SAVE_DEBOUNCE_SECONDS, self._write)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                if not self._is_exit_registered:
+                    # ? A save still waiting when the app exits is written then
+                    atexit.register(self._flush_pending_save)
+                    self._is_exit_registered = True
+                return
+        self._write()
+
+    def set_changes_callback(self, callback: Optional[Callable[[List[Tuple[str, ...]]], None]]) -> None:
+        # ? Called on the watch thread with the paths of every key a reload changed
+        self._changes_callback = callback
+
+    def watch(self) -> None:
+        if self._watch_thread is not None:
+            return
+        self._watch_stop.clear()
+        self._watch_thread = Thread(target=self._watch_thread_handle, daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watch_thread.join(Consts.CONFIG_WATCH_JOIN_TIMEOUT)
+        self._watch_thread = None
+
+    def reload(self) -> List[Tuple[str, ...]]:
+        # ? Re-parses the file and returns the changed key paths. A file that does not parse leaves the
+        # ? last good configuration in place. Values set but not yet saved are replaced by the file's.
+        self._file_signature = self._get_file_signature()
+        try:
+            state = self._load_state()
+        except (OSError, ValueError) as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_RELOAD_FAILED, logging.DEBUG,
+                             self._config_path, e)
+            return []
+        new_values = self._get_values(state)
+        with self._lock:
+            old_values = self._get_values(self._get_state())
+            changed_paths = sorted(path for path in old_values.keys() | new_values.keys()
+                                   if old_values.get(path) != new_values.get(path))
+            if not changed_paths:
+                return []
+            self._set_state(state)
+            for path in changed_paths:
+                self._drop_typed(path)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_RELOADED, logging.DEBUG,
+                         self._config_path, len(changed_paths))
+        if self._changes_callback is not None:
+            self._changes_callback(changed_paths)
+        return changed_paths
+
+    @abstractmethod
+    def _parse(self, data: bytes) -> Any:
+        # ? Raises ValueError when the content is not valid for the format
+        pass
+
+    @abstractmethod
+    def _serialize(self) -> bytes:
+        pass
+
+    @abstractmethod
+    def _get_state(self) -> Any:
+        pass
+
+    @abstractmethod
+    def _set_state(self, state: Any) -> None:
+        pass
+
+    @abstractmethod
+    def _get_values(self, state: Any) -> Dict[Tuple[str, ...], Optional[str]]:
+        pass
+
+    @abstractmethod
+    def _get_texts(self) -> Iterable[str]:
+        pass
+
+    def _load_state(self) -> Any:
+        if self._cache_path is None:
+            with open(self._config_path, "rb") as config_file:
+                return self._parse(config_file.read())
+        # ? An unchanged modification time trusts the cache without reading the file, a changed one
+        # ? still reuses it when the content hash matches, a touched file is not parsed again
+        cache = self._read_cache()
+        if cache is not None and cache[0] == self._file_signature:
+            return cache[2]
+        with open(self._config_path, "rb") as config_file:
+            data = config_file.read()
+        digest = hashlib.sha1(data).hexdigest()
+        state = cache[2] if cache is not None and cache[1] == digest else self._parse(data)
+        self._write_cache(self._file_signature, digest, state)
+        return state
+
+    def _read_cache(self) -> Optional[Tuple[Any, str, Any]]:
+        try:
+            with open(self._cache_path, "rb") as cache_file:
+                version, signature, digest, state = pickle.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+            return None
+        if version != Consts.CONFIG_CACHE_VERSION:
+            return None
+        return signature, digest, state
+
+    def _write_cache(self, signature: Any, digest: str, state: Any) -> None:
+        temp_path = self._cache_path + ConstStrings.TEMP_FILE_SUFFIX
+        try:
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump((Consts.CONFIG_CACHE_VERSION, signature, digest, state), cache_file,
+                            pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_path)
+        except OSError as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_CACHE_FAILED, logging.DEBUG,
+                             self._cache_path, e)
+
+    def _watch_thread_handle(self) -> None:
+        # ? Polls the file's size and modification time, parsing and diffing stay off the UI thread
+        while not self._watch_stop.wait(Consts.CONFIG_WATCH_INTERVAL_SECONDS):
+            if self._get_file_signature() != self._file_signature:
+                self.reload()
+
+    def _get_file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_typed(self, value_type: type, path: Tuple[str, ...], default: Any) -> Any:
+        key = (value_type, path)
+        try:
+            return self._typed_cache[key]
+        except KeyError:
+            pass
+        generation = self._state_generation
+        text = self.get(*path)
+        if text is None:
+            value = default
+        elif value_type is bool:
+            value = text.lower() == ConstStrings.CONFIG_TRUE
+        else:
+            try:
+                value = value_type(text)
+            except ValueError:
+                value = default
+        with self._lock:
+            # ? A reload or set since the text was read may have dropped this key, the stale value is
+            # ? returned once but not cached
+            if generation == self._state_generation:
+                self._typed_cache[key] = value
+        return value
+
+    def _drop_typed(self, path: Tuple[str, ...]) -> None:
+        # ? Called under the lock by reload and set
+        self._state_generation += 1
+        for value_type in (int, float, bool):
+            self._typed_cache.pop((value_type, path), None)
+
+    def _log_missing_key(self, key: str) -> None:
+        if not self._logger.is_enabled_for(logging.DEBUG):
+            return
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_KEY_NOT_FOUND, logging.DEBUG, key)
+        # ? Suggest the closest match, only worked out when it is going to be logged
+        close_matches = get_close_matches(key, list(self._get_texts()), n=1, cutoff=0.6)
+        if close_matches:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_DID_YOU_MEAN, logging.DEBUG,
+                             close_matches[0])
+        else:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_NO_MATCHES)
+
+    def _flush_pending_save(self) -> None:
+        with self._lock:
+            save_timer, self._save_timer = self._save_timer, None
+        if save_timer is not None:
+            save_timer.cancel()
+            self._write()
+
+    def _write(self) -> None:
+        # ? Written next to the file and renamed over it, readers see the old or the new file, never half of one
+        temp_path = self._config_path + ConstStrings.TEMP_FILE_SUFFIX
+        try:
+            with self._lock:
+                self._save_timer = None
+                data = self._serialize()
+                state = self._get_state()
+                with open(temp_path, "wb") as config_file:
+                    config_file.write(data)
+                os.replace(temp_path, self._config_path)
+                # ? The watcher does not reload what this manager wrote itself
+                self._file_signature = self._get_file_signature()
+                if self._cache_path is not None:
+                    self._write_cache(self._file_signature, hashlib.sha1(data).hexdigest(), state)
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_SAVED, logging.DEBUG,
+                             self._config_path)
+        except OSError as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.CONFIG_SAVE_FAILED, logging.DEBUG,
+                             self._config_path, e)
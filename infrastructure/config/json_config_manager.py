@@ -0,0 +1,15 @@
+import json
+from typing import Any, Dict
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.config.dict_config_manager import DictConfigManager
+
+
+class JsonConfigManager(DictConfigManager):
+    def _load_document(self, data: bytes) -> Dict[str, Any]:
+        # ? JSONDecodeError is a ValueError, so a bad edit is handled like any other parse error
+        return json.loads(data)
+
+    def _dump_document(self, document: Dict[str, Any]) -> bytes:
+        return (json.dumps(document, indent=len(ConstStrings.CONFIG_INDENT)) + "\n").encode(
+            ConstStrings.CONFIG_ENCODING)
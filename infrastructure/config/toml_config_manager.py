@@ -0,0 +1,57 @@
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.config.dict_config_manager import DictConfigManager
+
+try:
+    import tomllib
+except ImportError:
+    # ? Before Python 3.11 the same parser ships as the tomli package
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+class TomlConfigManager(DictConfigManager):
+    # ? The standard library only reads TOML, tables of plain values are written here
+
+    def _load_document(self, data: bytes) -> Dict[str, Any]:
+        if tomllib is None:
+            raise ValueError(f"{self._config_path}': reading TOML needs Python 3.11 or the tomli package")
+        # ? TOMLDecodeError is a ValueError, so a bad edit is handled like any other parse error
+        return tomllib.loads(data.decode(ConstStrings.CONFIG_ENCODING))
+
+    def _dump_document(self, document: Dict[str, Any]) -> bytes:
+        lines: List[str] = []
+        self._dump_table(document, (), lines)
+        return "\n".join(lines).lstrip("\n").encode(ConstStrings.CONFIG_ENCODING) + b"\n"
+
+    def _dump_table(self, table: Dict[str, Any], path: Tuple[str, ...], lines: List[str]) -> None:
+        values = [(key, value) for key, value in table.items() if not isinstance(value, dict) and value is not None]
+        tables = [(key, value) for key, value in table.items() if isinstance(value, dict)]
+        # ? A header only where the table holds values of its own, or it would be lost when empty
+        if path and (values or not tables):
+            lines.append("")
+            lines.append("[" + ".".join(self._format_key(key) for key in path) + "]")
+        for key, value in values:
+            lines.append(f"{self._format_key(key)} = {self._format_value(value)}")
+        for key, value in tables:
+            self._dump_table(value, path + (key,), lines)
+
+    @staticmethod
+    def _format_key(key: str) -> str:
+        return key if re.fullmatch(ConstStrings.CONFIG_TOML_BARE_KEY_PATTERN, key) else json.dumps(key)
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        if isinstance(value, bool):
+            return ConstStrings.CONFIG_TRUE if value else ConstStrings.CONFIG_FALSE
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, (list, tuple)):
+            return "[" + ", ".join(TomlConfigManager._format_value(item) for item in value) + "]"
+        # ? JSON string escapes are valid in TOML basic strings
+        return json.dumps(str(value))
@@ -1,77 +1,61 @@
-from difflib import get_close_matches
 import xml.etree.ElementTree as ET
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from globals.consts.const_strings import ConstStrings
-from infrastructure.interfaces.iconfig_manager import IConfigManager
-from infrastructure.factories.logger_factory import LoggerFactory
-from globals.consts.logger_messages import LoggerMessages
+from infrastructure.config.file_config_manager import FileConfigManager
 
 
-class XMLConfigManager(IConfigManager):
-    def __init__(self, xml_path: str) -> None:
-        self._config_path = xml_path
-        self._root = self._load_xml()
-        self._logger = LoggerFactory.get_logger_manager()
-        if isinstance(self._root, ET.ElementTree):
-            self._root = self._root.getroot()
+class XMLConfigManager(FileConfigManager):
+    # ? Lookups run on flat indexes built once at load, the text of the first element on each tag path
+    # ? and the paths holding each text, so they cost a dict access instead of a walk over every
+    # ? element. The cache holds these indexes and the source they came from, the element tree is
+    # ? parsed from that source when set, save or get_all first needs it, because unpickling a tree
+    # ? is slower than parsing it.
+
+    def __init__(self, xml_path: str, is_cached: bool = False) -> None:
+        self._root: Optional[ET.Element] = None
+        self._root_tag = ""
+        self._values: Dict[Tuple[str, ...], Optional[str]] = {}
+        self._text_index: Dict[str, List[Tuple[str, ...]]] = {}
+        self._source = b""
+        super().__init__(xml_path, is_cached)
 
     def get(self, *path: str) -> Any:
-        current = self._root
         if len(path) == 1:
-            for element in self._get_all_xml_elements(current):
-                if element.text and element.text.strip() == path[0]:
-                    return element.text.strip()
-            return None
-        for key in path:
-            if current is None:
-                return None
-            current = current.find(key)
-        if current is not None and current.text is not None:
-            return current.text.strip()
-        return None
+            return path[0] if self._text_index.get(path[0]) else None
+        if not path:
+            return self._get_text(self._get_root())
+        return self._values.get(path)
 
     def set(self, *path: str, value: Any) -> None:
-        current = self._root
-        for key in path[:-1]:
-            next_element = current.find(key)
-            if next_element is None:
-                next_element = ET.SubElement(current, key)
-            current = next_element
-        # ? Update or create the final element
-        last_key = path[-1]
-        final_element = current.find(last_key)
-        if final_element is None:
-            final_element = ET.SubElement(current, last_key)
-        final_element.text = str(value)
+        with self._lock:
+            current = self._get_root()
+            for depth in range(1, len(path) + 1):
+                # ? Missing elements on the way are created, the last one holds the value
+                next_element = current.find(path[depth - 1])
+                if next_element is None:
+                    next_element = ET.SubElement(current, path[depth - 1])
+                    self._values[path[:depth]] = None
+                current = next_element
+            self._unindex_text(path)
+            current.text = str(value)
+            self._values[path] = self._get_text(current)
+            self._index_text(self._text_index, path, self._values[path])
+            self._drop_typed(path)
 
     def exists(self, *path: str) -> bool:
-        current = self._root
+        current: Tuple[str, ...] = ()
         for key in path:
-            all_elements = self._get_all_xml_elements(current)
-            # ? Searches for the key in the content of all elements
-            next_element = None
-            for element in all_elements:
-                if element.text and key == element.text.strip():
-                    next_element = element
+            # ? Searches for the key in the content of the elements below the previous match
+            next_path = None
+            for text_path in self._text_index.get(key, ()):
+                if len(text_path) > len(current) and text_path[:len(current)] == current:
+                    next_path = text_path
                     break
-            if next_element is None:
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                                 LoggerMessages.CONFIG_KEY_NOT_FOUND.format(key))
-                # ? Suggest the closest match
-                most_likely = None
-                close_matches = get_close_matches(
-                    key, [el.text.strip() for el in all_elements if el.text], n=1, cutoff=0.6)
-                if close_matches:
-                    most_likely = close_matches[0]
-                if most_likely:
-                    self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                                     LoggerMessages.CONFIG_DID_YOU_MEAN.format(most_likely))
-                else:
-                    self._logger.log(ConstStrings.LOG_NAME_DEBUG,
-                                     LoggerMessages.CONFIG_NO_MATCHES)
+            if next_path is None:
+                self._log_missing_key(key)
                 return False
-            current = next_element
+            current = next_path
         return True
 
     def get_all(self) -> Dict[str, Any]:
@@ -79,18 +63,70 @@ class XMLConfigManager(IConfigManager):
             if not list(element):
                 return element.text.strip() if element.text else None
             return {child.tag: element_to_dict(child) for child in element}
-        return {self._root.tag: element_to_dict(self._root)}
-
-    def _get_all_xml_elements(self, element: Any) -> list:
-        elements = []
-        for child in element:
-            elements.append(child)
-            elements.extend(self._get_all_xml_elements(child))
-        return elements
+        root = self._get_root()
+        return {root.tag: element_to_dict(root)}
 
-    def _load_xml(self) -> ET.Element:
+    def _parse(self, data: bytes) -> Any:
         try:
-            tree = ET.parse(self._config_path)
-            return tree.getroot()
+            root = ET.fromstring(data)
         except ET.ParseError as e:
             raise ValueError(f"{self._config_path}': {e}")
+        values, text_index = {}, {}
+        self._index(root, (), values, text_index)
+        return root.tag, values, text_index, data
+
+    def _serialize(self) -> bytes:
+        root = self._get_root()
+        ET.indent(root, space=ConstStrings.CONFIG_INDENT)
+        # ? What is saved becomes the source, a tree changed by set is ahead of the one it was parsed from
+        self._source = ET.tostring(root, encoding=ConstStrings.CONFIG_ENCODING, xml_declaration=True)
+        return self._source
+
+    def _get_state(self) -> Any:
+        return self._root_tag, self._values, self._text_index, self._source
+
+    def _set_state(self, state: Any) -> None:
+        self._root_tag, self._values, self._text_index, self._source = state
+        self._root = None
+
+    def _get_values(self, state: Any) -> Dict[Tuple[str, ...], Optional[str]]:
+        return state[1]
+
+    def _get_texts(self) -> Iterable[str]:
+        return self._text_index.keys()
+
+    def _get_root(self) -> ET.Element:
+        if self._root is None:
+            # ? From the source kept with the indexes, the file itself may have changed since
+            self._root = ET.fromstring(self._source)
+        return self._root
+
+    @staticmethod
+    def _get_text(element: ET.Element) -> Optional[str]:
+        # ? Whitespace around child elements is layout, not a value
+        return (element.text.strip() or None) if element.text is not None else None
+
+    @staticmethod
+    def _index(element: ET.Element, path: Tuple[str, ...], values: Dict[Tuple[str, ...], Optional[str]],
+               text_index: Dict[str, List[Tuple[str, ...]]]) -> None:
+        for child in element:
+            child_path = path + (child.tag,)
+            text = XMLConfigManager._get_text(child)
+            # ? find returns the first child with a tag, so the first one in document order is kept
+            values.setdefault(child_path, text)
+            XMLConfigManager._index_text(text_index, child_path, text)
+            XMLConfigManager._index(child, child_path, values, text_index)
+
+    @staticmethod
+    def _index_text(text_index: Dict[str, List[Tuple[str, ...]]], path: Tuple[str, ...],
+                    text: Optional[str]) -> None:
+        if text:
+            text_index.setdefault(text, []).append(path)
+
+    def _unindex_text(self, path: Tuple[str, ...]) -> None:
+        text = self._values.get(path)
+        paths = self._text_index.get(text) if text else None
+        if paths is not None and path in paths:
+            paths.remove(path)
+            if not paths:
+                del self._text_index[text]
@@ -1,8 +1,120 @@
-from PyQt5.QtCore import QObject, pyqtSignal
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Tuple
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from globals.consts.consts import Consts
+from globals.enums.enums import DeliveryMode, Topic
+from infrastructure.events.subscription import Subscription
+from model.data_classes.topic_stats import TopicStats
+from model.data_classes.track_snapshot import TrackSnapshot
 
 
 class EventBus(QObject):
+    # ? Topics carry one payload of a fixed type. Each subscription picks where it runs: on the
+    # ? publishing thread, on the GUI thread, or on a thread of its own, and whether it only wants
+    # ? the newest value. GUI deliveries are batched, a burst of publishes posts one event to the
+    # ? GUI thread instead of one per publish, so a fast producer cannot flood its event queue.
+
     send_coordinates_signal = pyqtSignal(int, int)
+    # ? TrackSnapshot of every tracked point at the frame on screen
+    send_tracks_signal = pyqtSignal(object)
+    # ? Config file path and the key paths a reload changed, emitted from the config watch thread
+    config_changed_signal = pyqtSignal(str, object)
+    # ? Queued to the GUI thread, delivers what is waiting for GUI subscriptions
+    _gui_delivery_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
+        # ? (x, y) in source pixels, and (config path, changed key paths)
+        self._payload_types = {Topic.COORDINATES: tuple, Topic.TRACKS: TrackSnapshot, Topic.CONFIG_CHANGED: tuple}
+        self._lock = Lock()
+        # ? Replaced rather than changed, so publish reads them without taking the lock
+        self._subscriptions: Dict[Topic, Tuple[Subscription, ...]] = {topic: () for topic in Topic}
+        self._gui_subscriptions: Tuple[Subscription, ...] = ()
+        self._is_gui_delivery_posted = False
+        self._published = {topic: 0 for topic in Topic}
+        # ? Counts of subscriptions that are gone, so the totals never go back
+        self._retired = {topic: TopicStats() for topic in Topic}
+        self._last_counts = {topic: (0, 0) for topic in Topic}
+        self._last_stats_time = time.perf_counter()
+        # ? Created on the GUI thread, so the queued call runs there whichever thread emits
+        self._gui_delivery_signal.connect(self._deliver_gui_pending, Qt.QueuedConnection)
+        # ? The signals stay for code connected to them, fed from their topics
+        self.subscribe(Topic.COORDINATES, lambda point: self.send_coordinates_signal.emit(*point))
+        self.subscribe(Topic.TRACKS, self.send_tracks_signal.emit)
+        self.subscribe(Topic.CONFIG_CHANGED, lambda change: self.config_changed_signal.emit(*change))
+
+    def subscribe(self, topic: Topic, callback: Callable[[Any], None], mode: DeliveryMode = DeliveryMode.DIRECT,
+                  is_coalesced: bool = False, capacity: int = Consts.EVENT_QUEUE_CAPACITY) -> Subscription:
+        subscription = Subscription(topic, callback, mode, is_coalesced, capacity)
+        with self._lock:
+            self._subscriptions[topic] += (subscription,)
+            if mode is DeliveryMode.GUI:
+                self._gui_subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            topic = subscription.topic
+            if subscription not in self._subscriptions[topic]:
+                return
+            self._subscriptions[topic] = tuple(item for item in self._subscriptions[topic] if item is not subscription)
+            self._gui_subscriptions = tuple(item for item in self._gui_subscriptions if item is not subscription)
+            retired = self._retired[topic]
+            retired.delivered += subscription.delivered
+            retired.coalesced += subscription.coalesced
+            retired.dropped += subscription.dropped
+        subscription.close()
+
+    def publish(self, topic: Topic, payload: Any) -> None:
+        payload_type = self._payload_types[topic]
+        if not isinstance(payload, payload_type):
+            raise TypeError(f"'{topic.value}' carries {payload_type.__name__}, not {type(payload).__name__}")
+        self._published[topic] += 1
+        is_gui_pending = False
+        for subscription in self._subscriptions[topic]:
+            if subscription.mode is DeliveryMode.DIRECT:
+                subscription.deliver(payload)
+            elif subscription.offer(payload) and subscription.mode is DeliveryMode.GUI:
+                is_gui_pending = True
+        if is_gui_pending:
+            self._post_gui_delivery()
+
+    def get_topic_stats(self) -> Dict[str, TopicStats]:
+        # ? Keyed by Topic value, the rates cover the time since the previous call
+        now = time.perf_counter()
+        elapsed = now - self._last_stats_time
+        self._last_stats_time = now
+        stats = {}
+        with self._lock:
+            for topic, subscriptions in self._subscriptions.items():
+                retired = self._retired[topic]
+                topic_stats = TopicStats(self._published[topic], retired.delivered, retired.coalesced,
+                                         retired.dropped, len(subscriptions))
+                for subscription in subscriptions:
+                    topic_stats.delivered += subscription.delivered
+                    topic_stats.coalesced += subscription.coalesced
+                    topic_stats.dropped += subscription.dropped
+                last_published, last_delivered = self._last_counts[topic]
+                self._last_counts[topic] = (topic_stats.published, topic_stats.delivered)
+                if elapsed > 0:
+                    topic_stats.publish_rate = (topic_stats.published - last_published) / elapsed
+                    topic_stats.deliver_rate = (topic_stats.delivered - last_delivered) / elapsed
+                stats[topic.value] = topic_stats
+        return stats
+
+    def _post_gui_delivery(self) -> None:
+        with self._lock:
+            if self._is_gui_delivery_posted:
+                return
+            self._is_gui_delivery_posted = True
+        self._gui_delivery_signal.emit()
+
+    def _deliver_gui_pending(self) -> None:
+        # ? Cleared first, whatever is published while delivering posts the next pass
+        with self._lock:
+            self._is_gui_delivery_posted = False
+        for subscription in self._gui_subscriptions:
+            subscription.deliver_pending()
@@ -0,0 +1,19 @@
+from typing import Any, Callable
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+
+class GuiDispatcher(QObject):
+    # ? Calls a callback on the thread the dispatcher was created on, the GUI thread, from any thread
+    _call_signal = pyqtSignal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self._call_signal.connect(self._call, Qt.QueuedConnection)
+
+    def post(self, callback: Callable[[Any], None], argument: Any) -> None:
+        self._call_signal.emit(callback, argument)
+
+    @staticmethod
+    def _call(callback: Callable[[Any], None], argument: Any) -> None:
+        callback(argument)
@@ -0,0 +1,89 @@
+import logging
+from collections import deque
+from threading import Condition, Thread, current_thread
+from typing import Any, Callable, Deque, Optional
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DeliveryMode, Topic
+from infrastructure.factories.logger_factory import LoggerFactory
+
+
+class Subscription:
+    # ? One subscriber of a topic and the events waiting for it. The queue is bounded, when it is full
+    # ? the oldest event is dropped and counted. A coalescing subscription only keeps the newest event,
+    # ? the ones it replaces are counted as coalesced rather than dropped.
+
+    def __init__(self, topic: Topic, callback: Callable[[Any], None], mode: DeliveryMode,
+                 is_coalesced: bool = False, capacity: int = Consts.EVENT_QUEUE_CAPACITY) -> None:
+        self.topic = topic
+        self.mode = mode
+        self.is_coalesced = is_coalesced
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._callback = callback
+        self._capacity = 1 if is_coalesced else max(1, capacity)
+        self._queue: Deque[Any] = deque()
+        self._condition = Condition()
+        self._is_closed = False
+        self._logger = LoggerFactory.get_logger_manager()
+        self._worker_thread: Optional[Thread] = None
+        if mode is DeliveryMode.WORKER:
+            self._worker_thread = Thread(target=self._worker_thread_handle, daemon=True)
+            self._worker_thread.start()
+
+    def offer(self, payload: Any) -> bool:
+        # ? Queues the payload, True when the queue was empty and a delivery has to be scheduled
+        with self._condition:
+            if self._is_closed:
+                return False
+            was_empty = not self._queue
+            if len(self._queue) >= self._capacity:
+                self._queue.popleft()
+                if self.is_coalesced:
+                    self.coalesced += 1
+                else:
+                    self.dropped += 1
+                    # ? Logged at 1, 2, 4, 8... drops, a flooded queue does not flood the log as well
+                    if not self.dropped & (self.dropped - 1):
+                        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.EVENT_DROPPED, logging.DEBUG,
+                                         self.topic.value, self.dropped)
+            self._queue.append(payload)
+            if was_empty:
+                self._condition.notify()
+            return was_empty
+
+    def deliver(self, payload: Any) -> None:
+        # ? A failing subscriber is logged, it does not stop the publisher or the other subscribers
+        try:
+            self._callback(payload)
+        except Exception as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.EVENT_DELIVERY_FAILED, logging.DEBUG,
+                             self.topic.value, e)
+        self.delivered += 1
+
+    def deliver_pending(self) -> None:
+        with self._condition:
+            payloads = list(self._queue)
+            self._queue.clear()
+        for payload in payloads:
+            self.deliver(payload)
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_closed = True
+            self._queue.clear()
+            self._condition.notify()
+        if self._worker_thread is not None and self._worker_thread is not current_thread():
+            self._worker_thread.join(Consts.EVENT_WORKER_JOIN_TIMEOUT)
+
+    def _worker_thread_handle(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._is_closed:
+                    self._condition.wait()
+                if self._is_closed:
+                    return
+            self.deliver_pending()
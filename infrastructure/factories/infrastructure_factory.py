@@ -1,3 +1,10 @@
+import os
+from typing import Dict
+
+from globals.consts.const_strings import ConstStrings
+from globals.enums.enums import Topic
+from infrastructure.config.json_config_manager import JsonConfigManager
+from infrastructure.config.toml_config_manager import TomlConfigManager
 from infrastructure.config.xml_config_manager import XMLConfigManager
 from infrastructure.events.event_bus import EventBus
 from infrastructure.interfaces.iconfig_manager import IConfigManager
@@ -5,10 +12,26 @@ from infrastructure.interfaces.iconfig_manager import IConfigManager
 
 class InfrastructureFactory:
     event_bus: EventBus = None
+    config_managers: Dict[str, IConfigManager] = {}
 
     @staticmethod
-    def create_config_manager(config_path: str) -> IConfigManager:
-        return XMLConfigManager(config_path)
+    def create_config_manager(config_path: str, is_cached: bool = False) -> IConfigManager:
+        # ? One manager per file, so every consumer sees the same values and a reload reaches all of them.
+        # ? The format follows the extension, and is_cached only counts for the call that opens the file.
+        config_manager = InfrastructureFactory.config_managers.get(config_path)
+        if config_manager is None:
+            extension = os.path.splitext(config_path)[1].lower()
+            if extension == ConstStrings.CONFIG_JSON_SUFFIX:
+                config_manager = JsonConfigManager(config_path, is_cached)
+            elif extension == ConstStrings.CONFIG_TOML_SUFFIX:
+                config_manager = TomlConfigManager(config_path, is_cached)
+            else:
+                config_manager = XMLConfigManager(config_path, is_cached)
+            event_bus = InfrastructureFactory.create_event_bus()
+            config_manager.set_changes_callback(
+                lambda changed_paths: event_bus.publish(Topic.CONFIG_CHANGED, (config_path, changed_paths)))
+            InfrastructureFactory.config_managers[config_path] = config_manager
+        return config_manager
 
     @staticmethod
     def create_event_bus() -> EventBus:
@@ -1,3 +1,10 @@
+import logging
+import os
+import xml.etree.ElementTree as ET
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import LogMode, LogOverflowPolicy
 from infrastructure.interfaces.ilogger_manager import ILoggerManager
 from infrastructure.logger.logger_manager import LoggerManager
 
@@ -8,5 +15,24 @@ class LoggerFactory:
     @staticmethod
     def get_logger_manager() -> ILoggerManager:
         if LoggerFactory.logger_manager is None:
-            LoggerFactory.logger_manager = LoggerManager()
+            LoggerFactory.logger_manager = LoggerFactory._create_logger_manager()
         return LoggerFactory.logger_manager
+
+    @staticmethod
+    def _create_logger_manager() -> ILoggerManager:
+        # ? Parsed here rather than through the config manager, which logs through this factory itself
+        settings = {}
+        if os.path.isfile(ConstStrings.GLOBAL_CONFIG_PATH):
+            log_element = ET.parse(ConstStrings.GLOBAL_CONFIG_PATH).getroot().find(ConstStrings.CONFIG_LOG)
+            if log_element is not None:
+                settings = {child.tag: child.text.strip() for child in log_element if child.text}
+        level_name = os.getenv(ConstStrings.LOG_LEVEL_ENV,
+                               settings.get(ConstStrings.CONFIG_LOG_LEVEL, ConstStrings.DEFAULT_LOG_LEVEL))
+        level = logging.getLevelName(level_name.upper())
+        mode = settings.get(ConstStrings.CONFIG_LOG_MODE)
+        queue_size = settings.get(ConstStrings.CONFIG_LOG_QUEUE_SIZE)
+        overflow_policy = settings.get(ConstStrings.CONFIG_LOG_OVERFLOW_POLICY)
+        return LoggerManager(level if isinstance(level, int) else logging.DEBUG,
+                             LogMode(mode) if mode else LogMode.SYNC,
+                             int(queue_size) if queue_size else Consts.LOG_QUEUE_SIZE,
+                             LogOverflowPolicy(overflow_policy) if overflow_policy else LogOverflowPolicy.DROP_OLDEST)
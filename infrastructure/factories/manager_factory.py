@@ -1,16 +1,196 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Optional
+
 from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import DropPolicy, TaskPriority, VideoBackend
 from infrastructure.interfaces.iexample_manager import IExampleManager
-from model.managers.example_manager import ExampleManager
+from infrastructure.interfaces.iframe_store_manager import IFrameStoreManager
+from infrastructure.interfaces.isession_manager import ISessionManager
+from infrastructure.interfaces.itask_executor import ITaskExecutor
+from infrastructure.interfaces.ithumbnail_manager import IThumbnailManager
+from infrastructure.interfaces.itracking_manager import ITrackingManager
+from infrastructure.interfaces.ivideo_manager import IVideoManager
+
+if TYPE_CHECKING:
+    from model.managers.batch_manager import BatchManager
+    from model.pipeline.decode_scheduler import DecodeScheduler
+    from model.pipeline.frame_cache import FrameCache
+    from model.pipeline.frame_store import FrameStore
 
 
 class ManagerFactory:
+    # ? Managers are imported where they are created, so importing the factory does not load OpenCV
+    # ? and the window can appear before the first video is opened
+    task_executor: ITaskExecutor = None
+    # ? Keyframe index builds by index file, a video changed on disk gets a new one
+    keyframe_indexes: Dict[str, Future] = {}
+    keyframe_indexes_lock = Lock()
+
+    @staticmethod
+    def create_task_executor() -> ITaskExecutor:
+        # ? One pool for every manager. Its first call must come from the GUI thread, where on_done
+        # ? callbacks are delivered.
+        if ManagerFactory.task_executor is None:
+            from model.managers.task_executor import TaskExecutor
+
+            config_manager = InfrastructureFactory.create_config_manager(
+                ConstStrings.GLOBAL_CONFIG_PATH)
+            ManagerFactory.task_executor = TaskExecutor(
+                config_manager.get_int(ConstStrings.CONFIG_TASKS, ConstStrings.CONFIG_TASK_WORKERS,
+                                       default=Consts.TASK_WORKERS),
+                config_manager.get_int(ConstStrings.CONFIG_TASKS, ConstStrings.CONFIG_TASK_PROCESS_WORKERS))
+        return ManagerFactory.task_executor
+
+    @staticmethod
+    def create_keyframe_index(video_path: str) -> Future:
+        # ? Scanned once per video on the executor, the video manager, its thumbnails and its frame store
+        # ? all take the same future instead of each demuxing the file
+        from model.pipeline.keyframe_indexer import KeyframeIndexer
+
+        key = KeyframeIndexer.get_index_path(video_path) or video_path
+        with ManagerFactory.keyframe_indexes_lock:
+            keyframe_index = ManagerFactory.keyframe_indexes.get(key)
+            if keyframe_index is None or keyframe_index.cancelled() or (
+                    keyframe_index.done() and keyframe_index.exception() is not None):
+                keyframe_index = ManagerFactory.create_task_executor().submit(
+                    KeyframeIndexer(video_path).load_or_build, priority=TaskPriority.HIGH)
+                ManagerFactory.keyframe_indexes[key] = keyframe_index
+        return keyframe_index
+
     @staticmethod
     def create_example_manager() -> IExampleManager:
+        from model.managers.example_manager import ExampleManager
+
         config_manager = InfrastructureFactory.create_config_manager(
             ConstStrings.GLOBAL_CONFIG_PATH)
         return ExampleManager(config_manager)
 
+    @staticmethod
+    def create_video_manager(video_path: str,
+                             decode_scheduler: Optional["DecodeScheduler"] = None) -> IVideoManager:
+        from model.managers.process_video_manager import ProcessVideoManager
+        from model.managers.video_manager import VideoManager
+
+        config_manager = InfrastructureFactory.create_config_manager(
+            ConstStrings.GLOBAL_CONFIG_PATH)
+        buffer_capacity = config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_BUFFER_CAPACITY, default=Consts.FRAME_BUFFER_CAPACITY)
+        drop_policy = config_manager.get(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_DROP_POLICY)
+        backend = config_manager.get(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_BACKEND)
+        drop_policy = DropPolicy(drop_policy) if drop_policy else DropPolicy.DROP_OLDEST
+        # ? Streams on a shared scheduler stay in process, a worker process each would defeat it
+        if decode_scheduler is None and backend and VideoBackend(backend) is VideoBackend.PROCESS:
+            return ProcessVideoManager(video_path, buffer_capacity, drop_policy)
+        return VideoManager(
+            video_path,
+            buffer_capacity,
+            drop_policy,
+            decode_scheduler,
+            Consts.GRID_DECODE_THREADS_PER_STREAM if decode_scheduler else 0,
+            None if decode_scheduler else ManagerFactory._create_frame_cache(),
+            None if decode_scheduler else ManagerFactory._open_frame_store(video_path),
+            ManagerFactory.create_keyframe_index(video_path))
+
+    @staticmethod
+    def _create_frame_cache() -> Optional["FrameCache"]:
+        # ? Only the main video steps through frames, grid tiles and replays do without
+        from model.pipeline.frame_cache import FrameCache
+
+        config_manager = InfrastructureFactory.create_config_manager(
+            ConstStrings.GLOBAL_CONFIG_PATH)
+        frame_cache_mb = config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_CACHE_MB, default=Consts.FRAME_CACHE_MB)
+        if frame_cache_mb <= 0:
+            return None
+        return FrameCache(frame_cache_mb * Consts.BYTES_PER_MEGABYTE, config_manager.get_bool(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_CACHE_DOWNSCALE))
+
+    @staticmethod
+    def _open_frame_store(video_path: str) -> Optional["FrameStore"]:
+        # ? Only a complete store is played from, one still being built is left to its builder
+        from model.pipeline.frame_store import FrameStore
+
+        config_manager = InfrastructureFactory.create_config_manager(
+            ConstStrings.GLOBAL_CONFIG_PATH)
+        if not config_manager.get_bool(ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_STORE):
+            return None
+        frame_store = FrameStore.open(video_path, config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_STORE_HEIGHT, default=0))
+        return frame_store if frame_store is not None and frame_store.is_complete else None
+
+    @staticmethod
+    def create_frame_store_manager(video_path: str) -> Optional[IFrameStoreManager]:
+        # ? None unless pre-decoding is turned on in the configuration
+        from model.managers.frame_store_manager import FrameStoreManager
+
+        config_manager = InfrastructureFactory.create_config_manager(
+            ConstStrings.GLOBAL_CONFIG_PATH)
+        if not config_manager.get_bool(ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_STORE):
+            return None
+        height = config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_STORE_HEIGHT, default=0)
+        max_mb = config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_FRAME_STORE_MAX_MB, default=Consts.FRAME_STORE_MAX_MB)
+        return FrameStoreManager(video_path, height, max_mb * Consts.BYTES_PER_MEGABYTE,
+                                 ManagerFactory.create_task_executor(),
+                                 ManagerFactory.create_keyframe_index(video_path))
+
+    @staticmethod
+    def create_replay_video_manager(video_path: str) -> IVideoManager:
+        from model.managers.video_manager import VideoManager
+
+        # ? Replays step through frames on the calling thread, a decode thread would make them timing dependent
+        return VideoManager(video_path, Consts.MIN_FRAME_BUFFER_CAPACITY,
+                            keyframe_index=ManagerFactory.create_keyframe_index(video_path))
+
+    @staticmethod
+    def create_tracking_manager(source_width: int, source_height: int) -> ITrackingManager:
+        from model.managers.tracking_manager import TrackingManager
+
+        return TrackingManager(source_width, source_height)
+
+    @staticmethod
+    def create_session_manager() -> ISessionManager:
+        from model.managers.session_manager import SessionManager
+
+        return SessionManager()
+
+    @staticmethod
+    def create_thumbnail_manager(video_path: str) -> IThumbnailManager:
+        from model.managers.thumbnail_manager import ThumbnailManager
+
+        return ThumbnailManager(video_path, ManagerFactory.create_task_executor(),
+                                ManagerFactory.create_keyframe_index(video_path))
+
+    @staticmethod
+    def create_batch_manager(workers: int = 0) -> "BatchManager":
+        from model.managers.batch_manager import BatchManager
+
+        return BatchManager(workers)
+
+    @staticmethod
+    def create_decode_scheduler() -> "DecodeScheduler":
+        from model.pipeline.decode_scheduler import DecodeScheduler
+
+        config_manager = InfrastructureFactory.create_config_manager(
+            ConstStrings.GLOBAL_CONFIG_PATH)
+        decode_workers = config_manager.get_int(
+            ConstStrings.CONFIG_VIDEO, ConstStrings.CONFIG_DECODE_WORKERS)
+        return DecodeScheduler(decode_workers)
+
     @staticmethod
     def create_all() -> None:
+        # ? Built and started on the executor, so the window does not wait for them. The event bus and
+        # ? the executor are created here first, a QObject belongs to the thread that creates it.
+        InfrastructureFactory.create_event_bus()
+        ManagerFactory.create_task_executor().submit(ManagerFactory._create_and_start_all,
+                                                     priority=TaskPriority.HIGH)
+
+    @staticmethod
+    def _create_and_start_all() -> None:
         ManagerFactory.create_example_manager().start()
@@ -0,0 +1,56 @@
+import os
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.interfaces.iconfig_manager import IConfigManager
+from infrastructure.interfaces.imetrics_manager import IMetricsManager
+from infrastructure.metrics.metrics_manager import MetricsManager
+
+
+class MetricsFactory:
+    metrics_manager: IMetricsManager = None
+
+    @staticmethod
+    def get_metrics_manager() -> IMetricsManager:
+        # ? Shared by every stage in the process. The settings come from the shared config manager, and
+        # ? a reload of the <metrics> section reaches the manager through the event bus.
+        if MetricsFactory.metrics_manager is None and not os.path.isfile(ConstStrings.GLOBAL_CONFIG_PATH):
+            # ? Headless callers may run from anywhere, they get the defaults
+            MetricsFactory.metrics_manager = MetricsManager()
+        if MetricsFactory.metrics_manager is None:
+            from infrastructure.factories.infrastructure_factory import InfrastructureFactory
+            from globals.enums.enums import Topic
+
+            config_manager = InfrastructureFactory.create_config_manager(ConstStrings.GLOBAL_CONFIG_PATH)
+            metrics_manager = MetricsManager()
+            MetricsFactory._apply_config(metrics_manager, config_manager)
+            InfrastructureFactory.create_event_bus().subscribe(Topic.CONFIG_CHANGED,
+                                                               MetricsFactory._on_config_changed)
+            MetricsFactory.metrics_manager = metrics_manager
+        return MetricsFactory.metrics_manager
+
+    @staticmethod
+    def set_process_metrics_manager(is_enabled: bool) -> None:
+        # ? For worker processes, the settings are passed in by the parent, so the worker never opens the config
+        # ? or the Qt event bus, and a reload is not followed
+        MetricsFactory.metrics_manager = MetricsManager(is_enabled)
+
+    @staticmethod
+    def _apply_config(metrics_manager: IMetricsManager, config_manager: IConfigManager) -> None:
+        export_path = config_manager.get(ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_EXPORT_PATH)
+        metrics_manager.set_export(
+            config_manager.get_float(ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_EXPORT_INTERVAL),
+            export_path or None)
+        metrics_manager.set_enabled(
+            config_manager.get_bool(ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_ENABLED, default=True))
+
+    @staticmethod
+    def _on_config_changed(config_change: tuple) -> None:
+        # ? Runs on the config watch thread, before the GUI subscribers see the change
+        config_path, changed_paths = config_change
+        if config_path != ConstStrings.GLOBAL_CONFIG_PATH or MetricsFactory.metrics_manager is None:
+            return
+        if any(path[0] == ConstStrings.CONFIG_METRICS for path in changed_paths):
+            from infrastructure.factories.infrastructure_factory import InfrastructureFactory
+
+            MetricsFactory._apply_config(MetricsFactory.metrics_manager,
+                                         InfrastructureFactory.create_config_manager(ConstStrings.GLOBAL_CONFIG_PATH))
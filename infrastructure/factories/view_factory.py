@@ -1,8 +1,16 @@
+from typing import List, Optional
+
+from view.grid_window import GridWindow
 from view.main_window import MainWindow
+from view_model.grid_view_model import GridViewModel
 from view_model.main_window_view_model import MainWindowViewModel
 
 
 class ViewFactory:
     @staticmethod
-    def create_main_window() -> MainWindow:
-        return MainWindow(MainWindowViewModel())
+    def create_main_window(is_deferred_load: bool = True, video_path: Optional[str] = None) -> MainWindow:
+        return MainWindow(MainWindowViewModel(), is_deferred_load, video_path)
+
+    @staticmethod
+    def create_grid_window(rows: int, columns: int, video_paths: List[str]) -> GridWindow:
+        return GridWindow(GridViewModel(rows, columns), video_paths)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class IConfigManager(ABC):
@@ -11,6 +11,18 @@ class IConfigManager(ABC):
     def set(self, *path: str, value: Any) -> None:
         pass
 
+    @abstractmethod
+    def get_int(self, *path: str, default: int = 0) -> int:
+        pass
+
+    @abstractmethod
+    def get_float(self, *path: str, default: float = 0.0) -> float:
+        pass
+
+    @abstractmethod
+    def get_bool(self, *path: str, default: bool = False) -> bool:
+        pass
+
     @abstractmethod
     def exists(self, *path: str) -> bool:
         pass
@@ -18,3 +30,23 @@ class IConfigManager(ABC):
     @abstractmethod
     def get_all(self) -> Dict[str, Any]:
         pass
+
+    @abstractmethod
+    def save(self, is_immediate: bool = False) -> None:
+        pass
+
+    @abstractmethod
+    def set_changes_callback(self, callback: Optional[Callable[[List[Tuple[str, ...]]], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def watch(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop_watching(self) -> None:
+        pass
+
+    @abstractmethod
+    def reload(self) -> List[Tuple[str, ...]]:
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+
+class IFrameStoreManager(ABC):
+
+    @abstractmethod
+    def set_complete_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def set_playing(self, is_playing: bool) -> None:
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def cancel(self) -> None:
+        pass
@@ -5,5 +5,13 @@ from typing import Any, Dict, Optional
 class ILoggerManager(ABC):
 
     @abstractmethod
-    def log(self, log_name: str, msg: str, level: Any) -> None:
+    def log(self, log_name: str, msg: str, level: Any, *args: Any) -> None:
+        pass
+
+    @abstractmethod
+    def is_enabled_for(self, level: int) -> bool:
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
         pass
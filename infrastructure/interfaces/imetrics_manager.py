@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from globals.enums.enums import MetricGauge, PipelineStage
+from model.data_classes.metrics_snapshot import MetricsSnapshot
+
+
+class IMetricsManager(ABC):
+
+    @property
+    @abstractmethod
+    def is_enabled(self) -> bool:
+        pass
+
+    @abstractmethod
+    def set_enabled(self, is_enabled: bool) -> None:
+        pass
+
+    @abstractmethod
+    def record(self, stage: PipelineStage, duration_ns: int) -> None:
+        pass
+
+    @abstractmethod
+    def mark_frame(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_gauge(self, gauge: MetricGauge, value: float) -> None:
+        pass
+
+    @abstractmethod
+    def get_snapshot(self) -> MetricsSnapshot:
+        pass
+
+    @abstractmethod
+    def export(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_export(self, export_interval_seconds: float, export_path: Optional[str]) -> None:
+        pass
+
+    @abstractmethod
+    def start_export(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop_export(self) -> None:
+        pass
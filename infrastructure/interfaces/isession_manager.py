@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+from globals.enums.enums import SessionEventType
+from model.data_classes.replay_stats import ReplayStats
+from model.data_classes.session_event import SessionEvent
+
+
+class ISessionManager(ABC):
+
+    @abstractmethod
+    def set_handlers(self, handlers: Dict[SessionEventType, Callable[..., None]]) -> None:
+        pass
+
+    @abstractmethod
+    def is_recording(self) -> bool:
+        pass
+
+    @abstractmethod
+    def start_recording(self, path: Optional[str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def stop_recording(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def record(self, event_type: SessionEventType, frame_index: int, *values) -> None:
+        pass
+
+    @abstractmethod
+    def read_events(self, path: str) -> Optional[List[SessionEvent]]:
+        pass
+
+    @abstractmethod
+    def apply_event(self, event: SessionEvent) -> None:
+        pass
+
+    @abstractmethod
+    def is_replaying(self) -> bool:
+        pass
+
+    @abstractmethod
+    def is_replay_rendering(self) -> bool:
+        pass
+
+    @abstractmethod
+    def begin_replay(self, is_rendering: bool) -> None:
+        pass
+
+    @abstractmethod
+    def finish_replay(self, replay_stats: ReplayStats) -> None:
+        pass
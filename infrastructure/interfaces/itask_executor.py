@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from globals.enums.enums import TaskPriority
+from model.data_classes.task_stats import TaskStats
+
+
+class ITaskExecutor(ABC):
+
+    @abstractmethod
+    def submit(self, function: Callable[..., Any], *arguments: Any, priority: TaskPriority = TaskPriority.NORMAL,
+               delay_seconds: float = 0.0, on_done: Optional[Callable[[Future], None]] = None) -> Future:
+        pass
+
+    @abstractmethod
+    def schedule_periodic(self, function: Callable[[], Any], interval_seconds: float,
+                          priority: TaskPriority = TaskPriority.LOW,
+                          initial_delay_seconds: Optional[float] = None) -> Future:
+        pass
+
+    @abstractmethod
+    def submit_process(self, function: Callable[..., Any], *arguments: Any,
+                       on_done: Optional[Callable[[Future], None]] = None) -> Future:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> TaskStats:
+        pass
+
+    @abstractmethod
+    def shutdown(self, is_waiting: bool = True) -> None:
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from model.data_classes.thumbnails import Thumbnails
+
+
+class IThumbnailManager(ABC):
+
+    @abstractmethod
+    def get_thumbnails(self) -> Optional[Thumbnails]:
+        pass
+
+    @abstractmethod
+    def set_thumbnail_callback(self, callback: Optional[Callable[[int], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def set_playing(self, is_playing: bool) -> None:
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def cancel(self) -> None:
+        pass
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+import numpy as np
+
+from model.data_classes.track_snapshot import TrackSnapshot
+
+
+class ITrackingManager(ABC):
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_tracks_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def submit_frame(self, frame: np.ndarray, frame_index: int) -> None:
+        pass
+
+    @abstractmethod
+    def track_frame(self, frame: np.ndarray, frame_index: int) -> None:
+        pass
+
+    @abstractmethod
+    def add_point(self, x: float, y: float) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def remove_nearest(self, x: float, y: float, frame_index: int) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_snapshot(self, frame_index: int) -> TrackSnapshot:
+        pass
@@ -0,0 +1,129 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from globals.enums.enums import DecodePriority
+from model.data_classes.annotation_batch import AnnotationBatch
+from model.data_classes.frame_cache_stats import FrameCacheStats
+from model.data_classes.playback_stats import PlaybackStats
+from model.data_classes.point import Point
+from model.data_classes.track_snapshot import TrackSnapshot
+
+
+class IVideoManager(ABC):
+
+    @abstractmethod
+    def load_video(self) -> bool:
+        pass
+
+    @abstractmethod
+    def get_fps(self) -> float:
+        pass
+
+    @abstractmethod
+    def get_frame_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_frame_position(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_source_size(self) -> Optional[Tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def set_frame_ready_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def set_frame_listener(self, listener: Optional[Callable[[np.ndarray, int], None]]) -> None:
+        pass
+
+    @abstractmethod
+    def set_decode_downscaled(self, is_downscaled: bool) -> None:
+        pass
+
+    @abstractmethod
+    def set_decode_priority(self, priority: DecodePriority) -> None:
+        pass
+
+    @abstractmethod
+    def start_decoding(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop_decoding(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_paused(self, is_paused: bool) -> None:
+        pass
+
+    @abstractmethod
+    def get_speed(self) -> float:
+        pass
+
+    @abstractmethod
+    def set_speed(self, speed: float) -> None:
+        pass
+
+    @abstractmethod
+    def get_playback_stats(self) -> PlaybackStats:
+        pass
+
+    @abstractmethod
+    def get_next_frame_delay_ms(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_dropped_frames(self) -> int:
+        pass
+
+    @abstractmethod
+    def seek(self, frame_index: int) -> None:
+        pass
+
+    @abstractmethod
+    def seek_time(self, timestamp_ms: float) -> None:
+        pass
+
+    @abstractmethod
+    def step_frame(self, delta: int) -> bool:
+        pass
+
+    @abstractmethod
+    def get_frame_cache_stats(self) -> FrameCacheStats:
+        pass
+
+    @abstractmethod
+    def read_frame(self) -> bool:
+        pass
+
+    @abstractmethod
+    def get_current_frame(self) -> Optional[np.ndarray]:
+        pass
+
+    @abstractmethod
+    def get_current_frame_rgb(self) -> Optional[np.ndarray]:
+        pass
+
+    @abstractmethod
+    def set_display_size(self, width: int, height: int) -> None:
+        pass
+
+    @abstractmethod
+    def map_to_source(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        pass
+
+    @abstractmethod
+    def get_display_frame(self, click_point: Optional[Union[Point, Tuple[int, int]]],
+                          annotations: Optional[AnnotationBatch] = None,
+                          tracks: Optional[TrackSnapshot] = None,
+                          destination: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        pass
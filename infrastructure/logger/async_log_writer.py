@@ -0,0 +1,129 @@
+import atexit
+import logging
+from collections import deque
+from multiprocessing.util import Finalize
+from threading import Condition, Thread
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import LogOverflowPolicy
+
+
+class AsyncLogWriter:
+    # ? Callers only append a record to a bounded queue. One thread formats what queued up over a short
+    # ? interval, writes it with a single write per handler and flushes once per batch instead of per record.
+
+    def __init__(self, capacity: int = Consts.LOG_QUEUE_SIZE,
+                 overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST) -> None:
+        self._capacity = max(capacity, 1)
+        self._overflow_policy = overflow_policy
+        self._condition = Condition()
+        self._records: Deque[Tuple[Sequence[logging.Handler], logging.LogRecord]] = deque()
+        self._dropped_records = 0
+        self._is_writing = False
+        self._is_closed = False
+        self._flush_requests = 0
+        self._thread: Optional[Thread] = None
+
+    @property
+    def dropped_records(self) -> int:
+        return self._dropped_records
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._writer_thread_handle, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        # ? atexit does not run in multiprocessing children, their exit runs these finalizers instead
+        Finalize(self, self.close, exitpriority=0)
+
+    def put(self, handlers: Sequence[logging.Handler], record: logging.LogRecord) -> None:
+        with self._condition:
+            if self._is_closed:
+                return
+            if len(self._records) >= self._capacity:
+                if self._overflow_policy is LogOverflowPolicy.BLOCK:
+                    while len(self._records) >= self._capacity and not self._is_closed:
+                        self._condition.wait()
+                elif self._overflow_policy is LogOverflowPolicy.DROP_OLDEST:
+                    self._records.popleft()
+                    self._dropped_records += 1
+                else:
+                    self._dropped_records += 1
+                    return
+            self._records.append((handlers, record))
+            # ? The writer is only woken to start an interval or for a full batch, not for every record
+            if len(self._records) == 1 or len(self._records) == Consts.LOG_BATCH_SIZE:
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        # ? Returns once everything queued before the call is written
+        with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            while (self._records or self._is_writing) and self._thread is not None and self._thread.is_alive():
+                self._condition.wait()
+            self._flush_requests -= 1
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self.flush()
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+        self._thread.join(Consts.LOG_WRITER_JOIN_TIMEOUT)
+        self._thread = None
+
+    def _writer_thread_handle(self) -> None:
+        reported_drops = 0
+        while True:
+            with self._condition:
+                while not self._records and not self._is_closed:
+                    self._condition.wait()
+                if (len(self._records) < Consts.LOG_BATCH_SIZE and not self._is_closed and
+                        not self._flush_requests):
+                    # ? Lets records collect for one interval, unless a batch fills or someone flushes
+                    self._condition.wait(Consts.LOG_FLUSH_INTERVAL_SECONDS)
+                if not self._records:
+                    return
+                batch = [self._records.popleft()
+                         for _ in range(min(len(self._records), Consts.LOG_BATCH_SIZE))]
+                dropped_records = self._dropped_records - reported_drops
+                reported_drops = self._dropped_records
+                self._is_writing = True
+                # ? Room was made, blocked callers can go on while this batch is written
+                self._condition.notify_all()
+            try:
+                self._write(batch, dropped_records)
+            finally:
+                with self._condition:
+                    self._is_writing = False
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _write(batch: List[Tuple[Sequence[logging.Handler], logging.LogRecord]], dropped_records: int) -> None:
+        lines: Dict[logging.Handler, List[str]] = {}
+        if dropped_records:
+            handlers, record = batch[0]
+            warning = logging.LogRecord(record.name, logging.WARNING, "", 0,
+                                        LoggerMessages.LOG_RECORDS_DROPPED.format(dropped_records), None, None)
+            batch.insert(0, (handlers, warning))
+        for handlers, record in batch:
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    try:
+                        lines.setdefault(handler, []).append(handler.format(record) + handler.terminator)
+                    except Exception:
+                        handler.handleError(record)
+        for handler, handler_lines in lines.items():
+            handler.acquire()
+            try:
+                handler.stream.write("".join(handler_lines))
+                handler.flush()
+            except Exception:
+                handler.handleError(batch[-1][1])
+            finally:
+                handler.release()
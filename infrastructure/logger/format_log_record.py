@@ -0,0 +1,9 @@
+import logging
+
+
+class FormatLogRecord(logging.LogRecord):
+    # ? Arguments fill str.format placeholders like the ones in LoggerMessages, and the message is
+    # ? only built when a handler formats the record, on the writer thread in async mode
+    def getMessage(self) -> str:
+        message = str(self.msg)
+        return message.format(*self.args) if self.args else message
@@ -1,21 +1,60 @@
 import datetime
 import logging
 import os
-from typing import Dict
+from typing import Any, Dict, Optional
 from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import LogMode, LogOverflowPolicy
 from infrastructure.interfaces.ilogger_manager import ILoggerManager
+from infrastructure.logger.async_log_writer import AsyncLogWriter
+from infrastructure.logger.format_log_record import FormatLogRecord
 from globals.consts.const_collections import ConstCollections
 
 
 class LoggerManager(ILoggerManager):
-    def __init__(self):
+    def __init__(self, level: int = logging.DEBUG, mode: LogMode = LogMode.SYNC,
+                 queue_size: int = Consts.LOG_QUEUE_SIZE,
+                 overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST):
         self._loggers: Dict[str, logging.Logger] = {}
+        self._level = logging.DEBUG
+        self._writer: Optional[AsyncLogWriter] = None
+        self.configure(level, mode, queue_size, overflow_policy)
 
-    def log(self, log_name: str, msg: str, level=logging.DEBUG):
-        logger = self._get_or_create_logger(log_name, level)
-        logger.log(level, msg)
+    def configure(self, level: int, mode: LogMode, queue_size: int = Consts.LOG_QUEUE_SIZE,
+                  overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST) -> None:
+        self._level = level
+        for logger in self._loggers.values():
+            self._set_level(logger)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if mode is LogMode.ASYNC:
+            self._writer = AsyncLogWriter(queue_size, overflow_policy)
+            self._writer.start()
 
-    def _get_or_create_logger(self, log_name: str, level) -> logging.Logger:
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self._level
+
+    def log(self, log_name: str, msg: str, level=logging.DEBUG, *args: Any):
+        # ? Below the active level nothing is built, not even the record
+        if level < self._level:
+            return
+        logger = self._get_or_create_logger(log_name)
+        record = FormatLogRecord(log_name, level, "", 0, msg, args, None)
+        if self._writer is None:
+            logger.handle(record)
+        elif logger.handlers:
+            self._writer.put(logger.handlers, record)
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+            return
+        for logger in self._loggers.values():
+            for handler in logger.handlers:
+                handler.flush()
+
+    def _get_or_create_logger(self, log_name: str) -> logging.Logger:
         if log_name in self._loggers:
             return self._loggers[log_name]
 
@@ -25,27 +64,30 @@ class LoggerManager(ILoggerManager):
         os.makedirs(log_directory, exist_ok=True)
 
         logger = logging.getLogger(log_name)
-        logger.setLevel(level)
 
         if not logger.handlers:
             if (log_name in ConstCollections.LOG_NAMES_WITH_FILE):
-                self._add_file_handler(level, log_file_path, logger)
+                self._add_file_handler(log_file_path, logger)
             if (log_name in ConstCollections.LOG_NAMES_WITH_CONSOLE):
-                self._add_console_handler(level, logger)
+                self._add_console_handler(logger)
+        self._set_level(logger)
         self._loggers[log_name] = logger
         return logger
 
-    def _add_file_handler(self, level, log_file_path, logger):
+    def _set_level(self, logger: logging.Logger) -> None:
+        logger.setLevel(self._level)
+        for handler in logger.handlers:
+            handler.setLevel(self._level)
+
+    def _add_file_handler(self, log_file_path, logger):
         file_handler = logging.FileHandler(
             log_file_path, mode=ConstStrings.LOG_MODE)
-        file_handler.setLevel(level)
         formatter = logging.Formatter(ConstStrings.LOG_FORMATTER)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
-    def _add_console_handler(self, level, logger):
+    def _add_console_handler(self, logger):
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
         formatter = logging.Formatter(ConstStrings.LOG_FORMATTER)
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
@@ -0,0 +1,149 @@
+import json
+import logging
+import os
+import time
+from dataclasses import asdict
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import MetricGauge, PipelineStage
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.imetrics_manager import IMetricsManager
+from infrastructure.metrics.stage_histogram import StageHistogram
+from model.data_classes.metrics_snapshot import MetricsSnapshot
+
+
+class MetricsManager(IMetricsManager):
+    # ? Always-on timings of every stage a frame passes through. Recording is a few integer operations
+    # ? into preallocated memory, the sorting for percentiles happens when statistics are read, at HUD
+    # ? or export rate rather than frame rate.
+
+    def __init__(self, is_enabled: bool = True, export_interval_seconds: float = 0.0,
+                 export_path: Optional[str] = None) -> None:
+        self._is_enabled = is_enabled
+        self._histograms = {stage: StageHistogram() for stage in PipelineStage}
+        self._gauges: Dict[MetricGauge, float] = {}
+        self._frame_times = np.zeros(Consts.METRICS_FPS_WINDOW, dtype=np.int64)
+        self._frame_count = 0
+        self._export_interval_seconds = export_interval_seconds
+        self._export_path = export_path
+        self._export_stop = Event()
+        self._export_thread: Optional[Thread] = None
+        # ? Set between start_export and stop_export, the thread itself only runs while enabled with an interval
+        self._is_exporting = False
+        self._export_lock = Lock()
+        self._logger = LoggerFactory.get_logger_manager()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._is_enabled
+
+    def set_enabled(self, is_enabled: bool) -> None:
+        self._is_enabled = is_enabled
+        with self._export_lock:
+            if is_enabled:
+                self._start_export_thread()
+            else:
+                self._stop_export_thread()
+
+    def record(self, stage: PipelineStage, duration_ns: int) -> None:
+        if self._is_enabled:
+            self._histograms[stage].record(duration_ns)
+
+    def mark_frame(self) -> None:
+        # ? Called once per frame handed to the view, the fps shown is what reaches the screen
+        if self._is_enabled:
+            self._frame_times[self._frame_count % Consts.METRICS_FPS_WINDOW] = time.perf_counter_ns()
+            self._frame_count += 1
+
+    def set_gauge(self, gauge: MetricGauge, value: float) -> None:
+        if self._is_enabled:
+            self._gauges[gauge] = value
+
+    def get_snapshot(self) -> MetricsSnapshot:
+        stages = {stage.value: histogram.get_stats()
+                  for stage, histogram in self._histograms.items() if histogram.count}
+        gauges = {gauge.value: value for gauge, value in list(self._gauges.items())}
+        return MetricsSnapshot(stages, self._get_fps(), gauges)
+
+    def export(self) -> None:
+        line = json.dumps(self._to_record())
+        if not self._export_path:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.METRICS_SNAPSHOT, logging.DEBUG, line)
+            return
+        try:
+            directory = os.path.dirname(self._export_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self._export_path, "a") as export_file:
+                export_file.write(line + "\n")
+        except OSError as error:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.METRICS_EXPORT_FAILED, logging.DEBUG,
+                             self._export_path, error)
+
+    def set_export(self, export_interval_seconds: float, export_path: Optional[str]) -> None:
+        # ? A running export restarts on the new interval
+        with self._export_lock:
+            self._stop_export_thread()
+            self._export_interval_seconds = export_interval_seconds
+            self._export_path = export_path
+            self._start_export_thread()
+
+    def start_export(self) -> None:
+        with self._export_lock:
+            self._is_exporting = True
+            self._start_export_thread()
+
+    def stop_export(self) -> None:
+        with self._export_lock:
+            self._is_exporting = False
+            is_stopped = self._stop_export_thread()
+        if is_stopped:
+            # ? The last partial interval is not lost on exit
+            self.export()
+
+    def _start_export_thread(self) -> None:
+        if (not self._is_exporting or self._export_thread is not None or self._export_interval_seconds <= 0
+                or not self._is_enabled):
+            return
+        self._export_stop = Event()
+        self._export_thread = Thread(target=self._export_thread_handle, args=(self._export_stop,), daemon=True)
+        self._export_thread.start()
+
+    def _stop_export_thread(self) -> bool:
+        if self._export_thread is None:
+            return False
+        self._export_stop.set()
+        self._export_thread.join(Consts.METRICS_EXPORT_JOIN_TIMEOUT)
+        self._export_thread = None
+        return True
+
+    def _export_thread_handle(self, export_stop: Event) -> None:
+        # ? Waits on its own event, so a thread left behind by a timed out join still ends
+        interval_seconds = self._export_interval_seconds
+        while not export_stop.wait(interval_seconds):
+            self.export()
+
+    def _get_fps(self) -> float:
+        frame_count = self._frame_count
+        count = min(frame_count, Consts.METRICS_FPS_WINDOW)
+        if count < 2:
+            return 0.0
+        oldest = int(self._frame_times[(frame_count - count) % Consts.METRICS_FPS_WINDOW])
+        # ? Measured up to now rather than to the last frame, so a stalled display decays to 0
+        elapsed_ns = time.perf_counter_ns() - oldest
+        return count * Consts.NANOSECONDS_PER_SECOND / elapsed_ns if elapsed_ns > 0 else 0.0
+
+    def _to_record(self) -> Dict[str, Any]:
+        snapshot = self.get_snapshot()
+        stages = {}
+        for stage, histogram in self._histograms.items():
+            if stage.value in snapshot.stages:
+                stages[stage.value] = dict(asdict(snapshot.stages[stage.value]),
+                                           buckets_ms=histogram.get_buckets())
+        return {"timestamp": time.time(), "fps": snapshot.fps, "gauges": snapshot.gauges, "stages": stages}
@@ -0,0 +1,41 @@
+from typing import Dict
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from model.data_classes.stage_stats import StageStats
+
+
+class StageHistogram:
+    # ? Fixed memory however long the session runs: a ring of the latest durations for the rolling
+    # ? statistics, and log2 buckets counting every sample since the start for the export.
+    # ? Each stage is written by one thread only, a reader may see a sample half recorded,
+    # ? which only nudges a statistic, so there is no lock on the hot path.
+
+    def __init__(self, window: int = Consts.METRICS_WINDOW_SAMPLES) -> None:
+        self._window = window
+        self._samples = np.zeros(window, dtype=np.int64)
+        self._count = 0
+        # ? Bucket i counts durations below 2 ** i nanoseconds
+        self._buckets = [0] * Consts.METRICS_BUCKET_COUNT
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, duration_ns: int) -> None:
+        self._samples[self._count % self._window] = duration_ns
+        self._count += 1
+        self._buckets[min(duration_ns.bit_length(), Consts.METRICS_BUCKET_COUNT - 1)] += 1
+
+    def get_stats(self) -> StageStats:
+        recent = self._samples[:min(self._count, self._window)] / Consts.NANOSECONDS_PER_MILLISECOND
+        if not len(recent):
+            return StageStats()
+        p50, p99 = np.percentile(recent, (50, 99)).tolist()
+        return StageStats(self._count, float(recent.mean()), p50, p99, float(recent.max()))
+
+    def get_buckets(self) -> Dict[float, int]:
+        # ? Upper bound in milliseconds -> samples, empty buckets left out
+        return {(1 << index) / Consts.NANOSECONDS_PER_MILLISECOND: count
+                for index, count in enumerate(self._buckets) if count}
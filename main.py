@@ -1,15 +1,82 @@
+import time
+
+# ? Taken before anything else is imported, --measure-startup reports from here
+STARTUP_START = time.perf_counter()
+
+import argparse
 import sys
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from infrastructure.factories.manager_factory import ManagerFactory
+from infrastructure.factories.metrics_factory import MetricsFactory
 from infrastructure.factories.view_factory import ViewFactory
 
+IMPORTS_DONE = time.perf_counter()
+IS_CV2_LOADED_AT_IMPORTS = "cv2" in sys.modules
+
+
+def parse_grid(value: str):
+    rows, columns = value.lower().split("x")
+    return int(rows), int(columns)
+
+
+def measure_startup(main_page) -> None:
+    # ? Prints the time to each startup milestone and quits once the first frame is painted
+    milestones = [("imports", IMPORTS_DONE, IS_CV2_LOADED_AT_IMPORTS)]
+
+    def report() -> None:
+        for name, timestamp, is_cv2_loaded in milestones:
+            print(f"{name:<14}{(timestamp - STARTUP_START) * 1000.0:9.1f} ms   "
+                  f"cv2 {'loaded' if is_cv2_loaded else 'not loaded'}")
+        # ? Closed rather than quit, so the window stops its playback threads as it would for a user
+        main_page.close()
+
+    def mark(name: str) -> None:
+        milestones.append((name, time.perf_counter(), "cv2" in sys.modules))
+        if name == "first frame":
+            report()
+
+    # ? The first event loop pass after show is the one that paints the window
+    QTimer.singleShot(0, lambda: mark("window shown"))
+    if hasattr(main_page, "first_frame_painted_signal"):
+        main_page.first_frame_painted_signal.connect(lambda: mark("first frame"))
+    QTimer.singleShot(Consts.STARTUP_MEASURE_TIMEOUT_MS, report)
+
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--grid", type=parse_grid, metavar="ROWSxCOLUMNS",
+                        help="show several streams at once, e.g. --grid 4x4")
+    parser.add_argument("--sync-startup", action="store_true",
+                        help="open the video before showing the window instead of in the background")
+    parser.add_argument("--measure-startup", action="store_true",
+                        help="print the time to imports, window shown and first frame, then exit")
+    parser.add_argument("videos", nargs="*", help="video for the main window, or videos for the grid tiles "
+                                                  "reused in order")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
 
+    # ? Opened first, so it is the cached instance every later consumer gets
+    config_manager = InfrastructureFactory.create_config_manager(ConstStrings.GLOBAL_CONFIG_PATH, is_cached=True)
+    config_manager.watch()
     ManagerFactory.create_all()
-    main_page = ViewFactory.create_main_window()
+    metrics_manager = MetricsFactory.get_metrics_manager()
+    metrics_manager.start_export()
+    if args.grid:
+        main_page = ViewFactory.create_grid_window(*args.grid, args.videos)
+    else:
+        main_page = ViewFactory.create_main_window(not args.sync_startup, args.videos[0] if args.videos else None)
     main_page.show()
+    if args.measure_startup:
+        measure_startup(main_page)
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    metrics_manager.stop_export()
+    ManagerFactory.create_task_executor().shutdown()
+    config_manager.stop_watching()
+    sys.exit(exit_code)
@@ -0,0 +1,361 @@
+import io
+import os
+import warnings
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from globals.consts.const_collections import ConstCollections
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import AnnotationAction
+from model.data_classes.annotation_batch import AnnotationBatch
+
+
+class AnnotationStore:
+    # ? Points live in parallel NumPy columns sorted by frame, so a frame or range lookup is two
+    # ? binary searches. A permutation of the sorted part by timestamp does the same for time ranges.
+    # ? New points go to a small unsorted tail that is merged in once it fills up.
+
+    def __init__(self, tail_capacity: int = Consts.ANNOTATION_TAIL_CAPACITY,
+                 undo_limit: int = Consts.ANNOTATION_UNDO_LIMIT) -> None:
+        self._main = self._empty_columns(0)
+        # ? Rows of the sorted part in timestamp order, and their timestamps in that order
+        self._time_order = np.empty(0, dtype=np.int64)
+        self._sorted_times = np.empty(0, dtype=ConstCollections.ANNOTATION_COLUMNS["timestamp_ms"])
+        self._tail = self._empty_columns(tail_capacity)
+        self._tail_count = 0
+        self._next_id = 0
+        self._version = 0
+        self._undo_stack: Deque[Tuple[AnnotationAction, object]] = deque(maxlen=undo_limit)
+
+    def __len__(self) -> int:
+        return len(self._main["id"]) + self._tail_count
+
+    @property
+    def version(self) -> int:
+        # ? Bumped on every change, lets renderers cache what they drew
+        return self._version
+
+    def can_undo(self) -> bool:
+        return bool(self._undo_stack)
+
+    def add(self, frame: int, x: int, y: int, label: int = Consts.DEFAULT_ANNOTATION_LABEL,
+            timestamp_ms: float = 0.0) -> int:
+        return int(self.add_many(np.array([frame]), np.array([x]), np.array([y]),
+                                 np.array([label]), np.array([timestamp_ms]))[0])
+
+    def add_many(self, frames: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                 labels: Optional[np.ndarray] = None, timestamps_ms: Optional[np.ndarray] = None) -> np.ndarray:
+        count = len(frames)
+        ids = self._add_columns({
+            "frame": frames,
+            "x": xs,
+            "y": ys,
+            "label": labels if labels is not None else np.full(count, Consts.DEFAULT_ANNOTATION_LABEL),
+            "timestamp_ms": timestamps_ms if timestamps_ms is not None else np.zeros(count),
+        })
+        self._undo_stack.append((AnnotationAction.ADD, ids))
+        return ids
+
+    def remove(self, ids: np.ndarray) -> int:
+        removed = self._remove_ids(np.asarray(ids, dtype=np.int64))
+        if len(removed):
+            self._undo_stack.append((AnnotationAction.REMOVE, removed))
+        return len(removed)
+
+    def remove_nearest(self, frame: int, x: int, y: int,
+                       max_distance: float = Consts.ANNOTATION_HIT_RADIUS) -> Optional[int]:
+        annotation_id = self.nearest(frame, x, y, max_distance)
+        if annotation_id is not None:
+            self.remove(np.array([annotation_id]))
+        return annotation_id
+
+    def clear(self) -> int:
+        removed = self._remove_all()
+        if len(removed):
+            self._undo_stack.append((AnnotationAction.REMOVE, removed))
+        return len(removed)
+
+    def undo(self) -> bool:
+        if not self._undo_stack:
+            return False
+        action, payload = self._undo_stack.pop()
+        if action is AnnotationAction.ADD:
+            self._remove_ids(payload)
+        elif action is AnnotationAction.REPLACE:
+            removed, added_ids = payload
+            self._remove_ids(added_ids)
+            if len(removed):
+                self._insert(self._to_columns(removed))
+        else:
+            # ? Removed points come back with their original ids
+            self._insert(self._to_columns(payload))
+        return True
+
+    def nearest(self, frame: int, x: int, y: int, max_distance: float = np.inf) -> Optional[int]:
+        batch = self.get_frame(frame)
+        if not len(batch):
+            return None
+        dx = batch.xs.astype(np.int64) - x
+        dy = batch.ys.astype(np.int64) - y
+        distances = dx * dx + dy * dy
+        index = int(np.argmin(distances))
+        if distances[index] > max_distance * max_distance:
+            return None
+        return int(batch.ids[index])
+
+    def get_frame(self, frame: int) -> AnnotationBatch:
+        return self.get_frame_range(frame, frame)
+
+    def get_frame_range(self, start_frame: int, end_frame: int) -> AnnotationBatch:
+        # ? Inclusive on both ends
+        return self._query("frame", start_frame, end_frame)
+
+    def get_time_range(self, start_ms: float, end_ms: float) -> AnnotationBatch:
+        # ? Inclusive on both ends. Timestamps need not follow frame order, the search runs on the
+        # ? timestamp permutation and the rows found are put back in frame order.
+        return self._query("timestamp_ms", start_ms, end_ms)
+
+    def get_all(self) -> AnnotationBatch:
+        return self.get_frame_range(np.iinfo(np.int32).min, np.iinfo(np.int32).max)
+
+    def export_file(self, path: str) -> int:
+        columns = self._to_columns(self.get_all())
+        if path.lower().endswith(ConstStrings.ANNOTATION_NPZ_SUFFIX):
+            np.savez(path, **columns)
+        else:
+            table = np.column_stack([columns[name].astype(np.float64) for name in columns])
+            formats = ["%d" if np.issubdtype(dtype, np.integer) else "%.3f"
+                       for dtype in ConstCollections.ANNOTATION_COLUMNS.values()]
+            np.savetxt(path, table, fmt=formats, delimiter=ConstStrings.ANNOTATION_CSV_DELIMITER,
+                       header=ConstStrings.ANNOTATION_CSV_DELIMITER.join(columns), comments="")
+        return len(columns["id"])
+
+    def import_file(self, path: str, is_replacing: bool = False) -> int:
+        # ? Imported points get fresh ids so they never collide with the ones already here, which also
+        # ? means importing the same file twice adds its points twice. Replacing removes every point
+        # ? first, and one undo brings them back.
+        if path.lower().endswith(ConstStrings.ANNOTATION_NPZ_SUFFIX):
+            with np.load(path) as data:
+                columns = {name: data[name] for name in ConstCollections.ANNOTATION_COLUMNS}
+        else:
+            columns = self._read_csv(path)
+        if is_replacing:
+            removed = self._remove_all()
+            added_ids = self._add_columns(columns) if len(columns["id"]) else np.empty(0, dtype=np.int64)
+            if len(removed) or len(added_ids):
+                self._undo_stack.append((AnnotationAction.REPLACE, (removed, added_ids)))
+            return len(added_ids)
+        if not len(columns["id"]):
+            return 0
+        self.add_many(columns["frame"], columns["x"], columns["y"], columns["label"], columns["timestamp_ms"])
+        return len(columns["id"])
+
+    def save_snapshot(self) -> bytes:
+        # ? The points, the ids still to hand out and the undo history, so a restored store behaves
+        # ? exactly like this one: the same undo steps, and new points get the same ids
+        snapshot = {name: column for name, column in self._to_columns(self.get_all()).items()}
+        actions, removed, added = [], [], []
+        for action, payload in self._undo_stack:
+            if action is AnnotationAction.ADD:
+                batch, ids = None, payload
+            elif action is AnnotationAction.REMOVE:
+                batch, ids = payload, None
+            else:
+                batch, ids = payload
+            actions.append(action.value)
+            removed.append(self._to_columns(batch) if batch is not None else self._empty_columns(0))
+            added.append(ids if ids is not None else np.empty(0, dtype=np.int64))
+        snapshot[ConstStrings.ANNOTATION_SNAPSHOT_NEXT_ID] = np.array(self._next_id, dtype=np.int64)
+        snapshot[ConstStrings.ANNOTATION_SNAPSHOT_ACTIONS] = np.array(actions, dtype=np.int8)
+        snapshot[ConstStrings.ANNOTATION_SNAPSHOT_REMOVED_COUNTS] = np.array(
+            [len(columns["id"]) for columns in removed], dtype=np.int64)
+        snapshot[ConstStrings.ANNOTATION_SNAPSHOT_ADDED_COUNTS] = np.array([len(ids) for ids in added],
+                                                                            dtype=np.int64)
+        snapshot[ConstStrings.ANNOTATION_SNAPSHOT_ADDED_IDS] = np.concatenate(
+            added or [np.empty(0, dtype=np.int64)]).astype(np.int64)
+        for name, dtype in ConstCollections.ANNOTATION_COLUMNS.items():
+            snapshot[ConstStrings.ANNOTATION_SNAPSHOT_REMOVED_PREFIX + name] = np.concatenate(
+                [columns[name] for columns in removed] or [np.empty(0, dtype=dtype)]).astype(dtype)
+        buffer = io.BytesIO()
+        np.savez(buffer, **snapshot)
+        return buffer.getvalue()
+
+    def restore_snapshot(self, snapshot: bytes) -> None:
+        # ? Replaces the points and the undo history with those saved by save_snapshot
+        with np.load(io.BytesIO(snapshot)) as data:
+            columns = {name: data[name] for name in ConstCollections.ANNOTATION_COLUMNS}
+            removed = {name: data[ConstStrings.ANNOTATION_SNAPSHOT_REMOVED_PREFIX + name]
+                       for name in ConstCollections.ANNOTATION_COLUMNS}
+            actions = data[ConstStrings.ANNOTATION_SNAPSHOT_ACTIONS]
+            removed_ends = np.cumsum(data[ConstStrings.ANNOTATION_SNAPSHOT_REMOVED_COUNTS])
+            added_ends = np.cumsum(data[ConstStrings.ANNOTATION_SNAPSHOT_ADDED_COUNTS])
+            added_ids = data[ConstStrings.ANNOTATION_SNAPSHOT_ADDED_IDS]
+            next_id = int(data[ConstStrings.ANNOTATION_SNAPSHOT_NEXT_ID])
+        self.reset()
+        if len(columns["id"]):
+            self._insert(columns)
+        self._next_id = next_id
+        removed_start = added_start = 0
+        for action_value, removed_end, added_end in zip(actions, removed_ends, added_ends):
+            action = AnnotationAction(int(action_value))
+            batch = self._to_batch({name: column[removed_start:removed_end] for name, column in removed.items()})
+            ids = added_ids[added_start:added_end]
+            if action is AnnotationAction.ADD:
+                self._undo_stack.append((action, ids))
+            elif action is AnnotationAction.REMOVE:
+                self._undo_stack.append((action, batch))
+            else:
+                self._undo_stack.append((action, (batch, ids)))
+            removed_start, added_start = removed_end, added_end
+
+    def reset(self) -> None:
+        # ? Drops every point and the undo history, unlike clear() this cannot be undone
+        self._clear_main()
+        self._tail_count = 0
+        self._next_id = 0
+        self._undo_stack.clear()
+        self._version += 1
+
+    @staticmethod
+    def is_supported_file(path: str) -> bool:
+        return os.path.splitext(path)[1].lower() in (ConstStrings.ANNOTATION_CSV_SUFFIX,
+                                                     ConstStrings.ANNOTATION_NPZ_SUFFIX)
+
+    @staticmethod
+    def _read_csv(path: str) -> Dict[str, np.ndarray]:
+        # ? Columns are found by the header, a file with only the header, as an empty store exports, has no points
+        with open(path) as csv_file:
+            header = csv_file.readline().strip().split(ConstStrings.ANNOTATION_CSV_DELIMITER)
+        missing = [name for name in ConstCollections.ANNOTATION_COLUMNS if name not in header]
+        if missing:
+            raise ValueError(f"missing columns {', '.join(missing)}")
+        with warnings.catch_warnings():
+            # ? NumPy warns about a file without rows, here that is an empty import
+            warnings.simplefilter("ignore", UserWarning)
+            table = np.loadtxt(path, delimiter=ConstStrings.ANNOTATION_CSV_DELIMITER, skiprows=1, ndmin=2)
+        if table.size == 0:
+            return AnnotationStore._empty_columns(0)
+        if table.shape[1] != len(header):
+            raise ValueError(f"{table.shape[1]} values per row for {len(header)} columns")
+        return {name: table[:, header.index(name)] for name in ConstCollections.ANNOTATION_COLUMNS}
+
+    @staticmethod
+    def _empty_columns(size: int) -> Dict[str, np.ndarray]:
+        return {name: np.empty(size, dtype=dtype) for name, dtype in ConstCollections.ANNOTATION_COLUMNS.items()}
+
+    def _add_columns(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        # ? Inserts the points under fresh ids, without an undo step of its own
+        count = len(columns["frame"])
+        ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        self._next_id += count
+        self._insert({**columns, "id": ids})
+        return ids
+
+    def _remove_all(self) -> AnnotationBatch:
+        removed = self._to_batch(self._collect(slice(None), np.ones(self._tail_count, dtype=bool)))
+        if len(removed):
+            self._clear_main()
+            self._tail_count = 0
+            self._version += 1
+        return removed
+
+    def _insert(self, columns: Dict[str, np.ndarray]) -> None:
+        count = len(columns["id"])
+        tail_capacity = len(self._tail["id"])
+        if self._tail_count + count > tail_capacity:
+            self._merge_tail()
+        if count > tail_capacity:
+            self._merge(columns)
+        else:
+            end = self._tail_count + count
+            for name, column in self._tail.items():
+                column[self._tail_count:end] = columns[name]
+            self._tail_count = end
+        self._version += 1
+
+    def _merge_tail(self) -> None:
+        if self._tail_count:
+            self._merge({name: column[:self._tail_count] for name, column in self._tail.items()})
+            self._tail_count = 0
+
+    def _clear_main(self) -> None:
+        self._main = self._empty_columns(0)
+        self._time_order = np.empty(0, dtype=np.int64)
+        self._sorted_times = self._main["timestamp_ms"]
+
+    def _merge(self, columns: Dict[str, np.ndarray]) -> None:
+        # ? Only the new points are sorted, np.insert then places them in one O(n) pass
+        order = np.argsort(columns["frame"], kind="stable")
+        positions = np.searchsorted(self._main["frame"], columns["frame"][order], side="right")
+        # ? The k-th point inserted lands at positions[k] + k, the rows after an insert move down by
+        # ? the points inserted before them. The timestamp order is merged the same way.
+        new_rows = positions + np.arange(len(positions))
+        times = columns["timestamp_ms"][order].astype(self._sorted_times.dtype)
+        time_rank = np.argsort(times, kind="stable")
+        time_positions = np.searchsorted(self._sorted_times, times[time_rank], side="right")
+        shifted_order = self._time_order + np.searchsorted(positions, self._time_order, side="right")
+        self._time_order = np.insert(shifted_order, time_positions, new_rows[time_rank])
+        self._sorted_times = np.insert(self._sorted_times, time_positions, times[time_rank])
+        for name, dtype in ConstCollections.ANNOTATION_COLUMNS.items():
+            self._main[name] = np.insert(self._main[name], positions, columns[name][order].astype(dtype))
+
+    def _remove_ids(self, ids: np.ndarray) -> AnnotationBatch:
+        main_hit = np.isin(self._main["id"], ids)
+        tail_hit = np.isin(self._tail["id"][:self._tail_count], ids)
+        removed = self._to_batch(self._collect(main_hit, tail_hit))
+        if not len(removed):
+            return removed
+        if main_hit.any():
+            keep = ~main_hit
+            self._main = {name: column[keep] for name, column in self._main.items()}
+            # ? Kept rows keep their timestamp order, renumbered to their rows after the removal
+            is_kept = keep[self._time_order]
+            self._time_order = (np.cumsum(keep) - 1)[self._time_order[is_kept]]
+            self._sorted_times = self._sorted_times[is_kept]
+        if tail_hit.any():
+            # ? Compacted in place, the tail keeps its preallocated columns
+            keep = ~tail_hit
+            kept_count = int(np.count_nonzero(keep))
+            for column in self._tail.values():
+                column[:kept_count] = column[:self._tail_count][keep]
+            self._tail_count = kept_count
+        self._version += 1
+        return removed
+
+    def _query(self, key: str, start, end) -> AnnotationBatch:
+        main_key = self._main[key]
+        # ? Bounds are cast to the column type, a mismatched scalar would make NumPy convert the whole column
+        start, end = main_key.dtype.type(start), main_key.dtype.type(end)
+        if key == "frame":
+            # ? The main columns are ordered by frame
+            main_selection = slice(np.searchsorted(main_key, start, side="left"),
+                                   np.searchsorted(main_key, end, side="right"))
+        else:
+            rows = self._time_order[np.searchsorted(self._sorted_times, start, side="left"):
+                                    np.searchsorted(self._sorted_times, end, side="right")]
+            main_selection = np.sort(rows)
+        tail_key = self._tail[key][:self._tail_count]
+        tail_mask = (tail_key >= start) & (tail_key <= end)
+        batch = self._to_batch(self._collect(main_selection, tail_mask))
+        batch.cache_key = (self._version, key, start, end)
+        return batch
+
+    def _collect(self, main_selection, tail_mask: np.ndarray) -> Dict[str, np.ndarray]:
+        if not tail_mask.any():
+            # ? A slice gives views into the sorted columns, nothing is copied, a mask copies what it selects
+            return {name: column[main_selection] for name, column in self._main.items()}
+        return {name: np.concatenate((column[main_selection], self._tail[name][:self._tail_count][tail_mask]))
+                for name, column in self._main.items()}
+
+    @staticmethod
+    def _to_batch(columns: Dict[str, np.ndarray]) -> AnnotationBatch:
+        return AnnotationBatch(columns["id"], columns["frame"], columns["x"], columns["y"],
+                               columns["label"], columns["timestamp_ms"])
+
+    @staticmethod
+    def _to_columns(batch: AnnotationBatch) -> Dict[str, np.ndarray]:
+        return {"id": batch.ids, "frame": batch.frames, "x": batch.xs, "y": batch.ys,
+                "label": batch.labels, "timestamp_ms": batch.timestamps_ms}
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Hashable, Optional
+
+import numpy as np
+
+
+@dataclass
+class AnnotationBatch:
+    ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    frames: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    xs: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    ys: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    labels: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    timestamps_ms: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    # ? Same key means same content, renderers reuse what they drew for it
+    cache_key: Optional[Hashable] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class BatchJob:
+    video_path: str
+    output_path: str
+    output_format: str
+    points_path: Optional[str] = None
+    is_tracking: bool = False
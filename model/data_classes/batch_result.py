@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class BatchResult:
+    video_path: str
+    output_path: str
+    frame_count: int = 0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def fps(self) -> float:
+        return self.frame_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass
+class DecodeWorkerSettings:
+    video_path: str
+    ring_name: str
+    slot_count: int
+    frame_width: int
+    frame_height: int
+    buffer_capacity: int
+    drop_policy: str
+    start_frame: int
+    output_size: Tuple[int, int]
+    speed: float = 1.0
+    is_paused: bool = False
+    # ? As the parent has it, the worker does not read the config itself
+    is_metrics_enabled: bool = True
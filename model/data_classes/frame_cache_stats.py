@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FrameCacheStats:
+    entries: int = 0
+    # ? Entries kept downscaled, part of entries
+    reduced_entries: int = 0
+    used_bytes: int = 0
+    budget_bytes: int = 0
+    hits: int = 0
+    # ? Hits served from a downscaled entry, part of hits
+    reduced_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
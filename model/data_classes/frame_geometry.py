@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass
+class FrameGeometry:
+    source_width: int
+    source_height: int
+    display_width: int
+    display_height: int
+
+    @property
+    def is_identity(self) -> bool:
+        return (self.source_width == self.display_width and
+                self.source_height == self.display_height)
+
+    def to_source(self, x: int, y: int) -> Tuple[int, int]:
+        # ? Maps the centre of the display pixel, so to_display(to_source(p)) == p when downscaling
+        source_x = int((x + 0.5) * self.source_width / self.display_width)
+        source_y = int((y + 0.5) * self.source_height / self.display_height)
+        return (min(max(source_x, 0), self.source_width - 1),
+                min(max(source_y, 0), self.source_height - 1))
+
+    def to_display(self, x: int, y: int) -> Tuple[int, int]:
+        display_x = int((x + 0.5) * self.display_width / self.source_width)
+        display_y = int((y + 0.5) * self.display_height / self.source_height)
+        return (min(max(display_x, 0), self.display_width - 1),
+                min(max(display_y, 0), self.display_height - 1))
+
+    def to_display_array(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # ? Same mapping as to_display for a whole column of points at once
+        display_xs = ((xs + 0.5) * (self.display_width / self.source_width)).astype(np.int32)
+        display_ys = ((ys + 0.5) * (self.display_height / self.source_height)).astype(np.int32)
+        return (np.clip(display_xs, 0, self.display_width - 1),
+                np.clip(display_ys, 0, self.display_height - 1))
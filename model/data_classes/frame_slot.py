@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from globals.enums.enums import SlotState
+
+
+@dataclass
+class FrameSlot:
+    frame: Optional[np.ndarray] = None
+    frame_index: int = -1
+    pts_ms: float = 0.0
+    sequence: int = 0
+    state: SlotState = SlotState.FREE
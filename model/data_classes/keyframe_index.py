@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class KeyframeIndex:
+    frame_count: int
+    fps: float
+    keyframes: np.ndarray
+
+    def nearest_keyframe(self, frame_index: int) -> Optional[int]:
+        if len(self.keyframes) == 0:
+            return None
+        position = int(np.searchsorted(self.keyframes, frame_index, side="right")) - 1
+        return int(self.keyframes[max(position, 0)])
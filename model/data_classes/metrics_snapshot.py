@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+from model.data_classes.stage_stats import StageStats
+
+
+@dataclass
+class MetricsSnapshot:
+    # ? Keyed by PipelineStage and MetricGauge values, stages without samples are left out
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    fps: float = 0.0
+    gauges: Dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PlaybackStats:
+    displayed_frames: int = 0
+    dropped_frames: int = 0
+    late_frames: int = 0
+    drift_ms: float = 0.0
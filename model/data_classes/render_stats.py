@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RenderStats:
+    performed: int = 0
+    skipped: int = 0
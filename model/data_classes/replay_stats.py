@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ReplayStats:
+    events: int = 0
+    frames: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
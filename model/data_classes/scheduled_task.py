@@ -0,0 +1,19 @@
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Tuple
+
+from globals.enums.enums import TaskPriority
+
+
+@dataclass
+class ScheduledTask:
+    function: Callable[..., Any]
+    arguments: Tuple[Any, ...] = ()
+    priority: TaskPriority = TaskPriority.NORMAL
+    future: Future = field(default_factory=Future)
+    # ? perf_counter_ns when the task may run next, 0 for as soon as a worker is free
+    due_ns: int = 0
+    # ? Repeats this long after each run ends until its future is cancelled, 0 runs once
+    interval_ns: int = 0
+    # ? perf_counter_ns when the task became ready to run, the start of its queue wait
+    ready_ns: int = 0
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from globals.enums.enums import SessionEventType
+
+
+@dataclass
+class SessionEvent:
+    event_type: SessionEventType
+    elapsed_ms: int
+    frame_index: int
+    values: Tuple = ()
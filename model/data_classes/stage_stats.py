@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+
+from model.data_classes.stage_stats import StageStats
+
+
+@dataclass
+class TaskStats:
+    queued: int = 0
+    # ? Delayed and periodic tasks waiting for their time
+    scheduled: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    # ? From ready to started, and from started to finished
+    wait: StageStats = field(default_factory=StageStats)
+    run: StageStats = field(default_factory=StageStats)
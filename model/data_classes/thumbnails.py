@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class Thumbnails:
+    # ? (count, height, width, 3) RGB, slot i covers the i-th equal part of the video
+    images: np.ndarray = field(default_factory=lambda: np.empty((0, 0, 0, 3), dtype=np.uint8))
+    # ? The frame each filled slot shows
+    frame_indices: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    is_filled: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.bool_))
+
+    def __len__(self) -> int:
+        return len(self.images)
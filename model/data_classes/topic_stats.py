@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TopicStats:
+    published: int = 0
+    delivered: int = 0
+    # ? Overwritten by a newer value before delivery, on coalescing subscriptions
+    coalesced: int = 0
+    # ? Pushed out of a full subscriber queue
+    dropped: int = 0
+    subscribers: int = 0
+    # ? Per second, since the previous read
+    publish_rate: float = 0.0
+    deliver_rate: float = 0.0
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+
+
+@dataclass
+class TrackSnapshot:
+    frame_index: int = -1
+    ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    # ? Source pixels, sub-pixel precise
+    xs: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    ys: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    # ? One (n, 2) array of recent source positions per track, oldest first
+    trails: List[np.ndarray] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import BatchOutput
+from model.annotations.annotation_store import AnnotationStore
+from model.data_classes.batch_job import BatchJob
+from model.data_classes.batch_result import BatchResult
+from model.managers.tracking_manager import TrackingManager
+from model.managers.video_manager import VideoManager
+
+
+class BatchManager:
+    # ? Runs the overlay pipeline without a GUI, one video per worker process. Each video is streamed
+    # ? frame by frame through the same buffers, so memory stays at a few frames whatever its length.
+
+    def __init__(self, workers: int = 0) -> None:
+        self._workers = workers if workers > 0 else os.cpu_count() or 1
+
+    @staticmethod
+    def create_jobs(video_paths: List[str], output_dir: str, output_format: BatchOutput,
+                    points_dir: Optional[str] = None, is_tracking: bool = False) -> List[BatchJob]:
+        suffix = (ConstStrings.BATCH_VIDEO_SUFFIX if output_format is BatchOutput.VIDEO
+                  else ConstStrings.BATCH_COORDINATES_SUFFIX)
+        jobs = []
+        for video_path in video_paths:
+            stem = os.path.splitext(os.path.basename(video_path))[0]
+            output_path = os.path.join(output_dir, stem + suffix)
+            jobs.append(BatchJob(video_path, output_path, output_format.value,
+                                 BatchManager._find_points(video_path, points_dir), is_tracking))
+        return jobs
+
+    def run(self, jobs: List[BatchJob]) -> Iterator[BatchResult]:
+        # ? Yields each result as soon as its video is done
+        context = multiprocessing.get_context(ConstStrings.PROCESS_START_METHOD)
+        with ProcessPoolExecutor(min(self._workers, len(jobs)) or 1, mp_context=context,
+                                 initializer=BatchManager._init_worker) as executor:
+            futures = {executor.submit(BatchManager.process_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    yield future.result()
+                except Exception as error:
+                    yield BatchResult(job.video_path, job.output_path, error=str(error))
+
+    @staticmethod
+    def process_job(job: BatchJob) -> BatchResult:
+        start = time.perf_counter()
+        video_manager = VideoManager(job.video_path, Consts.MIN_FRAME_BUFFER_CAPACITY,
+                                     decode_threads=Consts.BATCH_DECODE_THREADS)
+        if not video_manager.load_video() or video_manager.get_source_size() is None:
+            video_manager.release()
+            return BatchResult(job.video_path, job.output_path, error="cannot open video")
+        width, height = video_manager.get_source_size()
+        video_manager.set_display_size(width, height)
+        annotation_store = AnnotationStore()
+        if job.points_path:
+            annotation_store.import_file(job.points_path)
+        tracking_manager = TrackingManager(width, height) if job.is_tracking else None
+        # ? The listener sees the decoded frame itself, frames without an overlay are written as they are
+        decoded = []
+
+        def on_frame(frame: np.ndarray, frame_index: int) -> None:
+            decoded[:] = [frame]
+            if tracking_manager is not None:
+                # ? Stored points start a track on their own frame
+                seeds = annotation_store.get_frame(frame_index)
+                for x, y in zip(seeds.xs.tolist(), seeds.ys.tolist()):
+                    tracking_manager.add_point(x, y)
+                tracking_manager.track_frame(frame, frame_index)
+
+        video_manager.set_frame_listener(on_frame)
+        is_video = BatchOutput(job.output_format) is BatchOutput.VIDEO
+        if is_video:
+            writer = cv2.VideoWriter(job.output_path, cv2.VideoWriter_fourcc(*ConstStrings.BATCH_VIDEO_FOURCC),
+                                     video_manager.get_fps(), (width, height))
+        else:
+            writer = open(job.output_path, "w")
+            writer.write(ConstStrings.BATCH_COORDINATES_HEADER + "\n")
+        output_frame = np.empty((height, width, Consts.FRAME_CHANNELS), dtype=np.uint8)
+        frame_count = 0
+        try:
+            while video_manager.read_frame():
+                frame_index = video_manager.get_frame_position()
+                if frame_index < frame_count:
+                    # ? The manager loops back to the first frame at the end
+                    break
+                frame_count += 1
+                annotations, tracks = annotation_store.get_frame(frame_index), None
+                if tracking_manager is not None:
+                    annotations, tracks = None, tracking_manager.get_snapshot(frame_index)
+                if not is_video:
+                    BatchManager._write_coordinates(writer, frame_index, annotations, tracks)
+                elif not annotations and not tracks:
+                    writer.write(decoded[0])
+                else:
+                    frame_rgb = video_manager.get_display_frame(None, annotations, tracks)
+                    writer.write(cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR, dst=output_frame))
+        finally:
+            if is_video:
+                writer.release()
+            else:
+                writer.close()
+            video_manager.release()
+        return BatchResult(job.video_path, job.output_path, frame_count, time.perf_counter() - start)
+
+    @staticmethod
+    def _init_worker() -> None:
+        # ? Parallelism comes from the processes, OpenCV's own threads would only compete with them
+        cv2.setNumThreads(Consts.BATCH_DECODE_THREADS)
+
+    @staticmethod
+    def _find_points(video_path: str, points_dir: Optional[str]) -> Optional[str]:
+        stem = os.path.splitext(os.path.basename(video_path))[0]
+        directory = points_dir or os.path.dirname(video_path)
+        for suffix in (ConstStrings.ANNOTATION_CSV_SUFFIX, ConstStrings.ANNOTATION_NPZ_SUFFIX):
+            points_path = os.path.join(directory, stem + suffix)
+            if os.path.isfile(points_path):
+                return points_path
+        return None
+
+    @staticmethod
+    def _write_coordinates(output, frame_index: int, annotations, tracks) -> None:
+        points = tracks if tracks is not None else annotations
+        if not len(points):
+            return
+        output.write("".join(f"{frame_index},{point_id},{x:.2f},{y:.2f}\n"
+                             for point_id, x, y in zip(points.ids.tolist(), points.xs.tolist(),
+                                                       points.ys.tolist())))
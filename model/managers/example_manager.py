@@ -1,7 +1,8 @@
-from threading import Thread
-import time
+import logging
+from typing import Tuple
 from globals.consts.const_strings import ConstStrings
-from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DeliveryMode, Topic
 from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from infrastructure.factories.logger_factory import LoggerFactory
 from infrastructure.interfaces.iexample_manager import IExampleManager
@@ -12,18 +13,11 @@ class ExampleManager(IExampleManager):
     def __init__(self, config_manager: IConfigManager) -> None:
         self._logger = LoggerFactory.get_logger_manager()
         self._event_bus = InfrastructureFactory.create_event_bus()
-        self._working_thread = Thread(
-            target=self._working_thread_handle, daemon=True)
 
     def start(self) -> None:
-        self._event_bus.send_coordinates_signal.connect(
-             self._send_coordinates_signal_slot)
-        self._working_thread.start()
-        
+        # ? On a thread of its own, only the latest point, a tracked point moves every frame
+        self._event_bus.subscribe(Topic.COORDINATES, self._on_coordinates, DeliveryMode.WORKER, is_coalesced=True)
 
-    def _working_thread_handle(self) -> None:
-        while True:
-            time.sleep(Consts.WORKING_LOOP_DELAY)
-
-    def _send_coordinates_signal_slot(self, x: int, y: int) -> None:
-        self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Video clicked at X={x}, Y={y}")
\ No newline at end of file
+    def _on_coordinates(self, point: Tuple[int, int]) -> None:
+        # ? Runs for every tracked frame too, so the message is only built on the log writer
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_CLICKED, logging.DEBUG, *point)
\ No newline at end of file
@@ -0,0 +1,176 @@
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import TaskPriority
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.iframe_store_manager import IFrameStoreManager
+from infrastructure.interfaces.itask_executor import ITaskExecutor
+from model.pipeline.frame_store import FrameStore
+
+
+class FrameStoreManager(IFrameStoreManager):
+    # ? Decodes a video once, front to back, into its frame store with one low priority task per chunk
+    # ? of frames on the shared executor, the way the thumbnails are filled. The decoder is its own and
+    # ? single threaded and writes straight into the mapped file. While the video plays, each task waits
+    # ? before the next, so playback decoding keeps the CPU. The store is read from the next time the
+    # ? video is opened, a store cut short is continued from its last flushed frame.
+
+    def __init__(self, video_path: str, height: int, max_bytes: int, task_executor: ITaskExecutor,
+                 keyframe_index: Future) -> None:
+        self._video_path = video_path
+        # ? The build shared with the video manager, the first task is only submitted once it is done
+        self._keyframe_index = keyframe_index
+        # ? As configured, 0 keeps the source height. Part of the store's name.
+        self._height = height
+        self._max_bytes = max_bytes
+        self._task_executor = task_executor
+        self._logger = LoggerFactory.get_logger_manager()
+        self._lock = Lock()
+        self._store: Optional[FrameStore] = FrameStore.open(video_path, height, True)
+        self._capture: Optional[cv2.VideoCapture] = None
+        # ? Source size frames are decoded here when the store keeps them smaller
+        self._decode_buffer: Optional[np.ndarray] = None
+        self._task: Optional[Future] = None
+        self._complete_callback: Optional[Callable[[], None]] = None
+        self._is_playing = False
+        self._is_cancelled = False
+        self._start_time = 0.0
+        if self._store is not None:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.FRAME_STORE_OPENED, logging.DEBUG,
+                             video_path, self._store.written_count, self._store.width, self._store.height,
+                             self._store.is_complete)
+
+    def set_complete_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        # ? Called on an executor thread once the last frame is stored
+        self._complete_callback = callback
+
+    def set_playing(self, is_playing: bool) -> None:
+        self._is_playing = is_playing
+
+    def start(self) -> None:
+        if self._store is not None and self._store.is_complete:
+            return
+        if not self._keyframe_index.done():
+            # ? Not waited for on an executor thread, start runs again from the build's completion
+            self._keyframe_index.add_done_callback(lambda _: self.start())
+            return
+        self._start_time = time.perf_counter()
+        with self._lock:
+            if self._task is None and not self._is_cancelled:
+                self._task = self._task_executor.submit(self._store_task, priority=TaskPriority.LOW)
+
+    def cancel(self) -> None:
+        # ? A chunk being decoded is finished and flushed, the task after it never runs
+        with self._lock:
+            self._is_cancelled = True
+            task, self._task = self._task, None
+        if task is not None and task.cancel():
+            self._close()
+
+    def _store_task(self) -> None:
+        is_failed = False
+        try:
+            if self._capture is None and not self._prepare():
+                self._close()
+                return
+            self._store_chunk()
+        except (cv2.error, OSError) as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.FRAME_STORE_FAILED, logging.DEBUG,
+                             self._video_path, e)
+            is_failed = True
+        with self._lock:
+            if not self._is_cancelled and not is_failed and not self._store.is_complete:
+                delay_seconds = Consts.FRAME_STORE_PLAYING_DELAY_SECONDS if self._is_playing else 0.0
+                self._task = self._task_executor.submit(self._store_task, priority=TaskPriority.LOW,
+                                                        delay_seconds=delay_seconds)
+                return
+            self._task = None
+            is_complete = not self._is_cancelled and not is_failed
+        self._close()
+        if is_complete:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.FRAME_STORE_DONE, logging.DEBUG,
+                             self._video_path, self._store.written_count, time.perf_counter() - self._start_time)
+            if self._complete_callback is not None:
+                self._complete_callback()
+
+    def _prepare(self) -> bool:
+        self._capture = cv2.VideoCapture(self._video_path, cv2.CAP_ANY,
+                                         [cv2.CAP_PROP_N_THREADS, Consts.FRAME_STORE_DECODE_THREADS])
+        if not self._capture.isOpened():
+            return False
+        if self._keyframe_index.cancelled() or self._keyframe_index.exception() is not None:
+            return False
+        keyframe_index = self._keyframe_index.result()
+        if self._store is None:
+            self._store = self._create_store(keyframe_index.frame_count, keyframe_index.fps)
+            if self._store is None:
+                return False
+        if self._store.height != self._store.source_size[1]:
+            self._decode_buffer = np.empty((self._store.source_size[1], self._store.source_size[0],
+                                            Consts.FRAME_CHANNELS), dtype=np.uint8)
+        # ? A store cut short goes on from its first missing frame, reached from the keyframe before it
+        position = self._store.written_count
+        keyframe = keyframe_index.nearest_keyframe(position) or 0
+        if keyframe > 0 and not self._capture.set(cv2.CAP_PROP_POS_FRAMES, keyframe):
+            return False
+        while keyframe < position and self._capture.grab():
+            keyframe += 1
+        return keyframe == position
+
+    def _create_store(self, frame_count: int, fps: float) -> Optional[FrameStore]:
+        source_width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        source_height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if source_width <= 0 or source_height <= 0 or frame_count <= 0:
+            return None
+        height = self._height if 0 < self._height < source_height else source_height
+        width = max(1, int(round(height * source_width / source_height)))
+        size = FrameStore.get_file_size(frame_count, width, height)
+        directory = os.path.abspath(ConstStrings.FRAME_STORE_DIRECTORY)
+        os.makedirs(directory, exist_ok=True)
+        # ? The file is sparse until written, running out of disk under a mapping would crash the app
+        allowed = min(self._max_bytes, shutil.disk_usage(directory).free)
+        if size > allowed:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.FRAME_STORE_TOO_LARGE, logging.DEBUG,
+                             self._video_path, size / Consts.BYTES_PER_MEGABYTE,
+                             allowed / Consts.BYTES_PER_MEGABYTE)
+            return None
+        return FrameStore.create(self._video_path, self._height, frame_count, width, height,
+                                 (source_width, source_height), fps if fps > 0 else Consts.DEFAULT_FPS)
+
+    def _store_chunk(self) -> None:
+        frames = self._store.frames
+        position = self._store.written_count
+        end = min(position + Consts.FRAME_STORE_CHUNK_FRAMES, len(frames))
+        is_read = True
+        while position < end:
+            if self._decode_buffer is None:
+                # ? Decoded into the mapped file itself
+                is_read = self._capture.read(frames[position])[0]
+            else:
+                is_read, self._decode_buffer = self._capture.read(self._decode_buffer)
+                if is_read:
+                    cv2.resize(self._decode_buffer, (self._store.width, self._store.height), dst=frames[position],
+                               interpolation=cv2.INTER_AREA)
+            if not is_read:
+                # ? Fewer frames decode than the container counts, the store ends at the last one
+                break
+            position += 1
+        self._store.mark_written(position, not is_read or position >= len(frames))
+
+    def _close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+        if self._store is not None:
+            self._store.flush()
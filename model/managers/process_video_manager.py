@@ -0,0 +1,290 @@
+import logging
+import multiprocessing
+from threading import Thread
+from time import perf_counter_ns
+from typing import Callable, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DecodeCommand, DecodePriority, DropPolicy, PipelineStage
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.factories.metrics_factory import MetricsFactory
+from infrastructure.interfaces.ivideo_manager import IVideoManager
+from model.data_classes.annotation_batch import AnnotationBatch
+from model.data_classes.decode_worker_settings import DecodeWorkerSettings
+from model.data_classes.frame_cache_stats import FrameCacheStats
+from model.data_classes.frame_geometry import FrameGeometry
+from model.data_classes.playback_stats import PlaybackStats
+from model.data_classes.point import Point
+from model.data_classes.track_snapshot import TrackSnapshot
+from model.pipeline.decode_worker import DecodeWorker
+from model.pipeline.display_renderer import DisplayRenderer
+from model.pipeline.shared_frame_ring import SharedFrameRing
+
+
+class ProcessVideoManager(IVideoManager):
+    # ? Decode, resize and color conversion run in a worker process, the GUI process only maps
+    # ? finished RGB frames out of shared memory
+
+    def __init__(self, video_path: str, buffer_capacity: int = Consts.FRAME_BUFFER_CAPACITY,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST) -> None:
+        self._video_path = video_path
+        self._buffer_capacity = buffer_capacity
+        self._drop_policy = drop_policy
+        self._logger = LoggerFactory.get_logger_manager()
+        # ? Forking a process that already runs Qt threads is unsafe
+        self._context = multiprocessing.get_context(ConstStrings.PROCESS_START_METHOD)
+        self._process = None
+        self._commands = None
+        self._notifications = None
+        self._notification_thread: Optional[Thread] = None
+        self._ring: Optional[SharedFrameRing] = None
+        self._restart_count = 0
+        self._fps = Consts.DEFAULT_FPS
+        self._frame_count = 0
+        self._source_size: Optional[Tuple[int, int]] = None
+        self._display_size: Optional[Tuple[int, int]] = None
+        self._current_frame: Optional[np.ndarray] = None
+        self._frame_position = -1
+        self._last_sequence = 0
+        self._speed = 1.0
+        self._is_paused = False
+        self._frame_ready_callback: Optional[Callable[[], None]] = None
+        self._frame_listener: Optional[Callable[[np.ndarray, int], None]] = None
+        self._display_renderer = DisplayRenderer()
+        self._metrics = MetricsFactory.get_metrics_manager()
+        self._geometry: Optional[FrameGeometry] = None
+
+    def load_video(self) -> bool:
+        # ? Only probes the container, the worker opens its own capture
+        capture = cv2.VideoCapture(self._video_path)
+        if not capture.isOpened():
+            return False
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        self._fps = fps if fps > 0 else Consts.DEFAULT_FPS
+        self._frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        capture.release()
+        if width <= 0 or height <= 0:
+            return False
+        self._source_size = (width, height)
+        return True
+
+    def get_fps(self) -> float:
+        return self._fps
+
+    def get_frame_count(self) -> int:
+        frame_count = self._ring.read_frame_count() if self._ring else 0
+        return frame_count if frame_count > 0 else self._frame_count
+
+    def get_frame_position(self) -> int:
+        return self._frame_position
+
+    def set_frame_ready_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        # ? Called on a listener thread when the paused worker publishes a frame
+        self._frame_ready_callback = callback
+
+    def get_source_size(self) -> Optional[Tuple[int, int]]:
+        return self._source_size
+
+    def set_frame_listener(self, listener: Optional[Callable[[np.ndarray, int], None]]) -> None:
+        # ? Frames are only reachable on this side, so the listener sees the display size RGB frames
+        # ? the GUI picks up and not every decoded one
+        self._frame_listener = listener
+
+    def set_decode_downscaled(self, is_downscaled: bool) -> None:
+        # ? The worker always delivers frames at display size
+        pass
+
+    def set_decode_priority(self, priority: DecodePriority) -> None:
+        # ? The worker is its own process, the OS scheduler arbitrates it
+        pass
+
+    def start_decoding(self) -> None:
+        if self._process is not None or self._source_size is None:
+            return
+        self._start_worker(max(self._frame_position, 0))
+
+    def stop_decoding(self) -> None:
+        if self._process is None:
+            return
+        self._send(DecodeCommand.STOP, None)
+        self._process.join(Consts.DECODE_WORKER_JOIN_TIMEOUT)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._release_worker()
+
+    def set_paused(self, is_paused: bool) -> None:
+        self._is_paused = is_paused
+        self._send(DecodeCommand.PAUSE, is_paused)
+
+    def get_speed(self) -> float:
+        return self._speed
+
+    def set_speed(self, speed: float) -> None:
+        self._speed = min(max(speed, Consts.MIN_PLAYBACK_SPEED), Consts.MAX_PLAYBACK_SPEED)
+        self._send(DecodeCommand.SPEED, self._speed)
+
+    def get_playback_stats(self) -> PlaybackStats:
+        return self._ring.read_stats() if self._ring else PlaybackStats()
+
+    def get_next_frame_delay_ms(self) -> int:
+        # ? The worker publishes each frame when it is due, polling twice a frame keeps latency low
+        delay_ms = 1000.0 / self._fps / self._speed / Consts.DECODE_WORKER_POLLS_PER_FRAME
+        return max(int(delay_ms), Consts.MIN_TIMER_INTERVAL_MS)
+
+    def get_dropped_frames(self) -> int:
+        return self.get_playback_stats().dropped_frames
+
+    def seek(self, frame_index: int) -> None:
+        frame_count = self.get_frame_count()
+        if frame_count > 0:
+            frame_index = min(max(frame_index, 0), frame_count - 1)
+        self._frame_position = frame_index
+        self._ensure_worker()
+        self._send(DecodeCommand.SEEK, frame_index)
+
+    def seek_time(self, timestamp_ms: float) -> None:
+        self.seek(int(round(timestamp_ms * self._fps / 1000.0)))
+
+    def step_frame(self, delta: int) -> bool:
+        # ? Decoded frames stay in the worker process, so every step is a seek there
+        if self._frame_position < 0:
+            return False
+        self.seek(self._frame_position + delta)
+        return False
+
+    def get_frame_cache_stats(self) -> FrameCacheStats:
+        return FrameCacheStats()
+
+    def read_frame(self) -> bool:
+        if not self._ensure_worker():
+            return False
+        start_ns = perf_counter_ns()
+        latest = self._ring.acquire_latest(self._last_sequence)
+        if latest is None:
+            return False
+        self._metrics.record(PipelineStage.ACQUIRE, perf_counter_ns() - start_ns)
+        self._current_frame, self._frame_position, self._last_sequence = latest
+        if self._frame_listener is not None:
+            self._frame_listener(self._current_frame, self._frame_position)
+        return True
+
+    def get_current_frame(self) -> Optional[np.ndarray]:
+        # ? Frames only exist converted at display size on this side
+        if self._current_frame is None:
+            return None
+        return cv2.cvtColor(self._current_frame, cv2.COLOR_RGB2BGR)
+
+    def get_current_frame_rgb(self) -> Optional[np.ndarray]:
+        return self._current_frame.copy() if self._current_frame is not None else None
+
+    def set_display_size(self, width: int, height: int) -> None:
+        if width <= 0 or height <= 0 or (width, height) == self._display_size:
+            return
+        self._display_size = (width, height)
+        self._geometry = None
+        self._send(DecodeCommand.RESIZE, self._get_output_size())
+
+    def map_to_source(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        geometry = self._get_geometry()
+        return geometry.to_source(x, y) if geometry else None
+
+    def get_display_frame(self, click_point: Optional[Union[Point, Tuple[int, int]]],
+                          annotations: Optional[AnnotationBatch] = None,
+                          tracks: Optional[TrackSnapshot] = None,
+                          destination: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        geometry = self._get_geometry()
+        if geometry is None or self._current_frame is None:
+            return None
+        marker = None
+        if click_point:
+            if isinstance(click_point, Point):
+                x, y = click_point.x, click_point.y
+            else:
+                x, y = click_point
+            marker = geometry.to_display(x, y)
+        # ? Without an overlay or a destination the shared memory view is shown as is, the ring keeps it
+        return self._display_renderer.render_rgb(self._current_frame, geometry, marker, annotations, tracks,
+                                                 destination)
+
+    def release(self) -> None:
+        self.stop_decoding()
+
+    def _start_worker(self, start_frame: int) -> None:
+        width, height = self._source_size
+        lock = self._context.Lock()
+        self._ring = SharedFrameRing.create(self._buffer_capacity, width, height, lock)
+        self._commands = self._context.Queue()
+        self._notifications = self._context.Queue()
+        self._last_sequence = 0
+        settings = DecodeWorkerSettings(self._video_path, self._ring.name, self._ring.slot_count, width, height,
+                                        self._buffer_capacity, self._drop_policy.value, start_frame,
+                                        self._get_output_size(), self._speed, self._is_paused,
+                                        self._metrics.is_enabled)
+        self._process = self._context.Process(
+            target=DecodeWorker.main, args=(settings, lock, self._commands, self._notifications), daemon=True)
+        self._process.start()
+        self._notification_thread = Thread(
+            target=self._notification_thread_handle, args=(self._notifications,), daemon=True)
+        self._notification_thread.start()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.DECODE_WORKER_STARTED, logging.DEBUG,
+                         self._process.pid, self._video_path, start_frame)
+
+    def _release_worker(self) -> None:
+        self._notifications.put(None)
+        self._notification_thread.join(Consts.DECODE_WORKER_JOIN_TIMEOUT)
+        self._commands.close()
+        self._notifications.close()
+        self._ring.close()
+        self._process = self._commands = self._notifications = None
+        self._notification_thread = None
+        self._ring = None
+
+    def _ensure_worker(self) -> bool:
+        if self._process is None:
+            return False
+        if self._process.is_alive():
+            return True
+        # ? A crashed worker (even one killed holding the ring lock) is replaced with a fresh ring
+        restart_frame = self._frame_position + 1 if self._frame_position >= 0 else 0
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.DECODE_WORKER_CRASHED, logging.DEBUG,
+                         self._process.pid, self._process.exitcode, restart_frame)
+        self._release_worker()
+        self._restart_count += 1
+        if self._restart_count > Consts.MAX_DECODE_WORKER_RESTARTS:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.DECODE_WORKER_GAVE_UP, logging.DEBUG,
+                             self._video_path, self._restart_count - 1)
+            return False
+        self._start_worker(restart_frame)
+        return True
+
+    def _send(self, command: DecodeCommand, value) -> None:
+        if self._commands is not None:
+            self._commands.put((command, value))
+
+    def _notification_thread_handle(self, notifications) -> None:
+        for _ in iter(notifications.get, None):
+            if self._frame_ready_callback is not None:
+                self._frame_ready_callback()
+
+    def _get_output_size(self) -> Tuple[int, int]:
+        source_width, source_height = self._source_size
+        display_width, display_height = self._display_size or self._source_size
+        # ? Never larger than the source, so every frame fits its shared memory slot
+        return min(display_width, source_width), min(display_height, source_height)
+
+    def _get_geometry(self) -> Optional[FrameGeometry]:
+        if self._source_size is None:
+            return None
+        if self._geometry is None:
+            source_width, source_height = self._source_size
+            display_width, display_height = self._display_size or self._source_size
+            self._geometry = FrameGeometry(source_width, source_height, display_width, display_height)
+        return self._geometry
@@ -0,0 +1,92 @@
+import datetime
+import logging
+import os
+from typing import Callable, Dict, List, Optional
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import SessionEventType
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.isession_manager import ISessionManager
+from model.data_classes.replay_stats import ReplayStats
+from model.data_classes.session_event import SessionEvent
+from model.session.session_reader import SessionReader
+from model.session.session_recorder import SessionRecorder
+
+
+class SessionManager(ISessionManager):
+    # ? Owns the recording and replay state of a session. Events are recorded as the view model
+    # ? reports them and replayed by handing each one to the handler registered for its type, the
+    # ? same view model methods the user's input goes through.
+
+    def __init__(self) -> None:
+        self._logger = LoggerFactory.get_logger_manager()
+        self._recorder: Optional[SessionRecorder] = None
+        self._handlers: Dict[SessionEventType, Callable[..., None]] = {}
+        self._is_replaying = False
+        self._is_replay_rendering = True
+
+    def set_handlers(self, handlers: Dict[SessionEventType, Callable[..., None]]) -> None:
+        # ? FRAME handlers get the frame index, all others the event's values
+        self._handlers = dict(handlers)
+
+    def is_recording(self) -> bool:
+        return self._recorder is not None
+
+    def start_recording(self, path: Optional[str] = None) -> str:
+        # ? A recording already running is closed first
+        self.stop_recording()
+        if path is None:
+            os.makedirs(ConstStrings.SESSION_DIRECTORY, exist_ok=True)
+            path = os.path.join(ConstStrings.SESSION_DIRECTORY, ConstStrings.SESSION_FILE_NAME.format(
+                datetime.datetime.now().strftime(ConstStrings.DATE_TIME_FORMAT)))
+        self._recorder = SessionRecorder(path)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.SESSION_RECORDING_STARTED, logging.DEBUG, path)
+        return path
+
+    def stop_recording(self) -> Optional[str]:
+        # ? The path of the saved session, None when nothing was recording
+        if self._recorder is None:
+            return None
+        recorder, self._recorder = self._recorder, None
+        recorder.close()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.SESSION_RECORDING_STOPPED, logging.DEBUG,
+                         recorder.event_count, recorder.path)
+        return recorder.path
+
+    def record(self, event_type: SessionEventType, frame_index: int, *values) -> None:
+        if self._recorder is not None:
+            self._recorder.record(event_type, frame_index, *values)
+
+    def read_events(self, path: str) -> Optional[List[SessionEvent]]:
+        try:
+            return SessionReader.read_events(path)
+        except (OSError, ValueError) as error:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.SESSION_READ_FAILED, logging.DEBUG,
+                             path, error)
+            return None
+
+    def apply_event(self, event: SessionEvent) -> None:
+        handler = self._handlers[event.event_type]
+        if event.event_type is SessionEventType.FRAME:
+            handler(event.frame_index)
+        else:
+            handler(*event.values)
+
+    def is_replaying(self) -> bool:
+        return self._is_replaying
+
+    def is_replay_rendering(self) -> bool:
+        return self._is_replay_rendering
+
+    def begin_replay(self, is_rendering: bool) -> None:
+        # ? A replay is never recorded into a session of its own
+        self.stop_recording()
+        self._is_replaying = True
+        self._is_replay_rendering = is_rendering
+
+    def finish_replay(self, replay_stats: ReplayStats) -> None:
+        self._is_replaying = False
+        self._is_replay_rendering = True
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.SESSION_REPLAYED, logging.DEBUG,
+                         replay_stats.events, replay_stats.frames, replay_stats.elapsed_seconds, replay_stats.fps)
@@ -0,0 +1,192 @@
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+from multiprocessing import get_context
+from threading import Condition, Thread
+from time import perf_counter_ns
+from typing import Any, Callable, List, Optional, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import MetricGauge, TaskPriority
+from infrastructure.events.gui_dispatcher import GuiDispatcher
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.factories.metrics_factory import MetricsFactory
+from infrastructure.interfaces.itask_executor import ITaskExecutor
+from infrastructure.metrics.stage_histogram import StageHistogram
+from model.data_classes.scheduled_task import ScheduledTask
+from model.data_classes.task_stats import TaskStats
+
+
+class TaskExecutor(ITaskExecutor):
+    # ? One pool of worker threads shared by the managers, instead of a thread of their own each.
+    # ? Ready tasks run by priority, then in the order they were submitted. Delayed and periodic tasks
+    # ? wait in a second heap by due time and move to the ready one when due. Created on the GUI
+    # ? thread, on_done callbacks are called there.
+
+    def __init__(self, workers: int = Consts.TASK_WORKERS, process_workers: int = 0) -> None:
+        self._logger = LoggerFactory.get_logger_manager()
+        self._metrics = MetricsFactory.get_metrics_manager()
+        self._condition = Condition()
+        # ? (priority, sequence, task) and (due, sequence, task), the sequence keeps equal keys in order
+        self._ready: List[Tuple[int, int, ScheduledTask]] = []
+        self._scheduled: List[Tuple[int, int, ScheduledTask]] = []
+        self._sequence = count()
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._wait_histogram = StageHistogram()
+        self._run_histogram = StageHistogram()
+        self._is_shut_down = False
+        self._process_workers = process_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._gui_dispatcher = GuiDispatcher()
+        self._workers = [Thread(target=self._worker_thread_handle, daemon=True) for _ in range(max(1, workers))]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, function: Callable[..., Any], *arguments: Any, priority: TaskPriority = TaskPriority.NORMAL,
+               delay_seconds: float = 0.0, on_done: Optional[Callable[[Future], None]] = None) -> Future:
+        # ? The future can be cancelled until a worker starts the task
+        task = ScheduledTask(function, arguments, priority)
+        self._add_on_done(task.future, on_done)
+        self._enqueue(task, delay_seconds)
+        return task.future
+
+    def schedule_periodic(self, function: Callable[[], Any], interval_seconds: float,
+                          priority: TaskPriority = TaskPriority.LOW,
+                          initial_delay_seconds: Optional[float] = None) -> Future:
+        # ? Runs again interval_seconds after each run ends, a slow run does not queue up a burst of
+        # ? runs behind it. The future stays pending while the task repeats, cancelling it stops it.
+        task = ScheduledTask(function, (), priority,
+                             interval_ns=max(1, int(interval_seconds * Consts.NANOSECONDS_PER_SECOND)))
+        self._enqueue(task, interval_seconds if initial_delay_seconds is None else initial_delay_seconds)
+        return task.future
+
+    def submit_process(self, function: Callable[..., Any], *arguments: Any,
+                       on_done: Optional[Callable[[Future], None]] = None) -> Future:
+        # ? For work that holds the GIL. The function and arguments must pickle, and the tasks are not
+        # ? part of get_stats. Without process workers configured the task runs on the threads.
+        if self._process_workers <= 0:
+            return self.submit(function, *arguments, on_done=on_done)
+        with self._condition:
+            if self._is_shut_down:
+                future = Future()
+                future.cancel()
+                return future
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    self._process_workers, mp_context=get_context(ConstStrings.PROCESS_START_METHOD))
+            future = self._process_pool.submit(function, *arguments)
+        self._add_on_done(future, on_done)
+        return future
+
+    def get_stats(self) -> TaskStats:
+        with self._condition:
+            return TaskStats(len(self._ready), len(self._scheduled), self._running, self._completed, self._failed,
+                             self._cancelled, self._wait_histogram.get_stats(), self._run_histogram.get_stats())
+
+    def shutdown(self, is_waiting: bool = True) -> None:
+        # ? Queued and periodic tasks are cancelled, running ones finish
+        with self._condition:
+            if self._is_shut_down:
+                return
+            self._is_shut_down = True
+            pending = [entry[2] for entry in self._ready + self._scheduled]
+            self._ready.clear()
+            self._scheduled.clear()
+            self._condition.notify_all()
+        for task in pending:
+            task.future.cancel()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.TASK_EXECUTOR_STOPPED, logging.DEBUG,
+                         len(pending))
+        if is_waiting:
+            for worker in self._workers:
+                worker.join(Consts.TASK_EXECUTOR_JOIN_TIMEOUT)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=is_waiting, cancel_futures=True)
+
+    def _add_on_done(self, future: Future, on_done: Optional[Callable[[Future], None]]) -> None:
+        if on_done is not None:
+            future.add_done_callback(partial(self._gui_dispatcher.post, on_done))
+
+    def _enqueue(self, task: ScheduledTask, delay_seconds: float) -> None:
+        now = perf_counter_ns()
+        with self._condition:
+            if self._is_shut_down:
+                task.future.cancel()
+                return
+            if delay_seconds > 0:
+                task.due_ns = now + int(delay_seconds * Consts.NANOSECONDS_PER_SECOND)
+                heappush(self._scheduled, (task.due_ns, next(self._sequence), task))
+            else:
+                task.ready_ns = now
+                heappush(self._ready, (task.priority.value, next(self._sequence), task))
+                self._metrics.set_gauge(MetricGauge.TASK_QUEUE_DEPTH, len(self._ready))
+            # ? A worker waiting for a later due time wakes to recompute it
+            self._condition.notify()
+
+    def _worker_thread_handle(self) -> None:
+        while True:
+            task = self._take_task()
+            if task is None:
+                return
+            self._run_task(task)
+
+    def _take_task(self) -> Optional[ScheduledTask]:
+        with self._condition:
+            while not self._is_shut_down:
+                now = perf_counter_ns()
+                while self._scheduled and self._scheduled[0][0] <= now:
+                    _, sequence, task = heappop(self._scheduled)
+                    task.ready_ns = task.due_ns
+                    heappush(self._ready, (task.priority.value, sequence, task))
+                if not self._ready:
+                    timeout = (self._scheduled[0][0] - now) / Consts.NANOSECONDS_PER_SECOND if self._scheduled else None
+                    self._condition.wait(timeout)
+                    continue
+                task = heappop(self._ready)[2]
+                self._metrics.set_gauge(MetricGauge.TASK_QUEUE_DEPTH, len(self._ready))
+                # ? A periodic future never runs, it only reports whether the task was cancelled
+                is_cancelled = (task.future.cancelled() if task.interval_ns
+                                else not task.future.set_running_or_notify_cancel())
+                if is_cancelled:
+                    self._cancelled += 1
+                    continue
+                self._wait_histogram.record(now - task.ready_ns)
+                self._running += 1
+                return task
+        return None
+
+    def _run_task(self, task: ScheduledTask) -> None:
+        start_ns = perf_counter_ns()
+        result, error = None, None
+        try:
+            result = task.function(*task.arguments)
+        except Exception as e:
+            error = e
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.TASK_FAILED, logging.DEBUG,
+                             getattr(task.function, "__qualname__", task.function), e)
+        end_ns = perf_counter_ns()
+        with self._condition:
+            self._running -= 1
+            self._run_histogram.record(end_ns - start_ns)
+            if error is None:
+                self._completed += 1
+            else:
+                self._failed += 1
+            if task.interval_ns and not task.future.cancelled() and not self._is_shut_down:
+                task.due_ns = end_ns + task.interval_ns
+                heappush(self._scheduled, (task.due_ns, next(self._sequence), task))
+                self._condition.notify()
+        if task.interval_ns:
+            return
+        # ? Outside the lock, done callbacks run here
+        if error is None:
+            task.future.set_result(result)
+        else:
+            task.future.set_exception(error)
@@ -0,0 +1,176 @@
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Deque, List, Optional
+
+import cv2
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import TaskPriority
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.interfaces.itask_executor import ITaskExecutor
+from infrastructure.interfaces.ithumbnail_manager import IThumbnailManager
+from model.data_classes.thumbnails import Thumbnails
+from model.pipeline.thumbnail_cache import ThumbnailCache
+
+
+class ThumbnailManager(IThumbnailManager):
+    # ? Fills a video's thumbnail cache with one low priority task per thumbnail on the shared executor.
+    # ? The decoder is its own and single threaded. While the video plays, each task waits before
+    # ? the next, so playback decoding keeps the CPU. Slots are taken coarse to fine so the whole strip
+    # ? is roughed out first, and each slot shows a keyframe inside its span when there is one, which
+    # ? decodes without decoding the frames before it.
+
+    def __init__(self, video_path: str, task_executor: ITaskExecutor, keyframe_index: Future) -> None:
+        self._video_path = video_path
+        self._task_executor = task_executor
+        # ? The build shared with the video manager, the first task is only submitted once it is done
+        self._keyframe_index = keyframe_index
+        self._logger = LoggerFactory.get_logger_manager()
+        self._lock = Lock()
+        # ? An existing cache is shown before anything is decoded
+        self._cache: Optional[ThumbnailCache] = ThumbnailCache.open(video_path)
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._slot_frames: Optional[np.ndarray] = None
+        self._pending_slots: Deque[int] = deque()
+        self._task: Optional[Future] = None
+        self._thumbnail_callback: Optional[Callable[[int], None]] = None
+        self._is_playing = False
+        self._is_cancelled = False
+        self._generated = 0
+        self._start_time = 0.0
+        if self._cache is not None:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.THUMBNAILS_OPENED, logging.DEBUG,
+                             video_path, self._cache.get_filled_count(), Consts.THUMBNAIL_COUNT)
+
+    def get_thumbnails(self) -> Optional[Thumbnails]:
+        cache = self._cache
+        return cache.thumbnails if cache is not None else None
+
+    def set_thumbnail_callback(self, callback: Optional[Callable[[int], None]]) -> None:
+        # ? Called on an executor thread with the slot just filled
+        self._thumbnail_callback = callback
+
+    def set_playing(self, is_playing: bool) -> None:
+        self._is_playing = is_playing
+
+    def start(self) -> None:
+        if self._cache is not None and self._cache.thumbnails.is_filled.all():
+            return
+        if not self._keyframe_index.done():
+            # ? Not waited for on an executor thread, start runs again from the build's completion
+            self._keyframe_index.add_done_callback(lambda _: self.start())
+            return
+        self._start_time = time.perf_counter()
+        with self._lock:
+            if self._task is None and not self._is_cancelled:
+                self._task = self._task_executor.submit(self._thumbnail_task, priority=TaskPriority.LOW)
+
+    def cancel(self) -> None:
+        # ? A thumbnail being decoded is finished and stored, the task after it never runs
+        with self._lock:
+            self._is_cancelled = True
+            task, self._task = self._task, None
+        if task is not None and task.cancel():
+            self._close()
+
+    def _thumbnail_task(self) -> None:
+        try:
+            if self._slot_frames is None and not self._prepare():
+                self._close()
+                return
+            if self._pending_slots:
+                self._generate(self._pending_slots.popleft())
+        except (cv2.error, OSError) as e:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.THUMBNAILS_FAILED, logging.DEBUG,
+                             self._video_path, e)
+            self._pending_slots.clear()
+        with self._lock:
+            if not self._is_cancelled and self._pending_slots:
+                delay_seconds = Consts.THUMBNAIL_PLAYING_DELAY_SECONDS if self._is_playing else 0.0
+                self._task = self._task_executor.submit(self._thumbnail_task, priority=TaskPriority.LOW,
+                                                        delay_seconds=delay_seconds)
+                return
+            self._task = None
+            is_complete = not self._is_cancelled and self._cache is not None
+        if is_complete and self._generated:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.THUMBNAILS_DONE, logging.DEBUG,
+                             self._video_path, self._generated, time.perf_counter() - self._start_time)
+        self._close()
+
+    def _prepare(self) -> bool:
+        self._capture = cv2.VideoCapture(self._video_path, cv2.CAP_ANY,
+                                         [cv2.CAP_PROP_N_THREADS, Consts.THUMBNAIL_DECODE_THREADS])
+        if not self._capture.isOpened():
+            return False
+        if self._cache is None:
+            source_width = self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)
+            source_height = self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)
+            if source_width <= 0 or source_height <= 0:
+                return False
+            self._cache = ThumbnailCache.create(
+                self._video_path, max(1, int(round(Consts.THUMBNAIL_HEIGHT * source_width / source_height))))
+        if self._keyframe_index.cancelled() or self._keyframe_index.exception() is not None:
+            return False
+        keyframe_index = self._keyframe_index.result()
+        self._slot_frames = self._plan_slot_frames(keyframe_index.frame_count, keyframe_index.keyframes)
+        is_filled = self._cache.thumbnails.is_filled
+        self._pending_slots = deque(slot for slot in self._get_coarse_to_fine_order(Consts.THUMBNAIL_COUNT)
+                                    if not is_filled[slot])
+        return True
+
+    def _generate(self, slot: int) -> None:
+        frame_index = int(self._slot_frames[slot])
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        is_read, frame = self._capture.read()
+        images = self._cache.thumbnails.images
+        if is_read:
+            thumbnail = cv2.resize(frame, (images.shape[2], images.shape[1]), interpolation=cv2.INTER_AREA)
+            self._cache.store(slot, frame_index, cv2.cvtColor(thumbnail, cv2.COLOR_BGR2RGB))
+        else:
+            # ? A frame that does not decode stays black rather than being retried on every open
+            self._cache.store(slot, frame_index, np.zeros(images.shape[1:], dtype=np.uint8))
+        self._generated += 1
+        if self._generated % Consts.THUMBNAIL_FLUSH_INTERVAL == 0:
+            self._cache.flush()
+        if self._thumbnail_callback is not None:
+            self._thumbnail_callback(slot)
+
+    def _close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+        if self._cache is not None:
+            self._cache.flush()
+
+    @staticmethod
+    def _plan_slot_frames(frame_count: int, keyframes: np.ndarray) -> np.ndarray:
+        # ? The middle of each slot's span, or the keyframe nearest to it inside the span
+        bounds = np.linspace(0, max(frame_count, 1), Consts.THUMBNAIL_COUNT + 1)
+        slot_frames = np.minimum(((bounds[:-1] + bounds[1:]) / 2).astype(np.int64), max(frame_count - 1, 0))
+        if len(keyframes):
+            for slot in range(Consts.THUMBNAIL_COUNT):
+                start, end = np.searchsorted(keyframes, (bounds[slot], bounds[slot + 1]))
+                if start < end:
+                    inside = keyframes[start:end]
+                    slot_frames[slot] = inside[np.argmin(np.abs(inside - slot_frames[slot]))]
+        return slot_frames
+
+    @staticmethod
+    def _get_coarse_to_fine_order(count: int) -> List[int]:
+        # ? The first slot, then the middle one, then the quarters, and so on down to every slot
+        order: List[int] = []
+        is_taken = [False] * count
+        step = 1 << max(count - 1, 0).bit_length()
+        while step:
+            for slot in range(0, count, step):
+                if not is_taken[slot]:
+                    is_taken[slot] = True
+                    order.append(slot)
+            step >>= 1
+        return order
@@ -0,0 +1,215 @@
+from collections import deque
+from threading import Condition, Lock, Thread
+from typing import Callable, Deque, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from infrastructure.interfaces.itracking_manager import ITrackingManager
+from model.data_classes.track_snapshot import TrackSnapshot
+
+
+class TrackingManager(ITrackingManager):
+    # ? Follows clicked points from frame to frame with pyramidal Lucas-Kanade on its own thread. The
+    # ? decode side only hands over a downscaled grayscale copy, so the cost does not grow with resolution.
+
+    def __init__(self, source_width: int, source_height: int, max_points: int = Consts.MAX_TRACKED_POINTS,
+                 max_width: int = Consts.TRACKING_MAX_WIDTH) -> None:
+        self._scale = min(1.0, max_width / source_width)
+        self._size = (max(int(round(source_width * self._scale)), 1),
+                      max(int(round(source_height * self._scale)), 1))
+        self._max_points = max_points
+        self._window_size = (Consts.TRACKING_WINDOW_SIZE, Consts.TRACKING_WINDOW_SIZE)
+        self._criteria = (cv2.TERM_CRITERIA_COUNT | cv2.TERM_CRITERIA_EPS,
+                          Consts.TRACKING_MAX_ITERATIONS, Consts.TRACKING_EPSILON)
+        self._condition = Condition()
+        self._frames: Deque[Tuple[int, np.ndarray]] = deque()
+        # ? Enough for a full queue, the frame being tracked, the reference and the one being filled
+        width, height = self._size
+        self._free_buffers: List[np.ndarray] = [np.empty((height, width), dtype=np.uint8)
+                                                for _ in range(Consts.TRACKING_QUEUE_SIZE + 3)]
+        self._gray_buffer: Optional[np.ndarray] = None
+        self._reference: Optional[np.ndarray] = None
+        self._reference_index = -1
+        self._state_lock = Lock()
+        # ? Columns are track slots, rows a ring of the most recent frames, NaN where a track has no position
+        self._history = np.full((Consts.TRACKING_TRAIL_LENGTH, max_points, 2), np.nan, dtype=np.float32)
+        self._history_frames = np.full(Consts.TRACKING_TRAIL_LENGTH, -1, dtype=np.int64)
+        self._history_row = 0
+        self._track_ids = np.full(max_points, -1, dtype=np.int64)
+        self._pending: List[Tuple[int, float, float]] = []
+        self._next_id = 0
+        self._has_tracks = False
+        self._tracks_callback: Optional[Callable[[], None]] = None
+        self._thread: Optional[Thread] = None
+        self._is_running = False
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._is_running = True
+        self._thread = Thread(target=self._tracking_thread_handle, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        with self._condition:
+            self._is_running = False
+            self._condition.notify()
+        self._thread.join(Consts.TRACKING_JOIN_TIMEOUT)
+        self._thread = None
+
+    def set_tracks_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        # ? Called on the tracking thread after every tracked frame
+        self._tracks_callback = callback
+
+    def submit_frame(self, frame: np.ndarray, frame_index: int) -> None:
+        # ? Runs on the decode thread, so it converts into a pooled buffer and returns
+        if not self._has_tracks or not self._is_running:
+            return
+        with self._condition:
+            buffer = self._free_buffers.pop() if self._free_buffers else self._frames.popleft()[1]
+        self._to_gray(frame, buffer)
+        with self._condition:
+            if len(self._frames) >= Consts.TRACKING_QUEUE_SIZE:
+                # ? Falling behind: the oldest frame goes, the pyramid bridges the larger step
+                self._free_buffers.append(self._frames.popleft()[1])
+            self._frames.append((frame_index, buffer))
+            self._condition.notify()
+
+    def track_frame(self, frame: np.ndarray, frame_index: int) -> None:
+        # ? Tracks on the calling thread, for callers that go through every frame and can wait for it
+        with self._condition:
+            buffer = self._free_buffers.pop()
+        self._to_gray(frame, buffer)
+        self._track(frame_index, buffer)
+
+    def add_point(self, x: float, y: float) -> Optional[int]:
+        # ? The point joins on the next frame the tracker sees
+        with self._state_lock:
+            if np.count_nonzero(self._track_ids >= 0) + len(self._pending) >= self._max_points:
+                return None
+            track_id = self._next_id
+            self._next_id += 1
+            self._pending.append((track_id, float(x), float(y)))
+            self._has_tracks = True
+        return track_id
+
+    def remove_nearest(self, x: float, y: float, frame_index: int) -> Optional[int]:
+        snapshot = self.get_snapshot(frame_index)
+        if not len(snapshot):
+            return None
+        distances = (snapshot.xs - x) ** 2 + (snapshot.ys - y) ** 2
+        index = int(np.argmin(distances))
+        if distances[index] > Consts.ANNOTATION_HIT_RADIUS * Consts.ANNOTATION_HIT_RADIUS:
+            return None
+        track_id = int(snapshot.ids[index])
+        with self._state_lock:
+            self._pending = [point for point in self._pending if point[0] != track_id]
+            self._track_ids[self._track_ids == track_id] = -1
+            self._update_has_tracks()
+        return track_id
+
+    def clear(self) -> None:
+        with self._state_lock:
+            self._pending = []
+            self._track_ids.fill(-1)
+            self._history.fill(np.nan)
+            self._has_tracks = False
+
+    def get_snapshot(self, frame_index: int) -> TrackSnapshot:
+        # ? The decoder runs a few frames ahead of the display, so positions are looked up for the shown frame
+        with self._state_lock:
+            slots = np.flatnonzero(self._track_ids >= 0)
+            matches = np.flatnonzero(self._history_frames == frame_index)
+            row = int(matches[0]) if len(matches) else self._history_row
+            positions = self._history[row, slots]
+            is_placed = ~np.isnan(positions[:, 0])
+            slots = slots[is_placed]
+            ids = self._track_ids[slots]
+            trail_length = len(self._history_frames)
+            order = (row - np.arange(trail_length - 1, -1, -1)) % trail_length
+            trail_frames = self._history_frames[order]
+            order = order[(trail_frames >= 0) & (trail_frames <= self._history_frames[row])]
+            trail_block = self._history[order][:, slots].transpose(1, 0, 2)
+            pending = list(self._pending)
+        trails = [trail[~np.isnan(trail[:, 0])] for trail in trail_block]
+        xs, ys = positions[is_placed, 0], positions[is_placed, 1]
+        if pending:
+            pending_ids, pending_xs, pending_ys = (np.array(column) for column in zip(*pending))
+            ids = np.concatenate((ids, pending_ids))
+            xs = np.concatenate((xs, pending_xs.astype(np.float32)))
+            ys = np.concatenate((ys, pending_ys.astype(np.float32)))
+            trails.extend(np.array([[x, y]], dtype=np.float32) for _, x, y in pending)
+        return TrackSnapshot(frame_index, ids, xs, ys, trails)
+
+    def _to_gray(self, frame: np.ndarray, buffer: np.ndarray) -> None:
+        # ? Color order does not matter here, frames in RGB only weigh red and blue the other way round
+        if frame.shape[1] == self._size[0]:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buffer)
+        else:
+            self._gray_buffer = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buffer)
+            cv2.resize(self._gray_buffer, self._size, dst=buffer, interpolation=cv2.INTER_AREA)
+
+    def _tracking_thread_handle(self) -> None:
+        while True:
+            with self._condition:
+                while self._is_running and not self._frames:
+                    self._condition.wait()
+                if not self._is_running:
+                    return
+                frame_index, gray = self._frames.popleft()
+            self._track(frame_index, gray)
+            if self._tracks_callback is not None:
+                self._tracks_callback()
+
+    def _track(self, frame_index: int, gray: np.ndarray) -> None:
+        with self._state_lock:
+            slots = np.flatnonzero(self._track_ids >= 0)
+            ids = self._track_ids[slots].copy()
+            points = self._history[self._history_row, slots]
+        gap = frame_index - self._reference_index
+        is_continuous = self._reference is not None and 0 < gap <= Consts.TRACKING_MAX_FRAME_GAP
+        is_lost = np.zeros(len(slots), dtype=bool)
+        if is_continuous and len(slots):
+            moved, status, error = cv2.calcOpticalFlowPyrLK(
+                self._reference, gray, (points * self._scale).reshape(-1, 1, 2), None,
+                winSize=self._window_size, maxLevel=Consts.TRACKING_PYRAMID_LEVELS, criteria=self._criteria)
+            points = moved.reshape(-1, 2) / self._scale
+            width, height = self._size
+            scaled = moved.reshape(-1, 2)
+            is_lost = ((status.ravel() == 0) | (error.ravel() > Consts.TRACKING_MAX_ERROR) |
+                       (scaled[:, 0] < 0) | (scaled[:, 1] < 0) | (scaled[:, 0] >= width) | (scaled[:, 1] >= height))
+        with self._state_lock:
+            if not is_continuous:
+                # ? First frame, a seek or a loop: this frame becomes the reference and points stay put
+                self._history.fill(np.nan)
+                self._history_frames.fill(-1)
+                self._history[self._history_row, slots] = points
+            row = (self._history_row + 1) % len(self._history_frames)
+            self._history[row] = np.nan
+            # ? Tracks removed while this frame was tracked keep their free slot
+            is_alive = self._track_ids[slots] == ids
+            self._history[row, slots[is_alive & ~is_lost]] = points[is_alive & ~is_lost]
+            lost_slots = slots[is_alive & is_lost]
+            self._track_ids[lost_slots] = -1
+            self._history[:, lost_slots] = np.nan
+            free_slots = np.flatnonzero(self._track_ids < 0)
+            for slot, (track_id, x, y) in zip(free_slots, self._pending):
+                self._track_ids[slot] = track_id
+                self._history[:, slot] = np.nan
+                self._history[row, slot] = (x, y)
+            self._pending = self._pending[len(free_slots):]
+            self._history_frames[row] = frame_index
+            self._history_row = row
+            self._update_has_tracks()
+        with self._condition:
+            if self._reference is not None:
+                self._free_buffers.append(self._reference)
+        self._reference = gray
+        self._reference_index = frame_index
+
+    def _update_has_tracks(self) -> None:
+        self._has_tracks = bool(self._pending) or bool((self._track_ids >= 0).any())
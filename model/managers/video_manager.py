@@ -1,36 +1,273 @@
+from concurrent.futures import Future
+from threading import Event, Lock, Thread
+from time import perf_counter_ns
+import math
 import cv2
 import numpy as np
-from typing import Optional, Tuple, Union
+from typing import Callable, Optional, Tuple, Union
+from globals.consts.consts import Consts
+from globals.enums.enums import DecodePriority, DropPolicy, MetricGauge, PipelineStage
+from infrastructure.factories.metrics_factory import MetricsFactory
+from infrastructure.interfaces.ivideo_manager import IVideoManager
+from model.data_classes.annotation_batch import AnnotationBatch
+from model.data_classes.frame_cache_stats import FrameCacheStats
+from model.data_classes.frame_geometry import FrameGeometry
+from model.data_classes.keyframe_index import KeyframeIndex
+from model.data_classes.playback_stats import PlaybackStats
 from model.data_classes.point import Point
+from model.data_classes.track_snapshot import TrackSnapshot
+from model.pipeline.decode_scheduler import DecodeScheduler
+from model.pipeline.display_renderer import DisplayRenderer
+from model.pipeline.frame_cache import FrameCache
+from model.pipeline.frame_ring_buffer import FrameRingBuffer
+from model.pipeline.frame_store import FrameStore
+from model.pipeline.frame_store_capture import FrameStoreCapture
+from model.pipeline.keyframe_indexer import KeyframeIndexer
+from model.pipeline.playback_clock import PlaybackClock
 
 
-class VideoManager:
+class VideoManager(IVideoManager):
     
-    def __init__(self, video_path: str):
+    def __init__(self, video_path: str, buffer_capacity: int = Consts.FRAME_BUFFER_CAPACITY,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+                 decode_scheduler: Optional[DecodeScheduler] = None, decode_threads: int = 0,
+                 frame_cache: Optional[FrameCache] = None, frame_store: Optional[FrameStore] = None,
+                 keyframe_index: Optional[Future] = None):
         self._video_path = video_path
+        # ? The shared build of the keyframe index, without one the manager scans the video on its own thread
+        self._keyframe_index_build = keyframe_index
         self._video_capture = None
+        # ? A complete store of the decoded frames is read instead of the video
+        self._frame_store = frame_store
+        self._decode_scheduler = decode_scheduler
+        self._decode_stream_id: Optional[int] = None
+        self._decode_threads = decode_threads
+        self._is_decode_downscaled = False
+        self._downscale_buffer: Optional[np.ndarray] = None
+        self._source_size: Optional[Tuple[int, int]] = None
         self._current_frame = None
+        self._fps = Consts.DEFAULT_FPS
+        self._frame_count = 0
+        self._frame_position = -1
+        self._keyframe_index: Optional[KeyframeIndex] = None
+        self._frame_buffer = FrameRingBuffer(buffer_capacity, drop_policy)
+        self._metrics = MetricsFactory.get_metrics_manager()
+        self._display_renderer = DisplayRenderer()
+        self._display_size: Optional[Tuple[int, int]] = None
+        self._geometry: Optional[FrameGeometry] = None
+        self._decode_thread: Optional[Thread] = None
+        self._decode_wakeup = Event()
+        self._is_decoding = False
+        self._is_decode_paused = False
+        self._decoded_frame_index = 0
+        self._seek_lock = Lock()
+        self._pending_seek: Optional[int] = None
+        self._is_backfill_pending = False
+        self._frame_cache = frame_cache
+        self._is_frame_cache_adopting = False
+        # ? Steps served from the cache are copied here, cache entries are reused once evicted
+        self._step_buffer: Optional[np.ndarray] = None
+        self._backfill_buffer: Optional[np.ndarray] = None
+        # ? Where decoding continues after steps served from the cache, which leave the capture behind
+        self._resume_frame: Optional[int] = None
+        self._frame_ready_callback: Optional[Callable[[], None]] = None
+        self._frame_listener: Optional[Callable[[np.ndarray, int], None]] = None
+        self._clock = PlaybackClock()
+        self._loop_offset_ms = 0.0
+        self._skipped_frames = 0
+        self._consecutive_skips = 0
+        self._playback_stats = PlaybackStats()
         
     def load_video(self) -> bool:
-        self._video_capture = cv2.VideoCapture(self._video_path)
-        return self._video_capture.isOpened()
+        if self._frame_store is not None:
+            return self._load_frame_store()
+        if self._decode_threads > 0:
+            # ? Many concurrent streams share the cores, so each capture gets a small thread budget
+            self._video_capture = cv2.VideoCapture(
+                self._video_path, cv2.CAP_ANY, [cv2.CAP_PROP_N_THREADS, self._decode_threads])
+        else:
+            self._video_capture = cv2.VideoCapture(self._video_path)
+        if not self._video_capture.isOpened():
+            return False
+        fps = self._video_capture.get(cv2.CAP_PROP_FPS)
+        self._fps = fps if fps > 0 else Consts.DEFAULT_FPS
+        self._frame_count = int(self._video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(self._video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self._video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if width > 0 and height > 0:
+            self._source_size = (width, height)
+            self._frame_buffer.allocate(height, width)
+            if self._frame_cache is not None:
+                # ? Frames are decoded straight into cache memory when the cache holds many more of them than
+                # ? can be in use outside it at once, in the ring and on screen. Otherwise they are copied in.
+                frame_capacity = self._frame_cache.get_frame_capacity(width * height * Consts.FRAME_CHANNELS)
+                self._is_frame_cache_adopting = frame_capacity > 2 * self._frame_buffer.capacity
+        if self._keyframe_index_build is not None:
+            self._keyframe_index_build.add_done_callback(self._on_keyframe_index_built)
+        else:
+            KeyframeIndexer(self._video_path).start(self._set_keyframe_index)
+        return True
     
     def get_fps(self) -> float:
-        if self._video_capture:
-            fps = self._video_capture.get(cv2.CAP_PROP_FPS)
-            return fps if fps > 0 else 30.0
-        return 30.0
+        return self._fps
+
+    def get_frame_count(self) -> int:
+        return self._frame_count
+
+    def get_frame_position(self) -> int:
+        return self._frame_position
+
+    def set_frame_ready_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        # ? Called on the decode thread after each frame is published
+        self._frame_ready_callback = callback
+
+    def get_source_size(self) -> Optional[Tuple[int, int]]:
+        return self._source_size
+
+    def set_frame_listener(self, listener: Optional[Callable[[np.ndarray, int], None]]) -> None:
+        # ? Sees every decoded frame on the decoding thread before it is queued, so it has to be quick
+        self._frame_listener = listener
+
+    def set_decode_downscaled(self, is_downscaled: bool) -> None:
+        # ? Small views get frames shrunk on the decode worker, the GUI thread then only converts color
+        self._is_decode_downscaled = is_downscaled
+
+    def set_decode_priority(self, priority: DecodePriority) -> None:
+        if self._decode_scheduler is not None and self._decode_stream_id is not None:
+            self._decode_scheduler.set_priority(self._decode_stream_id, priority)
+
+    def start_decoding(self) -> None:
+        if self._is_decoding or not self._video_capture:
+            return
+        self._restore_capture_position()
+        self._is_decoding = True
+        self._clock.set_time(self._frame_time_ms(self._decoded_frame_index))
+        if not self._is_decode_paused:
+            self._clock.start()
+        if self._decode_scheduler is not None:
+            self._decode_stream_id = self._decode_scheduler.register(self._decode_step)
+            return
+        self._decode_thread = Thread(target=self._decode_thread_handle, daemon=True)
+        self._decode_thread.start()
+
+    def set_paused(self, is_paused: bool) -> None:
+        self._is_decode_paused = is_paused
+        if not is_paused and self._is_decoding:
+            with self._seek_lock:
+                if self._resume_frame is not None and self._pending_seek is None:
+                    self._pending_seek = self._resume_frame
+                    self._is_backfill_pending = False
+                self._resume_frame = None
+        if is_paused:
+            self._clock.pause()
+        else:
+            self._clock.start()
+        self._wake_decoder()
+
+    def get_speed(self) -> float:
+        return self._clock.speed
+
+    def set_speed(self, speed: float) -> None:
+        self._clock.set_speed(min(max(speed, Consts.MIN_PLAYBACK_SPEED), Consts.MAX_PLAYBACK_SPEED))
+        self._wake_decoder()
+
+    def get_playback_stats(self) -> PlaybackStats:
+        return PlaybackStats(self._playback_stats.displayed_frames,
+                             self._skipped_frames + self._frame_buffer.dropped_frames,
+                             self._playback_stats.late_frames, self._playback_stats.drift_ms)
+
+    def get_next_frame_delay_ms(self) -> int:
+        frame_duration_ms = 1000.0 / self._fps
+        earliest_pts = self._frame_buffer.earliest_ready_pts()
+        if earliest_pts is None:
+            # ? Nothing decoded ahead yet, look again in a frame
+            delay_ms = frame_duration_ms / self._clock.speed
+        else:
+            delay_ms = (earliest_pts - self._clock.media_time_ms()) / self._clock.speed
+        return max(int(math.ceil(delay_ms)), Consts.MIN_TIMER_INTERVAL_MS)
+
+    def stop_decoding(self) -> None:
+        if not self._is_decoding:
+            return
+        self._is_decoding = False
+        self._decode_wakeup.set()
+        self._frame_buffer.close()
+        if self._decode_stream_id is not None:
+            self._decode_scheduler.unregister(self._decode_stream_id)
+            self._decode_stream_id = None
+        if self._decode_thread is not None:
+            self._decode_thread.join(Consts.DECODE_THREAD_JOIN_TIMEOUT)
+            self._decode_thread = None
+
+    def get_dropped_frames(self) -> int:
+        return self._frame_buffer.dropped_frames
+
+    def seek(self, frame_index: int) -> None:
+        self._seek(frame_index, False)
+
+    def step_frame(self, delta: int) -> bool:
+        # ? A frame still in the cache, or any frame of a frame store, is shown at once, without decoding,
+        # ? and True is returned. Any other is sought, and a step backward decodes the frames before it
+        # ? into the cache on the way.
+        if not self._video_capture or self._frame_position < 0:
+            return False
+        target = max(self._frame_position + delta, 0)
+        if self._frame_count > 0:
+            target = min(target, self._frame_count - 1)
+        cached = self._get_cached_frame(target)
+        if cached is None:
+            self._seek(target, delta < 0 and self._frame_cache is not None)
+            return False
+        with self._seek_lock:
+            self._pending_seek = None
+            self._is_backfill_pending = False
+            self._frame_buffer.discard_ready()
+            self._clock.set_time(self._frame_time_ms(target))
+            self._resume_frame = target + 1
+        self._step_buffer = cached
+        self._current_frame = cached
+        self._frame_position = target
+        return True
+
+    def get_frame_cache_stats(self) -> FrameCacheStats:
+        return self._frame_cache.get_stats() if self._frame_cache is not None else FrameCacheStats()
+
+    def seek_time(self, timestamp_ms: float) -> None:
+        self.seek(int(round(timestamp_ms * self._fps / 1000.0)))
     
     def read_frame(self) -> bool:
+        if self._is_decoding:
+            # ? Producer mode: take the newest slot that is due on the clock, decoding never happens here
+            start_ns = perf_counter_ns()
+            media_time_ms = self._clock.media_time_ms()
+            slot = self._frame_buffer.acquire_due_slot(media_time_ms + Consts.FRAME_DUE_TOLERANCE_MS)
+            if slot is None:
+                return False
+            self._metrics.record(PipelineStage.ACQUIRE, perf_counter_ns() - start_ns)
+            self._current_frame = slot.frame
+            self._frame_position = slot.frame_index
+            self._update_playback_stats(media_time_ms - slot.pts_ms)
+            return True
         if self._video_capture:
-            ret, frame = self._video_capture.read()
+            self._restore_capture_position()
+            # ? Decode straight into the previous frame's memory instead of copying
+            destination = self._get_decode_destination(self._current_frame)
+            start_ns = perf_counter_ns()
+            ret, frame = self._video_capture.read(destination)
+            if not ret and self._decoded_frame_index > 0:
+                # Loop video
+                self._seek_capture(0)
+                start_ns = perf_counter_ns()
+                ret, frame = self._video_capture.read(destination)
             if ret:
-                self._current_frame = frame.copy()
+                self._metrics.record(PipelineStage.DECODE, perf_counter_ns() - start_ns)
+                self._current_frame = frame
+                self._frame_position = self._decoded_frame_index
+                self._decoded_frame_index += 1
+                self._cache_frame(self._frame_position, frame)
+                if self._frame_listener is not None:
+                    self._frame_listener(frame, self._frame_position)
                 return True
-            else:
-                # Loop video
-                self._video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                return False
         return False
     
     def get_current_frame(self) -> Optional[np.ndarray]:
@@ -40,42 +277,299 @@ class VideoManager:
         if self._current_frame is not None:
             return cv2.cvtColor(self._current_frame, cv2.COLOR_BGR2RGB)
         return None
+
+    def set_display_size(self, width: int, height: int) -> None:
+        if width <= 0 or height <= 0:
+            return
+        self._display_size = (width, height)
+        self._geometry = None
+
+    def map_to_source(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        geometry = self._get_geometry()
+        return geometry.to_source(x, y) if geometry else None
     
-    def get_display_frame(self, click_point: Optional[Union[Point, Tuple[int, int]]], 
-                          label_width: int, label_height: int) -> Optional[np.ndarray]:
-        if self._current_frame is None:
+    def get_display_frame(self, click_point: Optional[Union[Point, Tuple[int, int]]],
+                          annotations: Optional[AnnotationBatch] = None,
+                          tracks: Optional[TrackSnapshot] = None,
+                          destination: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        geometry = self._get_geometry()
+        if geometry is None:
             return None
         
-        frame = self._current_frame.copy()
-        
+        marker = None
         if click_point:
             # Handle both Point dataclass and tuple
             if isinstance(click_point, Point):
                 x, y = click_point.x, click_point.y
             else:
                 x, y = click_point
-            
-            frame_h, frame_w = frame.shape[:2]
-            scaled_x = int(x * frame_w / label_width)
-            scaled_y = int(y * frame_h / label_height)
-            
-            cv2.circle(frame, (scaled_x, scaled_y), 8, (255, 0, 0), -1)
-            cv2.circle(frame, (scaled_x, scaled_y), 10, (255, 255, 255), 2)
+            marker = geometry.to_display(x, y)
         
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
+        # ? Overlay is drawn on the converted buffer, the decoded frame is never cloned
+        return self._display_renderer.render(self._current_frame, geometry, marker, destination,
+                                             annotations, tracks)
     
-    def draw_point(self, frame: np.ndarray, x: int, y: int, 
-                   frame_width: int, frame_height: int,
-                   label_width: int, label_height: int) -> np.ndarray:
-        scaled_x = int(x * frame_width / label_width)
-        scaled_y = int(y * frame_height / label_height)
-        
-        cv2.circle(frame, (scaled_x, scaled_y), 8, (255, 0, 0), -1)
-        cv2.circle(frame, (scaled_x, scaled_y), 10, (255, 255, 255), 2)
-        
-        return frame
-    
-    def release(self):
+    def release(self) -> None:
+        self.stop_decoding()
         if self._video_capture:
             self._video_capture.release()
+        if self._frame_cache is not None:
+            self._frame_cache.clear()
+
+    def _load_frame_store(self) -> bool:
+        # ? Every frame is already at hand: no keyframe index to build, no ring slots to allocate since
+        # ? slots are pointed at views of the store, and no frame cache, stepping reads the store itself
+        self._video_capture = FrameStoreCapture(self._frame_store)
+        self._fps = self._frame_store.fps if self._frame_store.fps > 0 else Consts.DEFAULT_FPS
+        self._frame_count = self._frame_store.written_count
+        self._source_size = self._frame_store.source_size
+        self._frame_cache = None
+        return self._frame_count > 0
+
+    def _get_cached_frame(self, frame_index: int) -> Optional[np.ndarray]:
+        if self._frame_store is not None:
+            return self._frame_store.get_frame(frame_index)
+        return self._frame_cache.get(frame_index, self._step_buffer) if self._frame_cache is not None else None
+
+    def _seek(self, frame_index: int, is_backfilling: bool) -> None:
+        if not self._video_capture:
+            return
+        if self._frame_count > 0:
+            frame_index = min(max(frame_index, 0), self._frame_count - 1)
+        if not self._is_decoding:
+            self._resume_frame = None
+            self._position_capture(frame_index, is_backfilling)
+            self.read_frame()
+            return
+        with self._seek_lock:
+            # ? Only the latest target matters while scrubbing, and frames from before it are dropped
+            self._pending_seek = frame_index
+            self._is_backfill_pending = is_backfilling
+            self._resume_frame = None
+            self._frame_buffer.discard_ready()
+            self._clock.set_time(self._frame_time_ms(frame_index))
+        self._wake_decoder()
+
+    def _on_keyframe_index_built(self, keyframe_index: Future) -> None:
+        if not keyframe_index.cancelled() and keyframe_index.exception() is None:
+            self._set_keyframe_index(keyframe_index.result())
+
+    def _set_keyframe_index(self, keyframe_index: KeyframeIndex) -> None:
+        if keyframe_index.frame_count > 0:
+            self._frame_count = keyframe_index.frame_count
+        self._keyframe_index = keyframe_index
+
+    def _wake_decoder(self) -> None:
+        self._decode_wakeup.set()
+        if self._decode_scheduler is not None and self._decode_stream_id is not None:
+            self._decode_scheduler.wake(self._decode_stream_id)
+
+    def _decode_thread_handle(self) -> None:
+        while self._is_decoding:
+            wait_seconds = self._decode_step()
+            if wait_seconds is None:
+                break
+            if wait_seconds > 0:
+                self._decode_wakeup.wait(None if wait_seconds == math.inf else wait_seconds)
+                self._decode_wakeup.clear()
+
+    def _decode_step(self) -> Optional[float]:
+        # ? The same step runs on the own thread or on a shared scheduler worker. Only the own thread
+        # ? blocks, on a full buffer under DropPolicy.BLOCK, a scheduler worker is shared with other
+        # ? streams and polls instead.
+        if not self._is_decoding:
+            return None
+        with self._seek_lock:
+            seek_target, self._pending_seek = self._pending_seek, None
+            is_backfilling, self._is_backfill_pending = self._is_backfill_pending, False
+            generation = self._frame_buffer.generation
+        if seek_target is None and self._is_decode_paused:
+            return math.inf
+        if seek_target is not None:
+            self._position_capture(seek_target, is_backfilling)
+            self._loop_offset_ms = 0.0
+        lead_seconds = self._get_decode_lead_seconds()
+        if lead_seconds > 0:
+            # ? Far enough ahead of the clock, decoding more would only get dropped
+            return lead_seconds
+        if self._skip_late_frames():
+            return 0.0
+        is_blocking = self._decode_scheduler is None and self._frame_buffer.drop_policy is DropPolicy.BLOCK
+        slot = self._frame_buffer.acquire_write_slot(is_blocking, Consts.DECODE_BLOCK_WAIT_SECONDS)
+        if slot is None:
+            if self._frame_buffer.is_closed:
+                return None
+            # ? A blocked wait that timed out goes round again at once, to pick up a seek or a pause
+            return 0.0 if is_blocking else Consts.DECODE_IDLE_WAIT_SECONDS
+        frame_index = self._decoded_frame_index
+        destination = self._get_decode_destination(slot.frame)
+        start_ns = perf_counter_ns()
+        ret, frame = self._read_into(destination)
+        if not ret and frame_index > 0:
+            # ? Loop video: decode frame 0 into the same slot so the wrap never shows a stale tick
+            self._wrap_to_start()
+            frame_index = self._decoded_frame_index
+            start_ns = perf_counter_ns()
+            ret, frame = self._read_into(destination)
+        if not ret:
+            # ? Nothing decodable even from the start, stop instead of spinning
+            self._frame_buffer.abort_write_slot(slot)
+            return None
+        self._metrics.record(PipelineStage.DECODE, perf_counter_ns() - start_ns)
+        self._decoded_frame_index = frame_index + 1
+        slot.frame = frame
+        self._cache_frame(frame_index, frame)
+        if self._frame_listener is not None:
+            self._frame_listener(frame, frame_index)
+        if (self._frame_buffer.commit_write_slot(slot, frame_index, self._pts_ms(frame_index), generation) and
+                self._frame_ready_callback is not None):
+            self._frame_ready_callback()
+        if self._metrics.is_enabled:
+            self._metrics.set_gauge(MetricGauge.QUEUE_DEPTH, self._frame_buffer.ready_count())
+        return 0.0
+
+    def _read_into(self, destination: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        display_size = self._display_size
+        if (not self._is_decode_downscaled or display_size is None or self._source_size is None or
+                display_size[0] >= self._source_size[0]):
+            # ? read() only reuses the destination when shape and type match
+            return self._video_capture.read(destination)
+        ret, self._downscale_buffer = self._video_capture.read(self._downscale_buffer)
+        if not ret:
+            return False, destination
+        if (destination is None or not destination.flags.writeable or
+                destination.shape[:2] != (display_size[1], display_size[0])):
+            # ? A slot that held a view of the frame store is given memory of its own
+            destination = np.empty((display_size[1], display_size[0], Consts.FRAME_CHANNELS), dtype=np.uint8)
+        cv2.resize(self._downscale_buffer, display_size, dst=destination, interpolation=cv2.INTER_AREA)
+        return True, destination
+
+    def _get_decode_lead_seconds(self) -> float:
+        frame_duration_ms = 1000.0 / self._fps
+        # ? One slot is held by the view and one is being written, the rest may run ahead
+        max_lead_ms = (self._frame_buffer.capacity - 2) * frame_duration_ms
+        lead_ms = self._pts_ms(self._decoded_frame_index) - self._clock.media_time_ms() - max_lead_ms
+        return lead_ms / 1000.0 / self._clock.speed if self._clock.is_running else 0.0
+
+    def _skip_late_frames(self) -> bool:
+        clock_frame = int((self._clock.media_time_ms() - self._loop_offset_ms) * self._fps / 1000.0)
+        if (clock_frame - self._decoded_frame_index <= 1 or
+                self._consecutive_skips >= Consts.MAX_CONSECUTIVE_SKIPS):
+            # ? A stream that cannot keep up still shows every few skips instead of starving
+            self._consecutive_skips = 0
+            return False
+        self._consecutive_skips += 1
+        position = self._decoded_frame_index
+        keyframe_index = self._keyframe_index
+        if self._frame_count > 0 and clock_frame >= self._frame_count:
+            # ? A whole pass or more behind: move to the clock's lap at once instead of decoding to the end
+            # ? of every lap in between, which a stream this far behind never manages
+            laps = clock_frame // self._frame_count
+            self._loop_offset_ms += laps * self._frame_time_ms(self._frame_count)
+            clock_frame -= laps * self._frame_count
+            keyframe = keyframe_index.nearest_keyframe(clock_frame) if keyframe_index else None
+            self._seek_capture(keyframe if keyframe is not None else clock_frame)
+            self._skipped_frames += laps * self._frame_count + self._decoded_frame_index - position
+            return True
+        keyframe = keyframe_index.nearest_keyframe(clock_frame) if keyframe_index else None
+        if keyframe is not None and keyframe - position > Consts.MIN_SEEK_SKIP_FRAMES:
+            # ? Whole GOPs behind the clock are jumped over instead of decoded. A seek costs about as
+            # ? much as grabbing a couple of dozen frames, so shorter gaps are grabbed through.
+            self._seek_capture(keyframe)
+        elif self._video_capture.grab():
+            # ? grab() skips the retrieve, color conversion and copy of a frame nobody will see
+            self._decoded_frame_index += 1
+        else:
+            self._wrap_to_start()
+            return True
+        self._skipped_frames += self._decoded_frame_index - position
+        return True
+
+    def _wrap_to_start(self) -> None:
+        self._loop_offset_ms += self._frame_time_ms(self._decoded_frame_index)
+        self._seek_capture(0)
+
+    def _pts_ms(self, frame_index: int) -> float:
+        return self._loop_offset_ms + self._frame_time_ms(frame_index)
+
+    def _frame_time_ms(self, frame_index: int) -> float:
+        return frame_index * 1000.0 / self._fps
+
+    def _update_playback_stats(self, drift_ms: float) -> None:
+        self._playback_stats.displayed_frames += 1
+        self._playback_stats.drift_ms = drift_ms
+        if drift_ms > 1000.0 / self._fps:
+            self._playback_stats.late_frames += 1
+
+    def _seek_capture(self, target: int) -> None:
+        keyframe_index = self._keyframe_index
+        keyframe = keyframe_index.nearest_keyframe(target) if keyframe_index else None
+        if keyframe is None:
+            # ? No index (yet): let OpenCV position on the target itself
+            keyframe = target
+        position = self._decoded_frame_index
+        # ? Decoding forward inside the current GOP is cheaper than repositioning the demuxer
+        if not keyframe <= position <= target:
+            if not self._video_capture.set(cv2.CAP_PROP_POS_FRAMES, keyframe):
+                self._video_capture.open(self._video_path)
+                keyframe = 0
+            position = keyframe
+        while position < target and self._video_capture.grab():
+            position += 1
+        self._decoded_frame_index = position
+
+    def _position_capture(self, target: int, is_backfilling: bool) -> None:
+        if is_backfilling:
+            self._backfill_cache(target)
+        else:
+            self._seek_capture(target)
+
+    def _backfill_cache(self, target: int) -> None:
+        # ? Stepping backward: the frames before the target, back to its keyframe, are decoded into the
+        # ? cache in the same pass that reaches it, so the next steps back do not each re-decode the GOP.
+        # ? At most half the cache is filled, the frames just stepped back from stay in it.
+        keyframe_index = self._keyframe_index
+        keyframe = keyframe_index.nearest_keyframe(target) if keyframe_index else None
+        frame_bytes = (self._source_size[0] * self._source_size[1] * Consts.FRAME_CHANNELS
+                       if self._source_size else 0)
+        start = target - self._frame_cache.get_frame_capacity(frame_bytes) // 2
+        self._seek_capture(max(start, keyframe if keyframe is not None else target))
+        # ? A newer seek makes the rest of the pass useless
+        while self._decoded_frame_index < target and self._pending_seek is None:
+            ret, frame = self._video_capture.read(self._get_decode_destination(self._backfill_buffer))
+            if not ret:
+                return
+            if not self._is_frame_cache_adopting:
+                self._backfill_buffer = frame
+            self._cache_frame(self._decoded_frame_index, frame)
+            self._decoded_frame_index += 1
+
+    def _get_decode_destination(self, destination: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        # ? An adopting cache hands out the memory of a frame it evicted, and keeps the frame decoded into it
+        return self._frame_cache.acquire_buffer() if self._is_frame_cache_adopting else destination
+
+    def _cache_frame(self, frame_index: int, frame: np.ndarray) -> None:
+        if self._is_frame_cache_adopting:
+            self._frame_cache.adopt(frame_index, frame)
+        elif self._frame_cache is not None:
+            self._frame_cache.put(frame_index, frame)
+
+    def _restore_capture_position(self) -> None:
+        # ? Only where no decode thread owns the capture
+        resume_frame, self._resume_frame = self._resume_frame, None
+        if resume_frame is not None:
+            self._seek_capture(resume_frame)
+
+    def _get_geometry(self) -> Optional[FrameGeometry]:
+        if self._current_frame is None:
+            return None
+        # ? Downscaled decodes and reduced frame stores still map clicks to pixels of the original video
+        frame_h, frame_w = self._current_frame.shape[:2]
+        if (self._is_decode_downscaled or self._frame_store is not None) and self._source_size is not None:
+            frame_w, frame_h = self._source_size
+        display_w, display_h = self._display_size or (frame_w, frame_h)
+        # ? Rebuilt only when the label is resized or the source size changes
+        if (self._geometry is None or self._geometry.source_width != frame_w or
+                self._geometry.source_height != frame_h):
+            self._geometry = FrameGeometry(frame_w, frame_h, display_w, display_h)
+        return self._geometry
@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from threading import Condition, Thread
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DecodePriority
+from infrastructure.factories.logger_factory import LoggerFactory
+
+# ? A decode step returns how long to wait before it wants to run again:
+# ? 0 runs again as soon as a worker is free, math.inf waits for wake(), None stops
+DecodeStep = Callable[[], Optional[float]]
+
+
+@dataclass
+class _ScheduledStream:
+    step: DecodeStep
+    priority: DecodePriority
+    version: int = 0
+    is_running: bool = False
+    is_woken: bool = False
+
+
+class DecodeScheduler:
+    def __init__(self, worker_count: int = 0) -> None:
+        if worker_count <= 0:
+            worker_count = max((os.cpu_count() or 1) - Consts.DECODE_UI_RESERVED_CORES, 1)
+        self._logger = LoggerFactory.get_logger_manager()
+        self._condition = Condition()
+        self._streams: Dict[int, _ScheduledStream] = {}
+        self._running_ids: Set[int] = set()
+        self._queue: List[Tuple[float, int, int, int]] = []
+        self._sequence = itertools.count()
+        self._stream_ids = itertools.count()
+        self._is_running = True
+        self._workers = [Thread(target=self._worker_thread_handle, daemon=True)
+                         for _ in range(worker_count)]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def register(self, step: DecodeStep,
+                 priority: DecodePriority = DecodePriority.VISIBLE) -> int:
+        with self._condition:
+            stream_id = next(self._stream_ids)
+            self._streams[stream_id] = _ScheduledStream(step, priority)
+            self._push_locked(stream_id, 0.0)
+            return stream_id
+
+    def unregister(self, stream_id: int) -> None:
+        with self._condition:
+            self._streams.pop(stream_id, None)
+            # ? A step that is already running finishes, wait so the caller can release its resources
+            while stream_id in self._running_ids:
+                self._condition.wait()
+
+    def set_priority(self, stream_id: int, priority: DecodePriority) -> None:
+        with self._condition:
+            stream = self._streams.get(stream_id)
+            if stream is not None and stream.priority != priority:
+                stream.priority = priority
+                if not stream.is_running:
+                    self._push_locked(stream_id, 0.0)
+
+    def wake(self, stream_id: int) -> None:
+        with self._condition:
+            stream = self._streams.get(stream_id)
+            if stream is None:
+                return
+            if stream.is_running:
+                stream.is_woken = True
+            else:
+                self._push_locked(stream_id, 0.0)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._is_running = False
+            self._streams.clear()
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(Consts.DECODE_THREAD_JOIN_TIMEOUT)
+
+    def _worker_thread_handle(self) -> None:
+        while True:
+            with self._condition:
+                stream_id = self._next_due_locked()
+                if stream_id is None:
+                    return
+                stream = self._streams[stream_id]
+                stream.is_running = True
+                stream.is_woken = False
+                self._running_ids.add(stream_id)
+            try:
+                wait_seconds = stream.step()
+            except Exception as e:
+                # ? One broken stream must not take a shared worker down with it
+                self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.DECODE_STEP_FAILED, logging.DEBUG,
+                                 stream_id, e)
+                wait_seconds = None
+            with self._condition:
+                stream.is_running = False
+                self._running_ids.discard(stream_id)
+                if self._streams.get(stream_id) is stream and wait_seconds is not None:
+                    if stream.is_woken:
+                        wait_seconds = 0.0
+                    if wait_seconds != math.inf:
+                        self._push_locked(stream_id, wait_seconds)
+                elif wait_seconds is None:
+                    self._streams.pop(stream_id, None)
+                self._condition.notify_all()
+
+    def _next_due_locked(self) -> Optional[int]:
+        while self._is_running:
+            while self._queue:
+                due_time, _, stream_id, version = self._queue[0]
+                stream = self._streams.get(stream_id)
+                if stream is None or stream.version != version or stream.is_running:
+                    # ? Superseded by a later wake or reschedule
+                    heapq.heappop(self._queue)
+                    continue
+                wait_seconds = due_time - time.monotonic()
+                if wait_seconds <= 0:
+                    heapq.heappop(self._queue)
+                    return stream_id
+                break
+            else:
+                wait_seconds = None
+            self._condition.wait(wait_seconds)
+        return None
+
+    def _push_locked(self, stream_id: int, wait_seconds: float) -> None:
+        stream = self._streams[stream_id]
+        stream.version += 1
+        # ? Lower priorities are simply pushed later, so focused streams win any contention
+        due_time = time.monotonic() + wait_seconds + self._priority_delay(stream.priority)
+        heapq.heappush(self._queue, (due_time, next(self._sequence), stream_id, stream.version))
+        self._condition.notify()
+
+    @staticmethod
+    def _priority_delay(priority: DecodePriority) -> float:
+        if priority == DecodePriority.VISIBLE:
+            return Consts.DECODE_VISIBLE_DELAY_SECONDS
+        if priority == DecodePriority.HIDDEN:
+            return Consts.DECODE_HIDDEN_DELAY_SECONDS
+        return 0.0
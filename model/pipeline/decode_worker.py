@@ -0,0 +1,93 @@
+import queue
+from typing import Any, Optional, Tuple
+
+from globals.enums.enums import DecodeCommand, DropPolicy
+from infrastructure.factories.metrics_factory import MetricsFactory
+from model.data_classes.decode_worker_settings import DecodeWorkerSettings
+from model.managers.video_manager import VideoManager
+from model.pipeline.shared_frame_ring import SharedFrameRing
+
+
+class DecodeWorker:
+    def __init__(self, settings: DecodeWorkerSettings, lock: Any, commands: Any, notifications: Any) -> None:
+        self._settings = settings
+        self._commands = commands
+        self._notifications = notifications
+        self._ring = SharedFrameRing.attach(settings.ring_name, settings.slot_count,
+                                            settings.frame_width, settings.frame_height, lock)
+        # ? The threaded manager does the clock, seeks and late-frame skipping, this process only hosts it
+        self._video_manager = VideoManager(settings.video_path, settings.buffer_capacity,
+                                           DropPolicy(settings.drop_policy))
+        self._output_size = settings.output_size
+        self._is_paused = settings.is_paused
+
+    @staticmethod
+    def main(settings: DecodeWorkerSettings, lock: Any, commands: Any, notifications: Any) -> None:
+        MetricsFactory.set_process_metrics_manager(settings.is_metrics_enabled)
+        worker = DecodeWorker(settings, lock, commands, notifications)
+        try:
+            worker.run()
+        finally:
+            worker.release()
+
+    def run(self) -> None:
+        if not self._video_manager.load_video():
+            return
+        self._video_manager.set_decode_downscaled(True)
+        self._video_manager.set_display_size(*self._output_size)
+        self._video_manager.set_speed(self._settings.speed)
+        # ? Not decoding yet, so this seek decodes the start frame right away and it is shown at once
+        self._video_manager.seek(self._settings.start_frame)
+        self._publish()
+        self._video_manager.set_paused(self._is_paused)
+        self._video_manager.start_decoding()
+        wait_seconds = 0.0
+        while True:
+            command = self._next_command(wait_seconds)
+            if command is not None:
+                if command[0] is DecodeCommand.STOP:
+                    return
+                self._apply(*command)
+                # ? Drain every queued command before decoding the next frame
+                wait_seconds = 0.0
+                continue
+            if self._video_manager.read_frame():
+                self._publish()
+            wait_seconds = self._video_manager.get_next_frame_delay_ms() / 1000.0
+
+    def release(self) -> None:
+        self._video_manager.release()
+        self._ring.close()
+
+    def _next_command(self, wait_seconds: float) -> Optional[Tuple[DecodeCommand, Any]]:
+        try:
+            if wait_seconds > 0:
+                return self._commands.get(timeout=wait_seconds)
+            return self._commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _apply(self, command: DecodeCommand, value: Any) -> None:
+        if command is DecodeCommand.SEEK:
+            self._video_manager.seek(value)
+        elif command is DecodeCommand.PAUSE:
+            self._is_paused = value
+            self._video_manager.set_paused(value)
+        elif command is DecodeCommand.SPEED:
+            self._video_manager.set_speed(value)
+        elif command is DecodeCommand.RESIZE:
+            self._output_size = value
+            self._video_manager.set_display_size(*value)
+
+    def _publish(self) -> None:
+        width, height = self._output_size
+        slot = self._ring.acquire_write_slot()
+        # ? Resize and color conversion write straight into shared memory
+        if self._video_manager.get_display_frame(
+                None, destination=self._ring.frame_view(slot, width, height)) is None:
+            return
+        self._ring.publish(slot, self._video_manager.get_frame_position(), width, height)
+        self._ring.write_stats(self._video_manager.get_playback_stats(), self._video_manager.get_frame_count())
+        if self._is_paused:
+            # ? While paused the GUI does not poll, a seek result has to be announced
+            self._notifications.put(self._video_manager.get_frame_position())
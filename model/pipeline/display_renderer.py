@@ -0,0 +1,117 @@
+from time import perf_counter_ns
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.enums.enums import PipelineStage
+from infrastructure.factories.metrics_factory import MetricsFactory
+from model.data_classes.annotation_batch import AnnotationBatch
+from model.data_classes.frame_geometry import FrameGeometry
+from model.data_classes.track_snapshot import TrackSnapshot
+from model.pipeline.overlay_renderer import OverlayRenderer
+
+
+class DisplayRenderer:
+    def __init__(self, buffer_count: int = Consts.DISPLAY_BUFFER_COUNT) -> None:
+        # ? The view keeps the last rendered buffer until the next one arrives, so it is
+        # ? never the one being written as long as there are at least two
+        self._buffer_count = max(buffer_count, Consts.DISPLAY_BUFFER_COUNT)
+        self._buffers: List[np.ndarray] = []
+        self._next_buffer = 0
+        self._scaled_buffer: Optional[np.ndarray] = None
+        self._overlay_renderer = OverlayRenderer()
+        self._metrics = MetricsFactory.get_metrics_manager()
+
+    def render(self, frame_bgr: np.ndarray, geometry: FrameGeometry,
+               marker: Optional[Tuple[int, int]] = None,
+               destination: Optional[np.ndarray] = None,
+               annotations: Optional[AnnotationBatch] = None,
+               tracks: Optional[TrackSnapshot] = None) -> np.ndarray:
+        display_shape = (geometry.display_height, geometry.display_width, frame_bgr.shape[2])
+        display_buffer = destination if destination is not None else self._next_display_buffer(display_shape)
+        start_ns = perf_counter_ns()
+        if frame_bgr.shape[:2] == display_shape[:2]:
+            cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=display_buffer)
+        else:
+            # ? Shrink first so color conversion and overlay only touch display pixels
+            scaled_buffer = self._get_scaled_buffer(display_shape)
+            cv2.resize(frame_bgr, (geometry.display_width, geometry.display_height),
+                       dst=scaled_buffer, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(scaled_buffer, cv2.COLOR_BGR2RGB, dst=display_buffer)
+        self._metrics.record(PipelineStage.COLOR_CONVERT, perf_counter_ns() - start_ns)
+        self._draw_overlay(display_buffer, geometry, marker, annotations, tracks)
+        return display_buffer
+
+    def render_rgb(self, frame_rgb: np.ndarray, geometry: FrameGeometry,
+                   marker: Optional[Tuple[int, int]] = None,
+                   annotations: Optional[AnnotationBatch] = None,
+                   tracks: Optional[TrackSnapshot] = None,
+                   destination: Optional[np.ndarray] = None) -> np.ndarray:
+        display_shape = (geometry.display_height, geometry.display_width, frame_rgb.shape[2])
+        if (destination is None and marker is None and not annotations and not tracks and
+                frame_rgb.shape == display_shape):
+            # ? Already converted at display size, shown as is without a copy
+            return frame_rgb
+        display_buffer = destination if destination is not None else self._next_display_buffer(display_shape)
+        start_ns = perf_counter_ns()
+        if frame_rgb.shape == display_shape:
+            np.copyto(display_buffer, frame_rgb)
+        else:
+            cv2.resize(frame_rgb, (geometry.display_width, geometry.display_height),
+                       dst=display_buffer, interpolation=cv2.INTER_AREA)
+        self._metrics.record(PipelineStage.COPY, perf_counter_ns() - start_ns)
+        self._draw_overlay(display_buffer, geometry, marker, annotations, tracks)
+        return display_buffer
+
+    @staticmethod
+    def draw_marker(frame_rgb: np.ndarray, x: int, y: int) -> None:
+        cv2.circle(frame_rgb, (x, y), Consts.MARKER_FILL_RADIUS,
+                   Consts.MARKER_FILL_COLOR_RGB, -1)
+        cv2.circle(frame_rgb, (x, y), Consts.MARKER_RING_RADIUS,
+                   Consts.MARKER_RING_COLOR_RGB, Consts.MARKER_RING_THICKNESS)
+
+    def _draw_overlay(self, frame_rgb: np.ndarray, geometry: FrameGeometry, marker: Optional[Tuple[int, int]],
+                      annotations: Optional[AnnotationBatch], tracks: Optional[TrackSnapshot]) -> None:
+        if marker is None and not annotations and not tracks:
+            return
+        start_ns = perf_counter_ns()
+        if tracks:
+            # ? Tracks move every frame, so the layer is recomposed with the frame's annotations on it
+            xs, ys = tracks.xs, tracks.ys
+            if annotations:
+                xs = np.concatenate((xs, annotations.xs))
+                ys = np.concatenate((ys, annotations.ys))
+            trails = [np.stack(geometry.to_display_array(trail[:, 0], trail[:, 1]), axis=1)
+                      for trail in tracks.trails if len(trail) > 1]
+            self._overlay_renderer.compose(frame_rgb.shape[:2], geometry.to_display_array(xs, ys), trails)
+            self._overlay_renderer.apply(frame_rgb)
+        elif annotations:
+            cache_key = None
+            if annotations.cache_key is not None:
+                cache_key = (annotations.cache_key, geometry.source_width, geometry.source_height)
+            if not self._overlay_renderer.is_cached(frame_rgb.shape[:2], cache_key):
+                # ? Points are only mapped to display pixels when the cached layer is stale
+                self._overlay_renderer.compose(frame_rgb.shape[:2],
+                                               geometry.to_display_array(annotations.xs, annotations.ys),
+                                               cache_key=cache_key)
+            self._overlay_renderer.apply(frame_rgb)
+        if marker is not None:
+            self.draw_marker(frame_rgb, marker[0], marker[1])
+        # ? Only frames that get an overlay count, empty ones would hide its cost in the percentiles
+        self._metrics.record(PipelineStage.OVERLAY, perf_counter_ns() - start_ns)
+
+    def _next_display_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        if not self._buffers or self._buffers[0].shape != shape:
+            self._buffers = [np.empty(shape, dtype=np.uint8)
+                             for _ in range(self._buffer_count)]
+            self._next_buffer = 0
+        display_buffer = self._buffers[self._next_buffer]
+        self._next_buffer = (self._next_buffer + 1) % self._buffer_count
+        return display_buffer
+
+    def _get_scaled_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        if self._scaled_buffer is None or self._scaled_buffer.shape != shape:
+            self._scaled_buffer = np.empty(shape, dtype=np.uint8)
+        return self._scaled_buffer
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+from model.data_classes.frame_cache_stats import FrameCacheStats
+
+
+class FrameCache:
+    # ? Decoded frames by frame index, least recently used evicted first, within a byte budget. The
+    # ? decode thread adds every frame it decodes, the GUI thread takes them back when stepping
+    # ? through frames it has already seen. With downscaling on, entries about to be evicted are first
+    # ? kept at a fraction of their size, and shown scaled back up, which is still no decode.
+    # ? The memory of evicted frames is handed out again to decode into, so a full cache allocates nothing.
+
+    def __init__(self, budget_bytes: int, is_downscaling: bool = False) -> None:
+        self._budget_bytes = max(budget_bytes, 0)
+        self._is_downscaling = is_downscaling
+        self._lock = Lock()
+        self._full: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._reduced: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        # ? Width and height the reduced entries are scaled back up to
+        self._full_size: Optional[Tuple[int, int]] = None
+        self._free: List[np.ndarray] = []
+        self._used_bytes = 0
+        self._reduced_bytes = 0
+        self._hits = 0
+        self._reduced_hits = 0
+        self._misses = 0
+
+    def get_frame_capacity(self, frame_bytes: int) -> int:
+        # ? How many full size frames of frame_bytes fit in the budget
+        return self._budget_bytes // frame_bytes if frame_bytes > 0 else 0
+
+    def acquire_buffer(self) -> Optional[np.ndarray]:
+        # ? The memory of an evicted frame to decode the next one into, None when there is none yet
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def put(self, frame_index: int, frame: np.ndarray) -> None:
+        # ? Copies the frame, the caller may decode into it again right after
+        self._add(frame_index, frame, True)
+
+    def adopt(self, frame_index: int, frame: np.ndarray) -> None:
+        # ? Keeps the frame itself. The caller never writes to it again, it is only reused through
+        # ? acquire_buffer once evicted, so it must be in use for less time than the cache takes to cycle.
+        self._add(frame_index, frame, False)
+
+    def get(self, frame_index: int, destination: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        # ? Copied out, a cached frame's memory is reused for a later one once it is evicted
+        with self._lock:
+            frame = self._full.get(frame_index)
+            if frame is not None:
+                self._full.move_to_end(frame_index)
+                self._hits += 1
+                if destination is None or destination.shape != frame.shape:
+                    return frame.copy()
+                np.copyto(destination, frame)
+                return destination
+            reduced = self._reduced.get(frame_index)
+            if reduced is None:
+                self._misses += 1
+                return None
+            self._reduced.move_to_end(frame_index)
+            self._hits += 1
+            self._reduced_hits += 1
+            if destination is not None and destination.shape[1::-1] != self._full_size:
+                destination = None
+            return cv2.resize(reduced, self._full_size, dst=destination, interpolation=cv2.INTER_LINEAR)
+
+    def contains(self, frame_index: int) -> bool:
+        with self._lock:
+            return frame_index in self._full or frame_index in self._reduced
+
+    def get_stats(self) -> FrameCacheStats:
+        with self._lock:
+            return FrameCacheStats(len(self._full) + len(self._reduced), len(self._reduced), self._used_bytes,
+                                   self._budget_bytes, self._hits, self._reduced_hits, self._misses)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear_locked()
+
+    def _add(self, frame_index: int, frame: np.ndarray, is_copied: bool) -> None:
+        if frame.nbytes > self._budget_bytes:
+            return
+        with self._lock:
+            if frame_index in self._full:
+                self._full.move_to_end(frame_index)
+                return
+            self._discard_reduced(frame_index)
+            if self._full_size != (frame.shape[1], frame.shape[0]):
+                # ? Another size, e.g. a new video: nothing cached before it can be shown any more
+                self._clear_locked()
+                self._full_size = (frame.shape[1], frame.shape[0])
+            self._make_room(frame.nbytes)
+            if is_copied:
+                entry = self._free.pop() if self._free else np.empty_like(frame)
+                np.copyto(entry, frame)
+                frame = entry
+            self._full[frame_index] = frame
+            self._used_bytes += frame.nbytes
+
+    def _make_room(self, frame_bytes: int) -> None:
+        while self._used_bytes + frame_bytes > self._budget_bytes:
+            if self._is_downscaling and self._full:
+                frame_index, frame = self._full.popitem(last=False)
+                self._used_bytes -= frame.nbytes
+                self._store_reduced(frame_index, frame)
+                self._release_buffer(frame)
+            elif self._reduced:
+                self._evict_reduced()
+            elif self._full:
+                frame = self._full.popitem(last=False)[1]
+                self._used_bytes -= frame.nbytes
+                self._release_buffer(frame)
+            else:
+                break
+
+    def _release_buffer(self, frame: np.ndarray) -> None:
+        # ? A few are enough, the decoder takes one per frame and each frame evicts about one
+        if len(self._free) < Consts.FRAME_CACHE_FREE_BUFFERS:
+            self._free.append(frame)
+
+    def _store_reduced(self, frame_index: int, frame: np.ndarray) -> None:
+        height, width = frame.shape[:2]
+        reduced_size = (max(width // Consts.FRAME_CACHE_REDUCED_SCALE, 1),
+                        max(height // Consts.FRAME_CACHE_REDUCED_SCALE, 1))
+        reduced = cv2.resize(frame, reduced_size, interpolation=cv2.INTER_AREA)
+        self._reduced[frame_index] = reduced
+        self._reduced_bytes += reduced.nbytes
+        self._used_bytes += reduced.nbytes
+        # ? The reduced entries never take more than their share, the full ones are what steps hit most
+        while self._reduced_bytes > self._budget_bytes * Consts.FRAME_CACHE_REDUCED_SHARE:
+            self._evict_reduced()
+
+    def _evict_reduced(self) -> None:
+        evicted = self._reduced.popitem(last=False)[1]
+        self._reduced_bytes -= evicted.nbytes
+        self._used_bytes -= evicted.nbytes
+
+    def _discard_reduced(self, frame_index: int) -> None:
+        reduced = self._reduced.pop(frame_index, None)
+        if reduced is not None:
+            self._reduced_bytes -= reduced.nbytes
+            self._used_bytes -= reduced.nbytes
+
+    def _clear_locked(self) -> None:
+        self._full.clear()
+        self._reduced.clear()
+        self._free.clear()
+        self._used_bytes = 0
+        self._reduced_bytes = 0
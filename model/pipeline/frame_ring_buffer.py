@@ -0,0 +1,152 @@
+import time
+from threading import Condition
+from typing import List, Optional
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from globals.enums.enums import DropPolicy, SlotState
+from model.data_classes.frame_slot import FrameSlot
+
+
+class FrameRingBuffer:
+    def __init__(self, capacity: int = Consts.FRAME_BUFFER_CAPACITY,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST) -> None:
+        # ? One slot is held by the consumer and one is being written, so less than two would stall
+        capacity = max(capacity, Consts.MIN_FRAME_BUFFER_CAPACITY)
+        self._slots: List[FrameSlot] = [FrameSlot() for _ in range(capacity)]
+        self._drop_policy = drop_policy
+        self._condition = Condition()
+        self._write_sequence = 0
+        self._dropped_frames = 0
+        self._generation = 0
+        self._is_closed = False
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def drop_policy(self) -> DropPolicy:
+        return self._drop_policy
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def allocate(self, height: int, width: int, channels: int = Consts.FRAME_CHANNELS) -> None:
+        with self._condition:
+            for slot in self._slots:
+                if slot.state != SlotState.READING:
+                    slot.frame = np.empty((height, width, channels), dtype=np.uint8)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def acquire_write_slot(self, block: bool = True, timeout: Optional[float] = None) -> Optional[FrameSlot]:
+        # ? A blocked writer wakes when a slot is released, discarded or the buffer is closed, or after timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._is_closed:
+                slot = self._find_free_slot()
+                if slot is None and self._drop_policy == DropPolicy.DROP_OLDEST:
+                    slot = self._find_oldest_ready_slot()
+                    if slot is not None:
+                        self._dropped_frames += 1
+                if slot is not None:
+                    slot.state = SlotState.WRITING
+                    return slot
+                if not block:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            return None
+
+    def commit_write_slot(self, slot: FrameSlot, frame_index: int, pts_ms: float = 0.0,
+                          generation: Optional[int] = None) -> bool:
+        with self._condition:
+            if generation is not None and generation != self._generation:
+                # ? Decoded before a discard, e.g. a seek, so it must never be shown
+                slot.state = SlotState.FREE
+                self._condition.notify_all()
+                return False
+            self._write_sequence += 1
+            slot.sequence = self._write_sequence
+            slot.frame_index = frame_index
+            slot.pts_ms = pts_ms
+            slot.state = SlotState.READY
+            self._condition.notify_all()
+            return True
+
+    def abort_write_slot(self, slot: FrameSlot) -> None:
+        with self._condition:
+            slot.state = SlotState.FREE
+            self._condition.notify_all()
+
+    def acquire_latest_slot(self) -> Optional[FrameSlot]:
+        with self._condition:
+            return self._acquire_locked(self._find_latest_ready_slot())
+
+    def acquire_due_slot(self, media_time_ms: float) -> Optional[FrameSlot]:
+        with self._condition:
+            due = [slot for slot in self._slots
+                   if slot.state == SlotState.READY and slot.pts_ms <= media_time_ms]
+            return self._acquire_locked(max(due, key=lambda slot: slot.sequence) if due else None)
+
+    def earliest_ready_pts(self) -> Optional[float]:
+        with self._condition:
+            ready = [slot.pts_ms for slot in self._slots if slot.state == SlotState.READY]
+            return min(ready) if ready else None
+
+    def discard_ready(self) -> None:
+        with self._condition:
+            self._generation += 1
+            for slot in self._slots:
+                if slot.state == SlotState.READY:
+                    slot.state = SlotState.FREE
+            self._condition.notify_all()
+
+    def ready_count(self) -> int:
+        with self._condition:
+            return sum(1 for slot in self._slots if slot.state == SlotState.READY)
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def _acquire_locked(self, chosen: Optional[FrameSlot]) -> Optional[FrameSlot]:
+        if chosen is None:
+            return None
+        for slot in self._slots:
+            if slot.state == SlotState.READING:
+                slot.state = SlotState.FREE
+            elif (slot.state == SlotState.READY and slot is not chosen and
+                  slot.sequence < chosen.sequence):
+                # ? Decoded but superseded before it was ever shown
+                slot.state = SlotState.FREE
+                self._dropped_frames += 1
+        chosen.state = SlotState.READING
+        self._condition.notify_all()
+        return chosen
+
+    def _find_free_slot(self) -> Optional[FrameSlot]:
+        for slot in self._slots:
+            if slot.state == SlotState.FREE:
+                return slot
+        return None
+
+    def _find_oldest_ready_slot(self) -> Optional[FrameSlot]:
+        ready = [slot for slot in self._slots if slot.state == SlotState.READY]
+        return min(ready, key=lambda slot: slot.sequence) if ready else None
+
+    def _find_latest_ready_slot(self) -> Optional[FrameSlot]:
+        ready = [slot for slot in self._slots if slot.state == SlotState.READY]
+        return max(ready, key=lambda slot: slot.sequence) if ready else None
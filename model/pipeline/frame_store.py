@@ -0,0 +1,113 @@
+import hashlib
+import os
+import struct
+from typing import Optional, Tuple
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+
+
+class FrameStore:
+    # ? Every decoded frame of one video in a single memory-mapped file: a header, the number of frames
+    # ? written and whether that is all of them, then the BGR pixels of each frame back to back, at the
+    # ? source size or a smaller height. A reader gets views into the mapping, nothing is decoded or
+    # ? copied, and the page cache keeps frames that were shown recently. The file name hashes the
+    # ? video's path, size and modification time like the thumbnail cache, so an edited video gets a
+    # ? new store. Frames are written in order and counted after they are flushed, so building the
+    # ? store resumes at the first frame that did not make it to disk.
+
+    def __init__(self, store_path: str, mapping: np.memmap, frame_count: int, width: int, height: int,
+                 source_size: Tuple[int, int], fps: float) -> None:
+        self.store_path = store_path
+        self.width = width
+        self.height = height
+        self.source_size = source_size
+        self.fps = fps
+        self._mapping = mapping
+        offset = Consts.FRAME_STORE_PROGRESS_OFFSET
+        # ? Frames written, and 1 once there are no more to come
+        self._progress = mapping[offset:offset + 2 * np.dtype(np.int64).itemsize].view(np.int64)
+        offset = Consts.FRAME_STORE_HEADER_SIZE
+        self.frames = mapping[offset:].reshape(frame_count, height, width, Consts.FRAME_CHANNELS)
+
+    @property
+    def written_count(self) -> int:
+        return int(self._progress[0])
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(self._progress[1])
+
+    @staticmethod
+    def get_store_path(video_path: str, height: int) -> Optional[str]:
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}|{height}"
+        file_name = hashlib.sha1(key.encode(ConstStrings.FRAME_STORE_KEY_ENCODING)).hexdigest()
+        return os.path.join(ConstStrings.FRAME_STORE_DIRECTORY, file_name + ConstStrings.FRAME_STORE_FILE_SUFFIX)
+
+    @staticmethod
+    def open(video_path: str, height: int, is_writable: bool = False) -> Optional["FrameStore"]:
+        # ? None when the video has no store yet. Readers map it read-only, only the builder writes.
+        store_path = FrameStore.get_store_path(video_path, height)
+        if store_path is None or not os.path.exists(store_path):
+            return None
+        try:
+            with open(store_path, "rb") as store_file:
+                header = store_file.read(struct.calcsize(ConstStrings.FRAME_STORE_HEADER_FORMAT))
+            (magic, version, frame_count, width, stored_height, source_width, source_height,
+             fps) = struct.unpack(ConstStrings.FRAME_STORE_HEADER_FORMAT, header)
+            size = FrameStore.get_file_size(frame_count, width, stored_height)
+            if (magic != ConstStrings.FRAME_STORE_MAGIC or version != Consts.FRAME_STORE_VERSION or
+                    os.path.getsize(store_path) != size):
+                return None
+            mapping = np.memmap(store_path, dtype=np.uint8, mode="r+" if is_writable else "r", shape=(size,))
+        except (OSError, ValueError, struct.error):
+            return None
+        return FrameStore(store_path, mapping, frame_count, width, stored_height, (source_width, source_height), fps)
+
+    @staticmethod
+    def create(video_path: str, height: int, frame_count: int, width: int, stored_height: int,
+               source_size: Tuple[int, int], fps: float) -> "FrameStore":
+        # ? Written under a temporary name and renamed, a reader never finds a half-made header.
+        # ? Raises OSError when the store cannot be written.
+        store_path = FrameStore.get_store_path(video_path, height)
+        if store_path is None:
+            raise FileNotFoundError(video_path)
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        temp_path = store_path + ConstStrings.TEMP_FILE_SUFFIX
+        with open(temp_path, "wb") as store_file:
+            store_file.write(struct.pack(ConstStrings.FRAME_STORE_HEADER_FORMAT, ConstStrings.FRAME_STORE_MAGIC,
+                                         Consts.FRAME_STORE_VERSION, frame_count, width, stored_height,
+                                         source_size[0], source_size[1], fps))
+            # ? Sparse where the file system allows it, the pixels take disk space as they are written
+            store_file.truncate(FrameStore.get_file_size(frame_count, width, stored_height))
+        os.replace(temp_path, store_path)
+        store = FrameStore.open(video_path, height, True)
+        if store is None:
+            raise OSError(f"'{store_path}' cannot be read back")
+        return store
+
+    @staticmethod
+    def get_file_size(frame_count: int, width: int, height: int) -> int:
+        return Consts.FRAME_STORE_HEADER_SIZE + frame_count * height * width * Consts.FRAME_CHANNELS
+
+    def get_frame(self, frame_index: int) -> Optional[np.ndarray]:
+        # ? A view into the file, valid as long as the store is open
+        if 0 <= frame_index < self.written_count:
+            return self.frames[frame_index]
+        return None
+
+    def mark_written(self, written_count: int, is_complete: bool = False) -> None:
+        # ? The pixels go to disk before the count that covers them
+        self._mapping.flush()
+        self._progress[0] = written_count
+        self._progress[1] = int(is_complete)
+        self._mapping.flush()
+
+    def flush(self) -> None:
+        self._mapping.flush()
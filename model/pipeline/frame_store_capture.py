@@ -0,0 +1,66 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from model.pipeline.frame_store import FrameStore
+
+
+class FrameStoreCapture:
+    # ? Reads a complete frame store through the part of cv2.VideoCapture the video manager uses, so
+    # ? playback, seeking and stepping run unchanged on top of it. read() hands out views into the
+    # ? mapping and ignores the destination, nothing is decoded or copied. The frame size reported is
+    # ? the source's, a store kept at a smaller height still maps clicks to source pixels.
+
+    def __init__(self, frame_store: FrameStore) -> None:
+        self._frame_store: Optional[FrameStore] = frame_store
+        self._position = 0
+
+    def isOpened(self) -> bool:
+        return self._frame_store is not None
+
+    def open(self, video_path: str) -> bool:
+        # ? Reopening only rewinds, the store stays mapped
+        self._position = 0
+        return self.isOpened()
+
+    def get(self, property_id: int) -> float:
+        frame_store = self._frame_store
+        if frame_store is None:
+            return 0.0
+        if property_id == cv2.CAP_PROP_FPS:
+            return frame_store.fps
+        if property_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(frame_store.written_count)
+        if property_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(frame_store.source_size[0])
+        if property_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(frame_store.source_size[1])
+        if property_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        return 0.0
+
+    def set(self, property_id: int, value: float) -> bool:
+        if property_id != cv2.CAP_PROP_POS_FRAMES or self._frame_store is None:
+            return False
+        position = int(value)
+        if not 0 <= position <= self._frame_store.written_count:
+            return False
+        self._position = position
+        return True
+
+    def grab(self) -> bool:
+        if self._frame_store is None or self._position >= self._frame_store.written_count:
+            return False
+        self._position += 1
+        return True
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        frame = self._frame_store.get_frame(self._position) if self._frame_store is not None else None
+        if frame is None:
+            return False, None
+        self._position += 1
+        return True, frame
+
+    def release(self) -> None:
+        self._frame_store = None
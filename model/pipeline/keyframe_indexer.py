@@ -0,0 +1,100 @@
+import hashlib
+import logging
+import os
+import tempfile
+from threading import Thread
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from infrastructure.factories.logger_factory import LoggerFactory
+from model.data_classes.keyframe_index import KeyframeIndex
+
+
+class KeyframeIndexer:
+    def __init__(self, video_path: str) -> None:
+        self._video_path = video_path
+        self._index_path = self.get_index_path(video_path)
+        self._logger = LoggerFactory.get_logger_manager()
+
+    def start(self, on_ready: Callable[[KeyframeIndex], None]) -> Thread:
+        thread = Thread(target=lambda: on_ready(self.load_or_build()), daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def get_index_path(video_path: str) -> Optional[str]:
+        # ? Named after the video's path, size and modification time, so a replaced video gets a new index
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        file_name = hashlib.sha1(key.encode(ConstStrings.KEYFRAME_INDEX_KEY_ENCODING)).hexdigest()
+        return os.path.join(ConstStrings.KEYFRAME_INDEX_DIRECTORY, file_name + ConstStrings.KEYFRAME_INDEX_FILE_SUFFIX)
+
+    def load_or_build(self) -> KeyframeIndex:
+        index = self._load()
+        if index is not None:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.KEYFRAME_INDEX_LOADED, logging.DEBUG,
+                             self._video_path, len(index.keyframes))
+            return index
+        index = self._build()
+        self._save(index)
+        return index
+
+    def _build(self) -> KeyframeIndex:
+        capture = cv2.VideoCapture(self._video_path)
+        fps = capture.get(cv2.CAP_PROP_FPS) or Consts.DEFAULT_FPS
+        # ? Raw mode only demuxes packets, so scanning a whole file costs no decoding
+        if not capture.set(cv2.CAP_PROP_FORMAT, Consts.RAW_STREAM_FORMAT):
+            frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            capture.release()
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.KEYFRAME_INDEX_UNSUPPORTED, logging.DEBUG,
+                             self._video_path)
+            return KeyframeIndex(frame_count, fps, np.empty(0, dtype=np.int64))
+        keyframes = []
+        frame_count = 0
+        while capture.grab():
+            if capture.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(frame_count)
+            frame_count += 1
+        capture.release()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.KEYFRAME_INDEX_BUILT, logging.DEBUG,
+                         self._video_path, len(keyframes), frame_count)
+        return KeyframeIndex(frame_count, fps, np.asarray(keyframes, dtype=np.int64))
+
+    def _load(self) -> Optional[KeyframeIndex]:
+        if self._index_path is None or not os.path.exists(self._index_path):
+            return None
+        try:
+            with np.load(self._index_path) as data:
+                if int(data["version"]) != Consts.KEYFRAME_INDEX_VERSION:
+                    return None
+                return KeyframeIndex(int(data["frame_count"]), float(data["fps"]),
+                                     data["keyframes"].astype(np.int64))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _save(self, index: KeyframeIndex) -> None:
+        if self._index_path is None:
+            return
+        temp_path = None
+        try:
+            os.makedirs(ConstStrings.KEYFRAME_INDEX_DIRECTORY, exist_ok=True)
+            # ? A name of its own, another process may be saving the same index at the same time
+            file_descriptor, temp_path = tempfile.mkstemp(ConstStrings.TEMP_FILE_SUFFIX,
+                                                          dir=ConstStrings.KEYFRAME_INDEX_DIRECTORY)
+            with os.fdopen(file_descriptor, "wb") as index_file:
+                np.savez(index_file, version=Consts.KEYFRAME_INDEX_VERSION,
+                         frame_count=index.frame_count, fps=index.fps, keyframes=index.keyframes)
+            os.replace(temp_path, self._index_path)
+        except OSError as e:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.KEYFRAME_INDEX_SAVE_FAILED, logging.DEBUG,
+                             self._video_path, e)
@@ -0,0 +1,130 @@
+from typing import Hashable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from globals.consts.consts import Consts
+
+
+class OverlayRenderer:
+    # ? Everything drawn on top of the video is composed once into a cached layer and mask, each
+    # ? frame then costs one masked copy however many markers and lines the layer holds
+
+    def __init__(self) -> None:
+        ring_inner = Consts.MARKER_RING_RADIUS - Consts.MARKER_RING_THICKNESS // 2
+        ring_outer = Consts.MARKER_RING_RADIUS + Consts.MARKER_RING_THICKNESS // 2
+        self._margin = ring_outer
+        self._fill_kernel = self._disk(Consts.MARKER_FILL_RADIUS)
+        self._ring_inner_kernel = self._disk(ring_inner)
+        self._ring_outer_kernel = self._disk(ring_outer)
+        self._cache_key: Optional[Hashable] = None
+        self._shape: Optional[Tuple[int, int]] = None
+        self._layer: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+        self._centers: Optional[np.ndarray] = None
+        self._fill_image: Optional[np.ndarray] = None
+        self._ring_image: Optional[np.ndarray] = None
+        # ? top, bottom, left, right of everything drawn, None while the layer is empty
+        self._roi: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self._roi is None
+
+    def invalidate(self) -> None:
+        self._cache_key = None
+
+    def is_cached(self, shape: Tuple[int, int], cache_key: Optional[Hashable]) -> bool:
+        return cache_key is not None and cache_key == self._cache_key and shape == self._shape
+
+    def compose(self, shape: Tuple[int, int], markers: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                polylines: Optional[List[np.ndarray]] = None, boxes: Optional[np.ndarray] = None,
+                cache_key: Optional[Hashable] = None) -> bool:
+        # ? Returns False when the cached layer already shows this content
+        if self.is_cached(shape, cache_key):
+            return False
+        self._cache_key = cache_key
+        self._allocate(shape)
+        if self._roi is not None:
+            # ? Only the mask decides what is copied, so the layer itself never needs clearing
+            top, bottom, left, right = self._roi
+            self._mask[top:bottom, left:right] = 0
+            self._roi = None
+        if polylines:
+            # ? One call rasterizes every track
+            cv2.polylines(self._layer, polylines, False, Consts.TRACK_COLOR_RGB, Consts.OVERLAY_LINE_THICKNESS)
+            cv2.polylines(self._mask, polylines, False, 255, Consts.OVERLAY_LINE_THICKNESS)
+            self._roi = (0, shape[0], 0, shape[1])
+        if boxes is not None and len(boxes):
+            corners = self._box_corners(boxes)
+            cv2.polylines(self._layer, corners, True, Consts.BOX_COLOR_RGB, Consts.OVERLAY_LINE_THICKNESS)
+            cv2.polylines(self._mask, corners, True, 255, Consts.OVERLAY_LINE_THICKNESS)
+            self._roi = (0, shape[0], 0, shape[1])
+        if markers is not None and len(markers[0]):
+            # ? Last, so markers sit on top of the lines leading to them
+            self._draw_markers(*markers)
+        return True
+
+    def apply(self, frame_rgb: np.ndarray) -> None:
+        if self._roi is None or frame_rgb.shape[:2] != self._shape:
+            return
+        top, bottom, left, right = self._roi
+        cv2.copyTo(self._layer[top:bottom, left:right], self._mask[top:bottom, left:right],
+                   frame_rgb[top:bottom, left:right])
+
+    @staticmethod
+    def _disk(radius: int) -> np.ndarray:
+        return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * radius + 1, 2 * radius + 1))
+
+    @staticmethod
+    def _box_corners(boxes: np.ndarray) -> List[np.ndarray]:
+        x0, y0, x1, y1 = (boxes[:, index].astype(np.int32) for index in range(4))
+        corners = np.stack((np.stack((x0, y0), 1), np.stack((x1, y0), 1),
+                            np.stack((x1, y1), 1), np.stack((x0, y1), 1)), axis=1)
+        return list(corners)
+
+    def _allocate(self, shape: Tuple[int, int]) -> None:
+        if shape == self._shape:
+            return
+        self._shape = shape
+        self._roi = None
+        self._layer = np.zeros(shape + (Consts.FRAME_CHANNELS,), dtype=np.uint8)
+        self._mask = np.zeros(shape, dtype=np.uint8)
+        self._centers = np.zeros(shape, dtype=np.uint8)
+        # ? Solid color sources for the masked copies that paint fills and rings
+        self._fill_image = np.empty_like(self._layer)
+        self._fill_image[:] = Consts.ANNOTATION_FILL_COLOR_RGB
+        self._ring_image = np.empty_like(self._layer)
+        self._ring_image[:] = Consts.MARKER_RING_COLOR_RGB
+
+    def _draw_markers(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        height, width = self._shape
+        top, bottom = max(int(ys.min()) - self._margin, 0), min(int(ys.max()) + self._margin + 1, height)
+        left, right = max(int(xs.min()) - self._margin, 0), min(int(xs.max()) + self._margin + 1, width)
+        if self._roi is None:
+            self._roi = (top, bottom, left, right)
+        if len(xs) <= Consts.OVERLAY_CIRCLE_LIMIT:
+            # ? A handful of markers is cheaper drawn one by one than dilated over their bounding box
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                cv2.circle(self._layer, (x, y), Consts.MARKER_FILL_RADIUS, Consts.ANNOTATION_FILL_COLOR_RGB, -1)
+                cv2.circle(self._mask, (x, y), Consts.MARKER_FILL_RADIUS, 255, -1)
+                cv2.circle(self._layer, (x, y), Consts.MARKER_RING_RADIUS,
+                           Consts.MARKER_RING_COLOR_RGB, Consts.MARKER_RING_THICKNESS)
+                cv2.circle(self._mask, (x, y), Consts.MARKER_RING_RADIUS, 255, Consts.MARKER_RING_THICKNESS)
+            return
+        # ? Many markers: mark every centre, then grow fills and rings with one dilation each, so the
+        # ? cost depends on the covered area and not on the marker count. Where markers overlap,
+        # ? fills win over rings instead of the last drawn marker winning.
+        centers = self._centers[top:bottom, left:right]
+        centers.fill(0)
+        centers[ys - top, xs - left] = 255
+        fill = cv2.dilate(centers, self._fill_kernel)
+        ring = cv2.subtract(cv2.dilate(centers, self._ring_outer_kernel),
+                            cv2.dilate(centers, self._ring_inner_kernel))
+        layer = self._layer[top:bottom, left:right]
+        cv2.copyTo(self._ring_image[top:bottom, left:right], ring, layer)
+        cv2.copyTo(self._fill_image[top:bottom, left:right], fill, layer)
+        # ? Or-ed in, lines drawn before may cross the markers' box
+        mask = self._mask[top:bottom, left:right]
+        np.bitwise_or(mask, fill, out=mask)
+        np.bitwise_or(mask, ring, out=mask)
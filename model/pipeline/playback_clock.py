@@ -0,0 +1,54 @@
+import time
+from threading import Lock
+
+
+class PlaybackClock:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._base_media_ms = 0.0
+        self._base_monotonic = time.monotonic()
+        self._speed = 1.0
+        self._is_running = False
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def media_time_ms(self) -> float:
+        with self._lock:
+            return self._media_time_ms_locked()
+
+    def start(self) -> None:
+        with self._lock:
+            self._rebase_locked()
+            self._is_running = True
+
+    def pause(self) -> None:
+        with self._lock:
+            self._rebase_locked()
+            self._is_running = False
+
+    def set_time(self, media_time_ms: float) -> None:
+        with self._lock:
+            self._base_media_ms = media_time_ms
+            self._base_monotonic = time.monotonic()
+
+    def set_speed(self, speed: float) -> None:
+        with self._lock:
+            # ? Rebase first so the media time already elapsed keeps the old rate
+            self._rebase_locked()
+            self._speed = speed
+
+    def _media_time_ms_locked(self) -> float:
+        if not self._is_running:
+            return self._base_media_ms
+        elapsed_ms = (time.monotonic() - self._base_monotonic) * 1000.0
+        return self._base_media_ms + elapsed_ms * self._speed
+
+    def _rebase_locked(self) -> None:
+        self._base_media_ms = self._media_time_ms_locked()
+        self._base_monotonic = time.monotonic()
@@ -0,0 +1,129 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from globals.consts.consts import Consts
+from model.data_classes.playback_stats import PlaybackStats
+
+
+class SharedFrameRing:
+    # ? Header fields, one int64 each
+    _LATEST_SLOT = 0
+    _HELD_SLOT = 1
+    _PREVIOUS_HELD_SLOT = 2
+    _SEQUENCE = 3
+    _DISPLAYED_FRAMES = 4
+    _DROPPED_FRAMES = 5
+    _LATE_FRAMES = 6
+    _DRIFT_US = 7
+    _FRAME_COUNT = 8
+    _HEADER_FIELDS = 9
+
+    # ? Per slot fields, one int64 each
+    _SLOT_SEQUENCE = 0
+    _SLOT_FRAME_INDEX = 1
+    _SLOT_WIDTH = 2
+    _SLOT_HEIGHT = 3
+    _SLOT_FIELDS = 4
+
+    def __init__(self, shared_memory: SharedMemory, slot_count: int, frame_width: int,
+                 frame_height: int, lock: Any, is_owner: bool) -> None:
+        self._shared_memory = shared_memory
+        self._slot_count = slot_count
+        self._lock = lock
+        self._is_owner = is_owner
+        header_bytes = self._HEADER_FIELDS * 8
+        slots_bytes = slot_count * self._SLOT_FIELDS * 8
+        self._header = np.ndarray((self._HEADER_FIELDS,), dtype=np.int64, buffer=shared_memory.buf)
+        self._slots = np.ndarray((slot_count, self._SLOT_FIELDS), dtype=np.int64,
+                                 buffer=shared_memory.buf, offset=header_bytes)
+        self._frames = np.ndarray((slot_count, frame_width * frame_height * Consts.FRAME_CHANNELS),
+                                  dtype=np.uint8, buffer=shared_memory.buf, offset=header_bytes + slots_bytes)
+
+    @staticmethod
+    def create(slot_count: int, frame_width: int, frame_height: int, lock: Any) -> "SharedFrameRing":
+        slot_count = max(slot_count, Consts.MIN_SHARED_FRAME_SLOTS)
+        size = ((SharedFrameRing._HEADER_FIELDS + slot_count * SharedFrameRing._SLOT_FIELDS) * 8 +
+                slot_count * frame_width * frame_height * Consts.FRAME_CHANNELS)
+        ring = SharedFrameRing(SharedMemory(create=True, size=size), slot_count,
+                               frame_width, frame_height, lock, True)
+        ring._header[:] = 0
+        ring._header[[ring._LATEST_SLOT, ring._HELD_SLOT, ring._PREVIOUS_HELD_SLOT]] = Consts.NO_SLOT
+        ring._slots[:] = 0
+        return ring
+
+    @staticmethod
+    def attach(name: str, slot_count: int, frame_width: int, frame_height: int,
+               lock: Any) -> "SharedFrameRing":
+        # ? Workers are spawned from the owner and share its resource tracker, so attaching does not
+        # ? hand them the unlink
+        return SharedFrameRing(SharedMemory(name=name), slot_count, frame_width, frame_height, lock, False)
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def slot_count(self) -> int:
+        return self._slot_count
+
+    def acquire_write_slot(self) -> int:
+        with self._lock:
+            # ? The latest frame and the two the GUI may still be painting are never overwritten
+            busy = (self._header[self._LATEST_SLOT], self._header[self._HELD_SLOT],
+                    self._header[self._PREVIOUS_HELD_SLOT])
+            free = [slot for slot in range(self._slot_count) if slot not in busy]
+            return min(free, key=lambda slot: self._slots[slot, self._SLOT_SEQUENCE])
+
+    def frame_view(self, slot: int, width: int, height: int) -> np.ndarray:
+        return self._frames[slot, :width * height * Consts.FRAME_CHANNELS].reshape(
+            height, width, Consts.FRAME_CHANNELS)
+
+    def publish(self, slot: int, frame_index: int, width: int, height: int) -> int:
+        with self._lock:
+            sequence = int(self._header[self._SEQUENCE]) + 1
+            self._slots[slot] = (sequence, frame_index, width, height)
+            self._header[self._SEQUENCE] = sequence
+            self._header[self._LATEST_SLOT] = slot
+            return sequence
+
+    def acquire_latest(self, last_sequence: int) -> Optional[Tuple[np.ndarray, int, int]]:
+        with self._lock:
+            slot = int(self._header[self._LATEST_SLOT])
+            if slot == Consts.NO_SLOT:
+                return None
+            sequence, frame_index, width, height = (int(value) for value in self._slots[slot])
+            if sequence == last_sequence:
+                return None
+            if slot != self._header[self._HELD_SLOT]:
+                self._header[self._PREVIOUS_HELD_SLOT] = self._header[self._HELD_SLOT]
+                self._header[self._HELD_SLOT] = slot
+        return self.frame_view(slot, width, height), frame_index, sequence
+
+    def write_stats(self, stats: PlaybackStats, frame_count: int) -> None:
+        # ? Plain int64 stores, a torn read only skews one stats sample
+        self._header[self._DISPLAYED_FRAMES] = stats.displayed_frames
+        self._header[self._DROPPED_FRAMES] = stats.dropped_frames
+        self._header[self._LATE_FRAMES] = stats.late_frames
+        self._header[self._DRIFT_US] = int(stats.drift_ms * 1000.0)
+        self._header[self._FRAME_COUNT] = frame_count
+
+    def read_stats(self) -> PlaybackStats:
+        return PlaybackStats(int(self._header[self._DISPLAYED_FRAMES]),
+                             int(self._header[self._DROPPED_FRAMES]),
+                             int(self._header[self._LATE_FRAMES]),
+                             float(self._header[self._DRIFT_US]) / 1000.0)
+
+    def read_frame_count(self) -> int:
+        return int(self._header[self._FRAME_COUNT])
+
+    def close(self) -> None:
+        self._header = self._slots = self._frames = None
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            # ? A frame view is still on screen, the mapping goes away with the last view
+            pass
+        if self._is_owner:
+            self._shared_memory.unlink()
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import struct
+from typing import Optional
+
+import numpy as np
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from model.data_classes.thumbnails import Thumbnails
+
+
+class ThumbnailCache:
+    # ? Every thumbnail of one video in a single memory-mapped file: a header, the frame each slot
+    # ? shows, a filled flag per slot and the pixels. The file name hashes the video's path, size and
+    # ? modification time, so an edited video gets a new cache. Slots fill in any order and a flag is
+    # ? set after its pixels, so generation that was cut short resumes where it stopped.
+
+    def __init__(self, cache_path: str, mapping: np.memmap, count: int, height: int, width: int) -> None:
+        self.cache_path = cache_path
+        self._mapping = mapping
+        offset = Consts.THUMBNAIL_HEADER_SIZE
+        frame_indices = mapping[offset:offset + count * np.dtype(np.int64).itemsize].view(np.int64)
+        offset += frame_indices.nbytes
+        is_filled = mapping[offset:offset + count].view(np.bool_)
+        offset += count
+        images = mapping[offset:].reshape(count, height, width, Consts.FRAME_CHANNELS)
+        self.thumbnails = Thumbnails(images, frame_indices, is_filled)
+
+    @staticmethod
+    def get_cache_path(video_path: str) -> Optional[str]:
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return None
+        key = (f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}|"
+               f"{Consts.THUMBNAIL_COUNT}|{Consts.THUMBNAIL_HEIGHT}")
+        file_name = hashlib.sha1(key.encode(ConstStrings.THUMBNAIL_KEY_ENCODING)).hexdigest()
+        return os.path.join(ConstStrings.THUMBNAIL_DIRECTORY, file_name + ConstStrings.THUMBNAIL_FILE_SUFFIX)
+
+    @staticmethod
+    def open(video_path: str) -> Optional["ThumbnailCache"]:
+        # ? None when the video has no cache yet, only the header is read, the pixels are paged in when drawn
+        cache_path = ThumbnailCache.get_cache_path(video_path)
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as cache_file:
+                header = cache_file.read(struct.calcsize(ConstStrings.THUMBNAIL_HEADER_FORMAT))
+            magic, version, count, height, width = struct.unpack(ConstStrings.THUMBNAIL_HEADER_FORMAT, header)
+            size = ThumbnailCache._get_file_size(count, height, width)
+            if (magic != ConstStrings.THUMBNAIL_MAGIC or version != Consts.THUMBNAIL_CACHE_VERSION or
+                    count != Consts.THUMBNAIL_COUNT or height != Consts.THUMBNAIL_HEIGHT or
+                    os.path.getsize(cache_path) != size):
+                return None
+            mapping = np.memmap(cache_path, dtype=np.uint8, mode="r+", shape=(size,))
+        except (OSError, ValueError, struct.error):
+            return None
+        return ThumbnailCache(cache_path, mapping, count, height, width)
+
+    @staticmethod
+    def create(video_path: str, width: int) -> "ThumbnailCache":
+        # ? Written under a temporary name and renamed, a reader never finds a half-made header.
+        # ? Raises OSError when the cache cannot be written.
+        cache_path = ThumbnailCache.get_cache_path(video_path)
+        if cache_path is None:
+            raise FileNotFoundError(video_path)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = cache_path + ConstStrings.TEMP_FILE_SUFFIX
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(struct.pack(ConstStrings.THUMBNAIL_HEADER_FORMAT, ConstStrings.THUMBNAIL_MAGIC,
+                                         Consts.THUMBNAIL_CACHE_VERSION, Consts.THUMBNAIL_COUNT,
+                                         Consts.THUMBNAIL_HEIGHT, width))
+            # ? Extended with zeros, every slot starts out empty
+            cache_file.truncate(ThumbnailCache._get_file_size(Consts.THUMBNAIL_COUNT, Consts.THUMBNAIL_HEIGHT, width))
+        os.replace(temp_path, cache_path)
+        cache = ThumbnailCache.open(video_path)
+        if cache is None:
+            raise OSError(f"'{cache_path}' cannot be read back")
+        return cache
+
+    def store(self, slot: int, frame_index: int, image_rgb: np.ndarray) -> None:
+        self.thumbnails.images[slot] = image_rgb
+        self.thumbnails.frame_indices[slot] = frame_index
+        self.thumbnails.is_filled[slot] = True
+
+    def get_filled_count(self) -> int:
+        return int(np.count_nonzero(self.thumbnails.is_filled))
+
+    def flush(self) -> None:
+        self._mapping.flush()
+
+    @staticmethod
+    def _get_file_size(count: int, height: int, width: int) -> int:
+        return (Consts.THUMBNAIL_HEADER_SIZE + count * (np.dtype(np.int64).itemsize + 1) +
+                count * height * width * Consts.FRAME_CHANNELS)
@@ -0,0 +1,48 @@
+import struct
+from typing import List
+
+from globals.consts.const_collections import ConstCollections
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import SessionEventType
+from model.data_classes.session_event import SessionEvent
+
+
+class SessionReader:
+    @staticmethod
+    def read_events(path: str) -> List[SessionEvent]:
+        with open(path, "rb") as session_file:
+            data = session_file.read()
+        header = struct.Struct(ConstStrings.SESSION_HEADER_FORMAT)
+        if len(data) < header.size:
+            raise ValueError("not a session file")
+        magic, version = header.unpack_from(data)
+        if magic != ConstStrings.SESSION_MAGIC:
+            raise ValueError("not a session file")
+        if not Consts.SESSION_OLDEST_FORMAT_VERSION <= version <= Consts.SESSION_FORMAT_VERSION:
+            raise ValueError(f"unsupported session version {version}")
+        common = struct.Struct(ConstStrings.SESSION_EVENT_FORMAT)
+        payloads = {event_type: struct.Struct("<" + payload_format)
+                    for event_type, payload_format in ConstCollections.SESSION_PAYLOAD_FORMATS.items()}
+        events = []
+        offset = header.size
+        while offset + common.size <= len(data):
+            type_value, elapsed_ms, frame_index = common.unpack_from(data, offset)
+            event_type = SessionEventType(type_value)
+            payload = payloads[event_type]
+            if offset + common.size + payload.size > len(data):
+                break
+            values = payload.unpack_from(data, offset + common.size)
+            offset += common.size + payload.size
+            if event_type in ConstCollections.SESSION_SIZED_EVENTS:
+                *values, length = values
+                if offset + length > len(data):
+                    break
+                sized = data[offset:offset + length]
+                if event_type in ConstCollections.SESSION_TEXT_EVENTS:
+                    sized = sized.decode(ConstStrings.SESSION_TEXT_ENCODING)
+                values = (*values, sized)
+                offset += length
+            events.append(SessionEvent(event_type, elapsed_ms, frame_index, values))
+        # ? A recording cut off mid-event, by a crash for instance, replays up to its last whole event
+        return events
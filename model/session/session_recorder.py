@@ -0,0 +1,55 @@
+import struct
+import time
+from typing import BinaryIO
+
+from globals.consts.const_collections import ConstCollections
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import SessionEventType
+
+
+class SessionRecorder:
+    # ? Appends each event as a few packed bytes, a frame shown costs 9 bytes, so an hour at
+    # ? 30 fps stays around a megabyte. The file is only ever appended to, and a crash loses at
+    # ? most the last unflushed events.
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(struct.pack(ConstStrings.SESSION_HEADER_FORMAT, ConstStrings.SESSION_MAGIC,
+                                     Consts.SESSION_FORMAT_VERSION))
+        self._event_structs = {event_type: struct.Struct(ConstStrings.SESSION_EVENT_FORMAT + payload_format)
+                               for event_type, payload_format in ConstCollections.SESSION_PAYLOAD_FORMATS.items()}
+        self._start = time.perf_counter()
+        self._event_count = 0
+        self._unflushed_events = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def event_count(self) -> int:
+        return self._event_count
+
+    def record(self, event_type: SessionEventType, frame_index: int, *values) -> None:
+        if self._file.closed:
+            return
+        elapsed_ms = int((time.perf_counter() - self._start) * 1000.0)
+        event_struct = self._event_structs[event_type]
+        if event_type in ConstCollections.SESSION_SIZED_EVENTS:
+            *values, data = values
+            if event_type in ConstCollections.SESSION_TEXT_EVENTS:
+                data = data.encode(ConstStrings.SESSION_TEXT_ENCODING)
+            self._file.write(event_struct.pack(event_type.value, elapsed_ms, frame_index, *values, len(data)) + data)
+        else:
+            self._file.write(event_struct.pack(event_type.value, elapsed_ms, frame_index, *values))
+        self._event_count += 1
+        self._unflushed_events += 1
+        if self._unflushed_events >= Consts.SESSION_FLUSH_EVENTS:
+            self._file.flush()
+            self._unflushed_events = 0
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
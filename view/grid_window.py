@@ -0,0 +1,87 @@
+from typing import List
+from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QGridLayout, QLabel
+from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSlot
+
+from globals.consts.consts import Consts
+from globals.consts.const_styles import ConstStyles
+from view_model.grid_view_model import GridViewModel
+from view_model.video_tile_view_model import VideoTileViewModel
+from view.widgets.clickable_video_label import ClickableVideoLabel
+
+
+class GridWindow(QMainWindow):
+    def __init__(self, view_model: GridViewModel, video_paths: List[str]):
+        super().__init__()
+        self._view_model = view_model
+        self._video_labels: List[ClickableVideoLabel] = []
+        self._timer = QTimer()
+        self._init_ui()
+        self._register_signals_from_vm()
+        self._load_videos(video_paths)
+
+    def _init_ui(self):
+        # 1. Window Setup
+        self.setWindowTitle(f'Video Grid {self._view_model.rows}x{self._view_model.columns}')
+        self.setMinimumSize(800, 600)
+        self.setStyleSheet(ConstStyles.MAIN_WINDOW_STYLE)
+
+        # 2. Tiles
+        grid_layout = QGridLayout()
+        grid_layout.setSpacing(6)
+        grid_layout.setContentsMargins(10, 10, 10, 10)
+        for tile in self._view_model.get_tiles():
+            grid_layout.addLayout(self._create_tile(tile),
+                                  tile.tile_index // self._view_model.columns,
+                                  tile.tile_index % self._view_model.columns)
+
+        central_widget = QWidget()
+        central_widget.setLayout(grid_layout)
+        self.setCentralWidget(central_widget)
+
+    def _create_tile(self, tile: VideoTileViewModel) -> QVBoxLayout:
+        tile_layout = QVBoxLayout()
+        tile_layout.setSpacing(2)
+
+        video_label = ClickableVideoLabel()
+        video_label.setObjectName("TileVideoLabel")
+        video_label.setMinimumSize(Consts.GRID_TILE_MIN_WIDTH, Consts.GRID_TILE_MIN_HEIGHT)
+        video_label.clicked.connect(tile.update_coordinates_slot)
+        video_label.clicked.connect(lambda x, y, index=tile.tile_index: self._view_model.focus_tile(index))
+        video_label.resized.connect(tile.set_display_size)
+        tile.frame_ready_signal.connect(video_label.set_frame)
+        tile_layout.addWidget(video_label)
+        self._video_labels.append(video_label)
+
+        coordinates_label = QLabel("X=-, Y=-")
+        coordinates_label.setObjectName("TileCoordinatesLabel")
+        coordinates_label.setAlignment(Qt.AlignCenter)
+        tile.coordinates_changed_signal.connect(
+            lambda x, y, label=coordinates_label: label.setText(f"X={x}, Y={y}"))
+        tile_layout.addWidget(coordinates_label)
+        return tile_layout
+
+    def _register_signals_from_vm(self):
+        self._view_model.focused_tile_changed_signal.connect(self._on_focused_tile_changed)
+
+    def _load_videos(self, video_paths: List[str]):
+        self._view_model.load_videos(video_paths)
+        self._timer.timeout.connect(self._view_model.update_frames)
+        self._timer.start(Consts.GRID_TICK_INTERVAL_MS)
+
+    @pyqtSlot(int)
+    def _on_focused_tile_changed(self, tile_index: int) -> None:
+        for index, video_label in enumerate(self._video_labels):
+            video_label.setProperty("focused", index == tile_index)
+            video_label.style().unpolish(video_label)
+            video_label.style().polish(video_label)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            # ? Minimized tiles still advance, just behind every visible stream
+            self._view_model.set_visible(not self.isMinimized())
+        super().changeEvent(event)
+
+    def closeEvent(self, event):
+        self._timer.stop()
+        self._view_model.release()
+        super().closeEvent(event)
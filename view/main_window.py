@@ -1,19 +1,33 @@
+from typing import Optional
+
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QLabel, QPushButton)
-from PyQt5.QtCore import Qt, pyqtSlot, QTimer
-from PyQt5.QtGui import QImage, QPixmap
+                             QLabel, QPushButton, QSlider, QComboBox, QFileDialog, QMessageBox)
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
 
+from globals.consts.const_collections import ConstCollections
+from globals.consts.const_strings import ConstStrings
 from globals.consts.const_styles import ConstStyles
 from view_model.main_window_view_model import MainWindowViewModel
 from view.widgets.clickable_video_label import ClickableVideoLabel
+from view.widgets.thumbnail_strip import ThumbnailStrip
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, view_model: MainWindowViewModel):
+    first_frame_painted_signal = pyqtSignal()
+
+    def __init__(self, view_model: MainWindowViewModel, is_deferred_load: bool = True,
+                 video_path: Optional[str] = None):
         super().__init__()
         self._view_model = view_model
+        self._is_deferred_load = is_deferred_load
+        self._video_path = video_path
         self._coordinates_label = QLabel("Click on video: X=-, Y=-")
         self._video_label = ClickableVideoLabel()
+        # ? Child of the video label, so it floats over the frame in its top left corner
+        self._metrics_label = QLabel(self._video_label)
+        self._thumbnail_strip = ThumbnailStrip()
+        self._seek_slider = QSlider(Qt.Horizontal)
+        self._speed_combo = QComboBox()
         self._timer = QTimer()
         self._init_ui()
         self._register_signals_from_vm()
@@ -39,9 +53,29 @@ class MainWindow(QMainWindow):
         # Video display
         self._video_label.setObjectName("VideoLabel")
         self._video_label.setMinimumSize(640, 360)
-        self._video_label.setStyleSheet("background-color: black;")
+        self._video_label.setStyleSheet("background-color: black; color: gray;")
+        self._video_label.setAlignment(Qt.AlignCenter)
         self._video_label.clicked.connect(self._on_video_clicked)
+        self._video_label.right_clicked.connect(self._view_model.remove_annotation_slot)
+        self._video_label.resized.connect(self._view_model.set_display_size)
+        self._video_label.first_frame_painted.connect(self.first_frame_painted_signal)
         main_layout.addWidget(self._video_label)
+        self._metrics_label.setObjectName("MetricsLabel")
+        self._metrics_label.setStyleSheet(ConstStyles.METRICS_LABEL_STYLE)
+        self._metrics_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._metrics_label.move(8, 8)
+        self._metrics_label.hide()
+
+        # Thumbnail Strip
+        self._thumbnail_strip.setObjectName("ThumbnailStrip")
+        self._thumbnail_strip.seek_requested.connect(self._view_model.seek)
+        main_layout.addWidget(self._thumbnail_strip)
+
+        # Seek Bar
+        self._seek_slider.setObjectName("SeekSlider")
+        self._seek_slider.setRange(0, 0)
+        self._seek_slider.actionTriggered.connect(self._on_seek_action)
+        main_layout.addWidget(self._seek_slider)
 
         # Coordinates Display
         self._coordinates_label.setObjectName("CoordinatesLabel")
@@ -58,11 +92,82 @@ class MainWindow(QMainWindow):
         btn_play.clicked.connect(self._toggle_video)
         button_layout.addWidget(btn_play)
 
+        # Frame Stepping Buttons
+        btn_step_back = QPushButton("Step Back")
+        btn_step_back.setCursor(Qt.PointingHandCursor)
+        btn_step_back.clicked.connect(lambda: self._view_model.step_frame(-1))
+        button_layout.addWidget(btn_step_back)
+
+        self._btn_reverse = QPushButton("Reverse")
+        self._btn_reverse.setCheckable(True)
+        self._btn_reverse.setCursor(Qt.PointingHandCursor)
+        self._btn_reverse.clicked.connect(self._toggle_reverse)
+        button_layout.addWidget(self._btn_reverse)
+
+        btn_step_forward = QPushButton("Step Forward")
+        btn_step_forward.setCursor(Qt.PointingHandCursor)
+        btn_step_forward.clicked.connect(lambda: self._view_model.step_frame(1))
+        button_layout.addWidget(btn_step_forward)
+
+        # Playback Speed
+        for speed in ConstCollections.PLAYBACK_SPEEDS:
+            self._speed_combo.addItem(f"{speed:g}x", speed)
+        self._speed_combo.setCurrentIndex(ConstCollections.PLAYBACK_SPEEDS.index(1.0))
+        self._speed_combo.currentIndexChanged.connect(self._on_speed_changed)
+        button_layout.addWidget(self._speed_combo)
+
         # Clear Points Button
         btn_clear = QPushButton("Clear Points")
         btn_clear.setCursor(Qt.PointingHandCursor)
         btn_clear.clicked.connect(self._clear_points)
         button_layout.addWidget(btn_clear)
+
+        # Overlay Toggle Button
+        btn_overlay = QPushButton("Show/Hide Point")
+        btn_overlay.setCursor(Qt.PointingHandCursor)
+        btn_overlay.clicked.connect(self._toggle_overlay)
+        button_layout.addWidget(btn_overlay)
+
+        # Tracking Toggle Button
+        btn_track = QPushButton("Track Points")
+        btn_track.setCheckable(True)
+        btn_track.setCursor(Qt.PointingHandCursor)
+        btn_track.clicked.connect(self._toggle_tracking)
+        button_layout.addWidget(btn_track)
+
+        # Metrics Overlay Toggle Button
+        btn_metrics = QPushButton("Show/Hide Metrics")
+        btn_metrics.setCursor(Qt.PointingHandCursor)
+        btn_metrics.clicked.connect(self._toggle_metrics)
+        button_layout.addWidget(btn_metrics)
+
+        # Annotation Buttons
+        btn_undo = QPushButton("Undo")
+        btn_undo.setCursor(Qt.PointingHandCursor)
+        btn_undo.clicked.connect(self._view_model.undo_annotation)
+        button_layout.addWidget(btn_undo)
+
+        btn_export = QPushButton("Export Points")
+        btn_export.setCursor(Qt.PointingHandCursor)
+        btn_export.clicked.connect(self._export_annotations)
+        button_layout.addWidget(btn_export)
+
+        btn_import = QPushButton("Import Points")
+        btn_import.setCursor(Qt.PointingHandCursor)
+        btn_import.clicked.connect(self._import_annotations)
+        button_layout.addWidget(btn_import)
+
+        # Session Buttons
+        self._btn_record = QPushButton("Record Session")
+        self._btn_record.setCheckable(True)
+        self._btn_record.setCursor(Qt.PointingHandCursor)
+        self._btn_record.clicked.connect(self._toggle_recording)
+        button_layout.addWidget(self._btn_record)
+
+        btn_replay = QPushButton("Replay Session")
+        btn_replay.setCursor(Qt.PointingHandCursor)
+        btn_replay.clicked.connect(self._replay_session)
+        button_layout.addWidget(btn_replay)
         main_layout.addLayout(button_layout)
 
         central_widget = QWidget()
@@ -73,26 +178,45 @@ class MainWindow(QMainWindow):
         self._view_model.coordinates_changed_signal.connect(self._update_coordinates_slot)
         self._view_model.frame_ready_signal.connect(self._display_frame)
         self._view_model.status_message_signal.connect(self._display_status_message)
-        self._view_model.status_message_signal.connect(self._display_status_message)
+        self._view_model.playback_state_changed_signal.connect(self._on_playback_state_changed)
+        self._view_model.video_length_changed_signal.connect(self._on_video_length_changed)
+        self._view_model.frame_position_changed_signal.connect(self._on_frame_position_changed)
+        self._view_model.metrics_text_signal.connect(self._display_metrics)
+        self._view_model.video_placeholder_signal.connect(self._video_label.set_placeholder)
+        self._view_model.thumbnails_changed_signal.connect(self._thumbnail_strip.set_thumbnails)
+        self._view_model.thumbnail_ready_signal.connect(self._thumbnail_strip.update_thumbnail)
+        self._view_model.reverse_playback_changed_signal.connect(self._btn_reverse.setChecked)
 
     def _load_video(self):
-        if self._view_model.load_default_video():
-            fps = self._view_model.get_video_fps()
-            self._timer.setInterval(int(1000 / fps))
-            self._timer.timeout.connect(self._update_frame)
-            self._timer.start()   
+        # ? Re-armed after every tick with the time until the next frame is due
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._update_frame)
+        # ? Deferred, the window shows right away and the video opens in the background
+        if self._video_path is None:
+            self._view_model.load_default_video(is_async=self._is_deferred_load)
+        elif self._is_deferred_load:
+            self._view_model.load_video_async(self._video_path)
+        else:
+            self._view_model.load_video(self._video_path)
 
     def _update_frame(self):
-        label_width = self._video_label.width()
-        label_height = self._video_label.height()
-        self._view_model.update_frame(label_width, label_height)
+        next_frame_delay_ms = self._view_model.update_frame()
+        if self._view_model.is_playing():
+            self._timer.start(next_frame_delay_ms)
 
     @pyqtSlot(object)
     def _display_frame(self, frame_rgb):
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
-        q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        self._video_label.setPixmap(QPixmap.fromImage(q_image))
+        self._video_label.set_frame(frame_rgb)
+
+    @pyqtSlot(str)
+    def _display_metrics(self, text: str) -> None:
+        if not text:
+            self._metrics_label.hide()
+            return
+        self._metrics_label.setText(text)
+        self._metrics_label.adjustSize()
+        self._metrics_label.show()
 
     def _on_video_clicked(self, x: int, y: int):
         self._view_model.update_coordinates_slot(x, y)
@@ -108,5 +232,78 @@ class MainWindow(QMainWindow):
         is_playing = self._view_model.toggle_playback()
 
 
+    @pyqtSlot(bool)
+    def _on_playback_state_changed(self, is_playing: bool) -> None:
+        # ? Paused frames are only re-rendered when the view model invalidates them
+        if is_playing:
+            self._timer.start(0)
+        else:
+            self._timer.stop()
+
+    @pyqtSlot(int)
+    def _on_video_length_changed(self, frame_count: int) -> None:
+        self._seek_slider.setRange(0, max(frame_count - 1, 0))
+
+    @pyqtSlot(int)
+    def _on_frame_position_changed(self, frame_position: int) -> None:
+        if not self._seek_slider.isSliderDown():
+            self._seek_slider.setValue(frame_position)
+        self._thumbnail_strip.set_frame_position(frame_position)
+
+    def _on_seek_action(self, action: int) -> None:
+        # ? sliderPosition already holds the target, value() is only updated afterwards
+        self._view_model.seek(self._seek_slider.sliderPosition())
+
+    def _toggle_reverse(self):
+        self._btn_reverse.setChecked(self._view_model.toggle_reverse())
+
+    def _on_speed_changed(self, index: int) -> None:
+        self._view_model.set_playback_speed(self._speed_combo.itemData(index))
+
     def _clear_points(self):
-        self._view_model.clear_point()
\ No newline at end of file
+        self._view_model.clear_point()
+
+    def _toggle_overlay(self):
+        self._view_model.toggle_overlay()
+
+    def _toggle_metrics(self):
+        self._view_model.toggle_metrics()
+
+    def _toggle_tracking(self):
+        self._view_model.toggle_tracking()
+
+    def _export_annotations(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Points", "", ConstStrings.ANNOTATION_FILE_FILTER)
+        if path:
+            self._view_model.export_annotations(path)
+
+    def _import_annotations(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Points", "", ConstStrings.ANNOTATION_FILE_FILTER)
+        if not path:
+            return
+        is_replacing = False
+        if self._view_model.has_annotations():
+            # ? Imported points are added under new ids, importing a file twice would duplicate its points
+            answer = QMessageBox.question(self, "Import Points", "Replace the current points with the imported ones?",
+                                          QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.No)
+            if answer == QMessageBox.Cancel:
+                return
+            is_replacing = answer == QMessageBox.Yes
+        self._view_model.import_annotations(path, is_replacing)
+
+    def _toggle_recording(self):
+        self._btn_record.setChecked(self._view_model.toggle_recording())
+
+    def _replay_session(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Replay Session", ConstStrings.SESSION_DIRECTORY,
+                                              ConstStrings.SESSION_FILE_FILTER)
+        if path:
+            self._btn_record.setChecked(False)
+            self._view_model.start_replay(path)
+
+    def closeEvent(self, event):
+        self._timer.stop()
+        self._view_model.stop_replay()
+        self._view_model.stop_recording()
+        self._view_model.release()
+        super().closeEvent(event)
\ No newline at end of file
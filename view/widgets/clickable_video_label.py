@@ -1,17 +1,75 @@
+from time import perf_counter_ns
+from typing import Optional
+
+import numpy as np
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter
+
+from globals.enums.enums import PipelineStage
+from infrastructure.factories.metrics_factory import MetricsFactory
 
 class ClickableVideoLabel(QLabel):
     clicked = pyqtSignal(int, int)
+    right_clicked = pyqtSignal(int, int)
+    resized = pyqtSignal(int, int)
+    first_frame_painted = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
-        self.setScaledContents(True)
+        # ? QImage only wraps this buffer, keeping it here is what keeps the pixels alive
+        self._frame_rgb: Optional[np.ndarray] = None
+        self._frame_image: Optional[QImage] = None
+        self._is_placeholder_shown = False
+        self._is_frame_painted = False
+        self._metrics = MetricsFactory.get_metrics_manager()
+
+    def set_placeholder(self, text: str) -> None:
+        # ? Shown instead of a frame until the next one arrives
+        self._frame_rgb = None
+        self._frame_image = None
+        self._is_placeholder_shown = True
+        self.setText(text)
+
+    def set_frame(self, frame_rgb: np.ndarray) -> None:
+        if self._is_placeholder_shown:
+            self._is_placeholder_shown = False
+            self.clear()
+        start_ns = perf_counter_ns()
+        h, w, ch = frame_rgb.shape
+        self._frame_rgb = frame_rgb
+        self._frame_image = QImage(frame_rgb.data, w, h, ch * w, QImage.Format_RGB888)
+        self._metrics.record(PipelineStage.QIMAGE, perf_counter_ns() - start_ns)
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._frame_image is None:
+            return
+        # ? Painting the wrapped image directly skips the QPixmap.fromImage copy, and
+        # ? frames already come at contents size so this is a plain blit
+        start_ns = perf_counter_ns()
+        painter = QPainter(self)
+        painter.drawImage(self.contentsRect(), self._frame_image)
+        painter.end()
+        self._metrics.record(PipelineStage.PAINT, perf_counter_ns() - start_ns)
+        if not self._is_frame_painted:
+            self._is_frame_painted = True
+            self.first_frame_painted.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        contents = self.contentsRect()
+        self.resized.emit(contents.width(), contents.height())
     
     def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            x = event.pos().x()
-            y = event.pos().y()
-            self.clicked.emit(x, y)
-        super().mousePressEvent(event)
\ No newline at end of file
+        contents = self.contentsRect()
+        if contents.contains(event.pos()):
+            x = event.pos().x() - contents.left()
+            y = event.pos().y() - contents.top()
+            if event.button() == Qt.LeftButton:
+                self.clicked.emit(x, y)
+            elif event.button() == Qt.RightButton:
+                self.right_clicked.emit(x, y)
+        super().mousePressEvent(event)
@@ -0,0 +1,86 @@
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+from globals.consts.consts import Consts
+from model.data_classes.thumbnails import Thumbnails
+
+
+class ThumbnailStrip(QWidget):
+    # ? The video's thumbnails side by side across the full width, with a marker at the frame on
+    # ? screen. Clicking or dragging asks for a seek to the frame under the mouse.
+    seek_requested = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(Consts.THUMBNAIL_HEIGHT)
+        self.setCursor(Qt.PointingHandCursor)
+        self._thumbnails: Optional[Thumbnails] = None
+        self._frame_count = 0
+        self._frame_position = 0
+        # ? Every thumbnail in one row, QImage only wraps it
+        self._strip_rgb: Optional[np.ndarray] = None
+        self._strip_image: Optional[QImage] = None
+
+    def set_thumbnails(self, thumbnails: Optional[Thumbnails], frame_count: int) -> None:
+        self._thumbnails = thumbnails
+        self._frame_count = frame_count
+        self._strip_rgb = None
+        self._strip_image = None
+        if thumbnails is not None and len(thumbnails):
+            count, height, width, channels = thumbnails.images.shape
+            # ? One copy out of the cache file, empty slots in it are black
+            self._strip_rgb = np.ascontiguousarray(
+                thumbnails.images.transpose(1, 0, 2, 3).reshape(height, count * width, channels))
+            self._strip_image = QImage(self._strip_rgb.data, count * width, height, count * width * channels,
+                                       QImage.Format_RGB888)
+        self.update()
+
+    def update_thumbnail(self, slot: int) -> None:
+        if self._thumbnails is None or self._strip_rgb is None or slot >= len(self._thumbnails):
+            return
+        width = self._thumbnails.images.shape[2]
+        self._strip_rgb[:, slot * width:(slot + 1) * width] = self._thumbnails.images[slot]
+        self.update()
+
+    def set_frame_position(self, frame_position: int) -> None:
+        previous_x = self._get_marker_x()
+        self._frame_position = frame_position
+        # ? Repainted only when the marker moves a pixel, not on every frame
+        if self._get_marker_x() != previous_x:
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self._strip_image is not None:
+            painter.drawImage(self.rect(), self._strip_image)
+        if self._frame_count > 0:
+            painter.fillRect(self._get_marker_x(), 0, Consts.THUMBNAIL_MARKER_WIDTH, self.height(),
+                             QColor(*Consts.TRACK_COLOR_RGB))
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._request_seek(event.pos().x())
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton:
+            self._request_seek(event.pos().x())
+        super().mouseMoveEvent(event)
+
+    def _request_seek(self, x: int) -> None:
+        if self._frame_count <= 0 or self.width() <= 0:
+            return
+        fraction = min(max(x / self.width(), 0.0), 1.0)
+        self.seek_requested.emit(min(int(fraction * self._frame_count), self._frame_count - 1))
+
+    def _get_marker_x(self) -> int:
+        if self._frame_count <= 0:
+            return 0
+        track_width = self.width() - Consts.THUMBNAIL_MARKER_WIDTH
+        return int(self._frame_position * track_width / max(self._frame_count - 1, 1))
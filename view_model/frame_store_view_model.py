@@ -0,0 +1,46 @@
+from functools import partial
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from globals.consts.const_strings import ConstStrings
+from infrastructure.factories.manager_factory import ManagerFactory
+
+
+class FrameStoreViewModel(QObject):
+    # Signals to view
+    status_message_signal = pyqtSignal(str)
+    # ? Bridges the frame store's completion onto the GUI thread, with the generation it belongs to
+    _completed_signal = pyqtSignal(int)
+
+    def __init__(self):
+        super().__init__()
+        self._frame_store_manager = None
+        # ? Bumped for every video, a completion reported for an earlier one is ignored
+        self._generation = 0
+        self._completed_signal.connect(self._on_completed)
+
+    def start(self, video_path: str, is_playing: bool) -> None:
+        # ? Built while the video plays, it is read from the next time the video is opened
+        self.stop()
+        self._frame_store_manager = ManagerFactory.create_frame_store_manager(video_path)
+        if self._frame_store_manager is None:
+            return
+        self._frame_store_manager.set_complete_callback(partial(self._completed_signal.emit, self._generation))
+        self._frame_store_manager.set_playing(is_playing)
+        self._frame_store_manager.start()
+
+    def stop(self) -> None:
+        self._generation += 1
+        if self._frame_store_manager is None:
+            return
+        self._frame_store_manager.cancel()
+        self._frame_store_manager = None
+
+    def set_playing(self, is_playing: bool) -> None:
+        if self._frame_store_manager is not None:
+            self._frame_store_manager.set_playing(is_playing)
+
+    def _on_completed(self, generation: int) -> None:
+        if generation != self._generation or self._frame_store_manager is None:
+            return
+        self.status_message_signal.emit(ConstStrings.FRAME_STORE_COMPLETE_TEXT)
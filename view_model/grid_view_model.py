@@ -0,0 +1,78 @@
+import logging
+from typing import List
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DecodePriority
+from globals.utils.utils import Utils
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.factories.manager_factory import ManagerFactory
+from view_model.video_tile_view_model import VideoTileViewModel
+
+
+class GridViewModel(QObject):
+    # Signals to view
+    focused_tile_changed_signal = pyqtSignal(int)
+
+    def __init__(self, rows: int, columns: int):
+        super().__init__()
+        self._logger = LoggerFactory.get_logger_manager()
+        self._rows = rows
+        self._columns = columns
+        # ? Every tile decodes on the same bounded worker pool instead of a thread each
+        self._decode_scheduler = ManagerFactory.create_decode_scheduler()
+        self._tiles = [VideoTileViewModel(index, self._decode_scheduler)
+                       for index in range(rows * columns)]
+        self._focused_tile = -1
+        self._is_visible = True
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> int:
+        return self._columns
+
+    def get_tiles(self) -> List[VideoTileViewModel]:
+        return list(self._tiles)
+
+    def load_videos(self, video_paths: List[str]) -> int:
+        video_paths = video_paths or [Utils.get_default_video_path()]
+        loaded = sum(1 for tile in self._tiles
+                     if tile.load_video(video_paths[tile.tile_index % len(video_paths)]))
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.GRID_VIDEOS_LOADED, logging.DEBUG,
+                         self._rows, self._columns, loaded, self._decode_scheduler.worker_count)
+        self._apply_priorities()
+        return loaded
+
+    def update_frames(self) -> None:
+        for tile in self._tiles:
+            tile.update_frame()
+
+    def focus_tile(self, tile_index: int) -> None:
+        if tile_index == self._focused_tile:
+            return
+        self._focused_tile = tile_index
+        self._apply_priorities()
+        self.focused_tile_changed_signal.emit(tile_index)
+
+    def set_visible(self, is_visible: bool) -> None:
+        if is_visible != self._is_visible:
+            self._is_visible = is_visible
+            self._apply_priorities()
+
+    def release(self) -> None:
+        for tile in self._tiles:
+            tile.release()
+        self._decode_scheduler.shutdown()
+
+    def _apply_priorities(self) -> None:
+        for tile in self._tiles:
+            if not self._is_visible:
+                tile.set_priority(DecodePriority.HIDDEN)
+            elif tile.tile_index == self._focused_tile:
+                tile.set_priority(DecodePriority.FOCUSED)
+            else:
+                tile.set_priority(DecodePriority.VISIBLE)
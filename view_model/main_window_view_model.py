@@ -1,11 +1,34 @@
+import logging
 import os
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from concurrent.futures import Future
+from dataclasses import replace
+from functools import partial
+from typing import List, Optional
+
+import numpy as np
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
 
 from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DeliveryMode, MetricGauge, RenderReason, SessionEventType, TaskPriority, Topic
+from globals.utils.utils import Utils
 from infrastructure.factories.infrastructure_factory import InfrastructureFactory
 from infrastructure.factories.logger_factory import LoggerFactory
-from model.managers.video_manager import VideoManager
+from infrastructure.factories.manager_factory import ManagerFactory
+from infrastructure.factories.metrics_factory import MetricsFactory
+from model.annotations.annotation_store import AnnotationStore
+from model.data_classes.frame_cache_stats import FrameCacheStats
+from model.data_classes.playback_stats import PlaybackStats
 from model.data_classes.point import Point
+from model.data_classes.render_stats import RenderStats
+from model.data_classes.replay_stats import ReplayStats
+from model.data_classes.session_event import SessionEvent
+from model.data_classes.track_snapshot import TrackSnapshot
+from view_model.frame_store_view_model import FrameStoreViewModel
+from view_model.metrics_text_formatter import MetricsTextFormatter
+from view_model.session_replayer import SessionReplayer
+from view_model.thumbnail_strip_view_model import ThumbnailStripViewModel
 
 
 class MainWindowViewModel(QObject):
@@ -13,82 +36,705 @@ class MainWindowViewModel(QObject):
     coordinates_changed_signal = pyqtSignal(int, int)
     frame_ready_signal = pyqtSignal(object)
     status_message_signal = pyqtSignal(str)
+    playback_state_changed_signal = pyqtSignal(bool)
+    video_length_changed_signal = pyqtSignal(int)
+    frame_position_changed_signal = pyqtSignal(int)
+    # ? Empty text hides the metrics overlay
+    metrics_text_signal = pyqtSignal(str)
+    replay_finished_signal = pyqtSignal(object)
+    # ? Text shown in place of the video until its first frame arrives
+    video_placeholder_signal = pyqtSignal(str)
+    # ? Thumbnails of the video and its frame count, None clears the strip
+    thumbnails_changed_signal = pyqtSignal(object, int)
+    # ? Slot of the thumbnails just filled
+    thumbnail_ready_signal = pyqtSignal(int)
+    reverse_playback_changed_signal = pyqtSignal(bool)
+    # ? Bridges the decode thread's callback onto the GUI thread
+    _frame_decoded_signal = pyqtSignal()
+    # ? Bridges the tracking thread's callback onto the GUI thread
+    _tracks_updated_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
         self._logger = LoggerFactory.get_logger_manager()
         self._event_bus = InfrastructureFactory.create_event_bus()
+        self._task_executor = ManagerFactory.create_task_executor()
         self._current_x = 0
         self._current_y = 0
         self._current_click_point = None
         self._video_manager = None
         self._is_playing = False
+        self._display_size = None
+        self._is_overlay_visible = True
+        self._dirty = RenderReason.NONE
+        self._is_render_scheduled = False
+        self._render_stats = RenderStats()
+        self._frame_position = -1
+        self._annotation_store = AnnotationStore()
+        self._tracking_manager = None
+        self._is_tracking = False
+        self._tracked_point = None
+        self._video_path = None
+        self._open_request = 0
+        self._thumbnail_strip = ThumbnailStripViewModel()
+        self._frame_store = FrameStoreViewModel()
+        self._is_reversing = False
+        # ? A step that missed the frame cache, its frame arrives from the decoder
+        self._is_step_pending = False
+        self._speed = 1.0
+        self._session_manager = ManagerFactory.create_session_manager()
+        self._replayer: Optional[SessionReplayer] = None
+        self._session_manager.set_handlers({
+            SessionEventType.FRAME: self._step_to_frame,
+            SessionEventType.LOAD_VIDEO: self.load_video,
+            SessionEventType.CLICK: self._add_point,
+            SessionEventType.REMOVE: self._remove_point,
+            SessionEventType.PLAYBACK: self._set_replay_playing,
+            SessionEventType.SEEK: self._step_to_frame,
+            SessionEventType.SPEED: self.set_playback_speed,
+            SessionEventType.CLEAR: self.clear_point,
+            SessionEventType.UNDO: self.undo_annotation,
+            SessionEventType.OVERLAY: self._set_overlay_visible,
+            SessionEventType.TRACKING: self._set_tracking,
+            SessionEventType.RESIZE: self.set_display_size,
+            SessionEventType.ANNOTATIONS: self._restore_annotations,
+            SessionEventType.IMPORT: self._import_replayed_annotations})
+        self._metrics = MetricsFactory.get_metrics_manager()
+        self._config_manager = InfrastructureFactory.create_config_manager(ConstStrings.GLOBAL_CONFIG_PATH)
+        self._is_metrics_visible = self._metrics.is_enabled and self._config_manager.get_bool(
+            ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_HUD)
+        self._event_bus.subscribe(Topic.CONFIG_CHANGED, self._on_config_changed, DeliveryMode.GUI)
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.setInterval(Consts.METRICS_HUD_INTERVAL_MS)
+        self._metrics_timer.timeout.connect(self._on_metrics_tick)
+        self._reverse_timer = QTimer(self)
+        self._reverse_timer.setTimerType(Qt.PreciseTimer)
+        self._reverse_timer.timeout.connect(self._on_reverse_tick)
+        self._frame_decoded_signal.connect(self._on_frame_decoded)
+        self._tracks_updated_signal.connect(self._on_tracks_updated)
+        self._thumbnail_strip.thumbnails_changed_signal.connect(self.thumbnails_changed_signal)
+        self._thumbnail_strip.thumbnail_ready_signal.connect(self.thumbnail_ready_signal)
+        self._frame_store.status_message_signal.connect(self.status_message_signal)
+        self.playback_state_changed_signal.connect(self._on_playback_state_changed)
+        if self._metrics.is_enabled:
+            self._metrics_timer.start()
 
-    def load_default_video(self) -> bool:
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        video_path = os.path.join(base_path, "videos", "video1.mp4")
-        return self.load_video(video_path)
+    def load_default_video(self, is_async: bool = False) -> bool:
+        if is_async:
+            return self.load_video_async(Utils.get_default_video_path())
+        return self.load_video(Utils.get_default_video_path())
 
     def load_video(self, video_path: str) -> bool:
-        self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Loading video from: {video_path}")
-        self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Video exists: {os.path.exists(video_path)}")
-        
-        if os.path.exists(video_path):
-            self._video_manager = VideoManager(video_path)
-            if self._video_manager.load_video():
-                self._is_playing = True
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Video loaded successfully! FPS: {self._video_manager.get_fps()}")
-                return True
-            else:
-                self._logger.log(ConstStrings.LOG_NAME_DEBUG, "Failed to open video file")
-                return False
-        else:
-            self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Video file not found at: {video_path}")
+        if not self._check_video_path(video_path):
             return False
+        self.release()
+        self._video_manager = (ManagerFactory.create_replay_video_manager(video_path)
+                               if self._session_manager.is_replaying()
+                               else ManagerFactory.create_video_manager(video_path))
+        if not self._video_manager.load_video():
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_OPEN_FAILED)
+            self.video_placeholder_signal.emit(ConstStrings.VIDEO_OPEN_FAILED_TEXT)
+            return False
+        self._attach_video(video_path)
+        return True
+
+    def load_video_async(self, video_path: str) -> bool:
+        # ? Opens the video on a worker thread: OpenCV is imported there on first use, and the file and
+        # ? its keyframe index are read while the window already shows. Returns False when there is no file.
+        if not self._check_video_path(video_path):
+            return False
+        self._open_request += 1
+        self.video_placeholder_signal.emit(ConstStrings.VIDEO_LOADING_TEXT)
+        self._task_executor.submit(self._open_video_task, video_path, priority=TaskPriority.HIGH,
+                                   on_done=partial(self._on_video_opened, video_path, self._open_request))
+        return True
 
     def get_video_fps(self) -> float:
         if self._video_manager:
             return self._video_manager.get_fps()
-        return 30.0
+        return Consts.DEFAULT_FPS
+
+    def release(self) -> None:
+        # ? A video still opening in the background is dropped when it arrives
+        self._open_request += 1
+        self._stop_reverse()
+        self._stop_tracking()
+        self._thumbnail_strip.stop()
+        self._frame_store.stop()
+        if self._video_manager:
+            self._video_manager.release()
+            self._video_manager = None
+
+    def set_display_size(self, width: int, height: int) -> None:
+        self._display_size = (width, height)
+        self._record(SessionEventType.RESIZE, width, height)
+        if self._video_manager:
+            self._video_manager.set_display_size(width, height)
+        self._invalidate(RenderReason.RESIZED)
+
+    def is_playing(self) -> bool:
+        return self._is_playing
+
+    def get_render_stats(self) -> RenderStats:
+        return replace(self._render_stats)
+
+    def get_playback_stats(self) -> PlaybackStats:
+        if self._video_manager:
+            return self._video_manager.get_playback_stats()
+        return PlaybackStats()
 
-    def update_frame(self, label_width: int, label_height: int):
+    def set_playback_speed(self, speed: float) -> None:
+        self._speed = speed
+        self._record(SessionEventType.SPEED, speed)
+        if self._video_manager:
+            self._video_manager.set_speed(speed)
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.PLAYBACK_SPEED_SET, logging.DEBUG, speed)
+        if self._is_reversing:
+            self._reverse_timer.setInterval(self._get_reverse_interval_ms())
+
+    def update_frame(self) -> int:
         if not self._video_manager:
-            return
+            return int(1000 / Consts.DEFAULT_FPS)
+        if self._session_manager.is_replaying():
+            # ? Frames come from the replayed log, the playback timer only keeps the view fresh
+            self._render_if_dirty()
+            return int(1000 / self._video_manager.get_fps())
         
+        if self._is_playing and self._video_manager.read_frame():
+            self._dirty |= RenderReason.NEW_FRAME
+        self._render_if_dirty()
+        # ? Milliseconds until the next decoded frame is due on the presentation clock
+        return self._video_manager.get_next_frame_delay_ms()
+
+    def seek(self, frame_index: int) -> None:
+        self._record(SessionEventType.SEEK, frame_index)
+        if self._video_manager:
+            self._video_manager.seek(frame_index)
+
+    def step_frame(self, delta: int) -> None:
+        self._stop_reverse()
+        self._step(delta)
+
+    def toggle_reverse(self) -> bool:
+        # ? Plays backward by stepping one frame back per tick, through the frame cache
+        if self._is_reversing:
+            self._stop_reverse()
+            return False
+        if not self._video_manager or self._session_manager.is_replaying():
+            return False
         if self._is_playing:
-            self._video_manager.read_frame()
-        
-        frame_rgb = self._video_manager.get_display_frame(
-            self._current_click_point, label_width, label_height
-        )
+            self.toggle_playback()
+        self._is_reversing = True
+        self._is_step_pending = False
+        self._reverse_timer.start(self._get_reverse_interval_ms())
+        self.reverse_playback_changed_signal.emit(True)
+        return True
+
+    def get_frame_cache_stats(self) -> FrameCacheStats:
+        if self._video_manager:
+            return self._video_manager.get_frame_cache_stats()
+        return FrameCacheStats()
+
+    def toggle_overlay(self) -> bool:
+        self._is_overlay_visible = not self._is_overlay_visible
+        self._record(SessionEventType.OVERLAY, self._is_overlay_visible)
+        self._invalidate(RenderReason.OVERLAY_TOGGLED)
+        return self._is_overlay_visible
+
+    def toggle_metrics(self) -> bool:
+        self._is_metrics_visible = not self._is_metrics_visible
+        if self._is_metrics_visible and not self._metrics.is_enabled:
+            self.status_message_signal.emit(ConstStrings.METRICS_DISABLED_TEXT)
+            self._is_metrics_visible = False
+        self._on_metrics_tick()
+        return self._is_metrics_visible
+
+    def toggle_tracking(self) -> bool:
+        self._is_tracking = not self._is_tracking
+        self._record(SessionEventType.TRACKING, self._is_tracking)
+        if self._is_tracking:
+            self._start_tracking()
+            self.status_message_signal.emit(ConstStrings.TRACKING_ON_TEXT)
+        else:
+            self._stop_tracking()
+            self.status_message_signal.emit(ConstStrings.TRACKING_OFF_TEXT)
+        self._invalidate(RenderReason.POINT_CHANGED)
+        return self._is_tracking
+
+    def is_recording(self) -> bool:
+        return self._session_manager.is_recording()
+
+    def toggle_recording(self) -> bool:
+        if self._session_manager.is_recording():
+            self.stop_recording()
+            return False
+        return self.start_recording() is not None
+
+    def start_recording(self, path: Optional[str] = None) -> Optional[str]:
+        if self._session_manager.is_recording() or self._session_manager.is_replaying():
+            return None
+        path = self._session_manager.start_recording(path)
+        # ? The log starts with the current state, so a replay does not depend on what came before it
+        if self._video_path:
+            self._record(SessionEventType.LOAD_VIDEO, self._video_path)
+        if self._display_size:
+            self._record(SessionEventType.RESIZE, *self._display_size)
+        self._record(SessionEventType.SPEED, self._speed)
+        self._record(SessionEventType.OVERLAY, self._is_overlay_visible)
+        self._record(SessionEventType.TRACKING, self._is_tracking)
+        if self._frame_position >= 0:
+            self._record(SessionEventType.SEEK, self._frame_position)
+        self._record(SessionEventType.PLAYBACK, self._is_playing)
+        self._record(SessionEventType.ANNOTATIONS, self._annotation_store.save_snapshot())
+        self.status_message_signal.emit(ConstStrings.RECORDING_STARTED_TEXT.format(path))
+        return path
+
+    def stop_recording(self) -> None:
+        path = self._session_manager.stop_recording()
+        if path is not None:
+            self.status_message_signal.emit(ConstStrings.RECORDING_SAVED_TEXT.format(path))
+
+    def start_replay(self, path: str) -> bool:
+        # ? Paced like the recording and rendered, the result arrives through replay_finished_signal
+        events = self._read_session(path)
+        if events is None:
+            return False
+        self._begin_replay(is_rendering=True)
+        self._replayer = SessionReplayer(events, self._session_manager.apply_event)
+        self._replayer.finished_signal.connect(self._on_replay_finished)
+        self._replayer.start()
+        self.status_message_signal.emit(ConstStrings.REPLAY_STARTED_TEXT.format(len(events)))
+        return True
+
+    def replay_session_fast(self, path: str) -> Optional[ReplayStats]:
+        # ? Back to back without rendering, the time it takes is the view model's own throughput
+        events = self._read_session(path)
+        if events is None:
+            return None
+        self._begin_replay(is_rendering=False)
+        replay_stats = SessionReplayer(events, self._session_manager.apply_event).run()
+        self._on_replay_finished(replay_stats)
+        return replay_stats
+
+    def stop_replay(self) -> None:
+        if self._replayer is not None:
+            self._replayer.stop()
+
+    def apply_session_event(self, event: SessionEvent) -> None:
+        self._session_manager.apply_event(event)
+
+    def _start_tracking(self) -> None:
+        source_size = self._video_manager.get_source_size() if self._video_manager else None
+        if source_size is None:
+            return
+        if self._tracking_manager is None:
+            self._tracking_manager = ManagerFactory.create_tracking_manager(*source_size)
+            self._tracking_manager.set_tracks_callback(self._tracks_updated_signal.emit)
+        if self._session_manager.is_replaying():
+            # ? Replays track every frame on the calling thread, so each run gives the same positions
+            self._video_manager.set_frame_listener(self._tracking_manager.track_frame)
+            return
+        self._tracking_manager.start()
+        self._video_manager.set_frame_listener(self._tracking_manager.submit_frame)
+
+    def _stop_tracking(self) -> None:
+        if self._tracking_manager is None:
+            return
+        if self._video_manager:
+            self._video_manager.set_frame_listener(None)
+        self._tracking_manager.stop()
+        self._tracking_manager = None
+        self._tracked_point = None
+
+    def _step(self, delta: int) -> None:
+        if (not self._video_manager or self._session_manager.is_replaying() or
+                self._video_manager.get_frame_position() < 0):
+            return
+        if self._is_playing:
+            # ? Stepping pauses, like in any player
+            self.toggle_playback()
+        frame_count = self._video_manager.get_frame_count()
+        target = max(self._video_manager.get_frame_position() + delta, 0)
+        self._record(SessionEventType.SEEK, min(target, frame_count - 1) if frame_count > 0 else target)
+        self._is_step_pending = not self._video_manager.step_frame(delta)
+        if not self._is_step_pending:
+            self._invalidate(RenderReason.NEW_FRAME)
+
+    def _on_reverse_tick(self) -> None:
+        if self._is_step_pending:
+            # ? The last step is still decoding, steps are not queued up behind it
+            return
+        if not self._video_manager or self._video_manager.get_frame_position() <= 0:
+            self._stop_reverse()
+            return
+        self._step(-1)
+
+    def _stop_reverse(self) -> None:
+        self._is_step_pending = False
+        if not self._is_reversing:
+            return
+        self._is_reversing = False
+        self._reverse_timer.stop()
+        self.reverse_playback_changed_signal.emit(False)
+
+    def _get_reverse_interval_ms(self) -> int:
+        fps = self._video_manager.get_fps() if self._video_manager else Consts.DEFAULT_FPS
+        return max(int(1000 / (fps * self._speed)), Consts.MIN_TIMER_INTERVAL_MS)
+
+    def _on_playback_state_changed(self, is_playing: bool) -> None:
+        self._thumbnail_strip.set_playing(is_playing)
+        self._frame_store.set_playing(is_playing)
+
+    def _invalidate(self, reason: RenderReason) -> None:
+        self._dirty |= reason
+        if self._is_playing or self._is_render_scheduled:
+            # ? The playback timer picks it up on its next tick
+            return
+        # ? The timer is stopped while paused, so coalesce everything into one deferred render
+        self._is_render_scheduled = True
+        QTimer.singleShot(0, self._render_if_dirty)
+
+    def _render_if_dirty(self) -> None:
+        self._is_render_scheduled = False
+        if not self._dirty or not self._video_manager:
+            self._render_stats.skipped += 1
+            return
+        if self._session_manager.is_replaying() and not self._session_manager.is_replay_rendering():
+            self._dirty = RenderReason.NONE
+            self._render_stats.skipped += 1
+            return
+        self._dirty = RenderReason.NONE
+        click_point = self._current_click_point if self._is_overlay_visible else None
+        annotations = None
+        tracks = None
+        if self._is_overlay_visible:
+            annotations = self._annotation_store.get_frame(self._video_manager.get_frame_position())
+        if self._tracking_manager is not None:
+            tracks = self._tracking_manager.get_snapshot(self._video_manager.get_frame_position())
+        frame_rgb = self._video_manager.get_display_frame(click_point, annotations,
+                                                          tracks if self._is_overlay_visible else None)
         if frame_rgb is None:
             return
-        
+        if tracks is not None:
+            self._emit_tracks(tracks)
+        self._render_stats.performed += 1
         self.frame_ready_signal.emit(frame_rgb)
+        self._metrics.mark_frame()
+        frame_position = self._video_manager.get_frame_position()
+        if frame_position != self._frame_position:
+            self._frame_position = frame_position
+            self._record(SessionEventType.FRAME)
+            self.frame_position_changed_signal.emit(frame_position)
+
+    def _on_frame_decoded(self) -> None:
+        # ? While playing the timer consumes frames, paused frames only arrive from seeks
+        if self._is_playing or not self._video_manager:
+            return
+        if self._video_manager.read_frame():
+            self._is_step_pending = False
+            self._invalidate(RenderReason.NEW_FRAME)
+
+    def _on_metrics_tick(self) -> None:
+        frame_cache_stats = self.get_frame_cache_stats()
+        if self._video_manager:
+            self._metrics.set_gauge(MetricGauge.DROPPED_FRAMES, self._video_manager.get_playback_stats().dropped_frames)
+        if frame_cache_stats.budget_bytes:
+            self._metrics.set_gauge(MetricGauge.FRAME_CACHE_MB,
+                                    frame_cache_stats.used_bytes / Consts.BYTES_PER_MEGABYTE)
+            self._metrics.set_gauge(MetricGauge.FRAME_CACHE_HIT_RATE, frame_cache_stats.hit_rate)
+        self.metrics_text_signal.emit(MetricsTextFormatter.format(self._metrics.get_snapshot(),
+                                                                 self._event_bus.get_topic_stats(),
+                                                                 self._task_executor.get_stats(), frame_cache_stats)
+                                      if self._is_metrics_visible else "")
+
+    def _check_video_path(self, video_path: str) -> bool:
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_LOADING, logging.DEBUG, video_path)
+        is_existing = os.path.exists(video_path)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_EXISTS, logging.DEBUG, is_existing)
+        if not is_existing:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_NOT_FOUND, logging.DEBUG, video_path)
+            self.video_placeholder_signal.emit(ConstStrings.VIDEO_NOT_FOUND_TEXT)
+        return is_existing
+
+    @staticmethod
+    def _open_video_task(video_path: str) -> tuple:
+        video_manager = ManagerFactory.create_video_manager(video_path)
+        return video_manager, video_manager.load_video()
+
+    def _on_video_opened(self, video_path: str, open_request: int, future: Future) -> None:
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_OPEN_ERROR, logging.DEBUG, video_path,
+                             error)
+        video_manager, is_opened = (None, False) if future.cancelled() or error is not None else future.result()
+        if open_request != self._open_request:
+            if video_manager is not None:
+                video_manager.release()
+            return
+        self.release()
+        self._video_manager = video_manager
+        if not is_opened:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_OPEN_FAILED)
+            self.video_placeholder_signal.emit(ConstStrings.VIDEO_OPEN_FAILED_TEXT)
+            return
+        self._attach_video(video_path)
+
+    def _attach_video(self, video_path: str) -> None:
+        self._video_path = video_path
+        self._record(SessionEventType.LOAD_VIDEO, video_path)
+        if self._display_size:
+            self._video_manager.set_display_size(*self._display_size)
+        self._video_manager.set_frame_ready_callback(self._frame_decoded_signal.emit)
+        if self._is_tracking:
+            self._start_tracking()
+        if not self._session_manager.is_replaying():
+            self._video_manager.start_decoding()
+        self._is_playing = True
+        self.playback_state_changed_signal.emit(True)
+        self.video_length_changed_signal.emit(self._video_manager.get_frame_count())
+        if not self._session_manager.is_replaying():
+            self._thumbnail_strip.start(video_path, self._video_manager.get_frame_count(), self._is_playing)
+            self._frame_store.start(video_path, self._is_playing)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.VIDEO_LOADED, logging.DEBUG,
+                         self._video_manager.get_fps())
+
+    def _record(self, event_type: SessionEventType, *values) -> None:
+        self._session_manager.record(event_type, self._frame_position, *values)
+
+    def _read_session(self, path: str) -> Optional[List[SessionEvent]]:
+        events = self._session_manager.read_events(path)
+        if events is None:
+            self.status_message_signal.emit(ConstStrings.REPLAY_UNREADABLE_TEXT)
+        return events
+
+    def _begin_replay(self, is_rendering: bool) -> None:
+        self.stop_recording()
+        self.stop_replay()
+        self._session_manager.begin_replay(is_rendering)
+        # ? Points from before the replay are dropped, the session's own snapshot restores its points
+        self._current_click_point = None
+        self._annotation_store.reset()
+        self._invalidate(RenderReason.POINT_CHANGED)
+
+    def _on_replay_finished(self, replay_stats: ReplayStats) -> None:
+        self._replayer = None
+        self._session_manager.finish_replay(replay_stats)
+        if self._video_manager:
+            # ? Hands the replayed video back to normal playback, paused on the last replayed frame
+            self._is_playing = False
+            self._video_manager.set_paused(True)
+            self._video_manager.start_decoding()
+            if self._is_tracking:
+                self._start_tracking()
+            self.playback_state_changed_signal.emit(False)
+            self._invalidate(RenderReason.NEW_FRAME)
+        self.status_message_signal.emit(ConstStrings.REPLAY_FINISHED_TEXT.format(
+            replay_stats.frames, replay_stats.elapsed_seconds, replay_stats.fps))
+        self.replay_finished_signal.emit(replay_stats)
+
+    def _step_to_frame(self, frame_index: int) -> None:
+        if not self._video_manager:
+            return
+        frame_position = self._video_manager.get_frame_position()
+        if frame_index == frame_position:
+            return
+        if frame_index == frame_position + 1:
+            self._video_manager.read_frame()
+        else:
+            # ? Forward jumps inside a keyframe interval decode forward, others reposition first
+            self._video_manager.seek(frame_index)
+        self._dirty |= RenderReason.NEW_FRAME
+        self._render_if_dirty()
+
+    def _set_replay_playing(self, is_playing: bool) -> None:
+        if is_playing != self._is_playing:
+            self._is_playing = is_playing
+            self.playback_state_changed_signal.emit(is_playing)
+
+    def _set_overlay_visible(self, is_visible: bool) -> None:
+        if is_visible != self._is_overlay_visible:
+            self.toggle_overlay()
+
+    def _set_tracking(self, is_tracking: bool) -> None:
+        if is_tracking != self._is_tracking:
+            self.toggle_tracking()
+
+    def _on_config_changed(self, config_change: tuple) -> None:
+        config_path, changed_paths = config_change
+        if config_path != ConstStrings.GLOBAL_CONFIG_PATH:
+            return
+        if (ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_ENABLED) in changed_paths:
+            # ? The metrics factory has already applied it to the shared manager
+            if self._metrics.is_enabled:
+                self._metrics_timer.start()
+            else:
+                self._metrics_timer.stop()
+                if self._is_metrics_visible:
+                    self.toggle_metrics()
+        if (ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_HUD) in changed_paths:
+            is_hud = self._config_manager.get_bool(ConstStrings.CONFIG_METRICS, ConstStrings.CONFIG_METRICS_HUD)
+            if is_hud != self._is_metrics_visible:
+                self.toggle_metrics()
+        if any(path[0] == ConstStrings.CONFIG_VIDEO for path in changed_paths):
+            # ? Buffering, drop policy and backend are read when a video is opened
+            self.status_message_signal.emit(ConstStrings.VIDEO_SETTINGS_CHANGED_TEXT)
+
+    def _on_tracks_updated(self) -> None:
+        # ? While playing the next timer tick renders the new positions
+        if not self._is_playing:
+            self._invalidate(RenderReason.POINT_CHANGED)
+
+    def _emit_tracks(self, tracks: TrackSnapshot) -> None:
+        if not len(tracks):
+            return
+        # ? The latest clicked point still being tracked drives the coordinates display
+        index = int(np.argmax(tracks.ids))
+        tracked_point = (int(round(float(tracks.xs[index]))), int(round(float(tracks.ys[index]))))
+        if tracked_point != self._tracked_point:
+            self._tracked_point = tracked_point
+            self.coordinates_changed_signal.emit(*tracked_point)
+            self._event_bus.publish(Topic.COORDINATES, tracked_point)
+        self._event_bus.publish(Topic.TRACKS, tracks)
 
     @pyqtSlot(int, int)
     def update_coordinates_slot(self, x: int, y: int) -> None:
+        # ? The view reports label pixels, everything past here works in source video pixels
+        source_point = self._video_manager.map_to_source(x, y) if self._video_manager else None
+        if source_point:
+            x, y = source_point
+        self._add_point(x, y)
+
+    def _add_point(self, x: int, y: int) -> None:
+        self._record(SessionEventType.CLICK, x, y)
         self._current_x = x
         self._current_y = y
+        if self._tracking_manager is not None:
+            # ? In tracking mode a click starts a track instead of placing a fixed point
+            if self._tracking_manager.add_point(x, y) is None:
+                self.status_message_signal.emit(ConstStrings.TRACKING_LIMIT_TEXT.format(Consts.MAX_TRACKED_POINTS))
+                return
+            self._invalidate(RenderReason.POINT_CHANGED)
+            self.coordinates_changed_signal.emit(x, y)
+            self._event_bus.publish(Topic.COORDINATES, (x, y))
+            return
         self._current_click_point = Point(x, y)
+        if self._video_manager and self._video_manager.get_frame_position() >= 0:
+            frame_position = self._video_manager.get_frame_position()
+            self._annotation_store.add(frame_position, x, y,
+                                       timestamp_ms=frame_position * 1000.0 / self._video_manager.get_fps())
+        self._invalidate(RenderReason.POINT_CHANGED)
         self.coordinates_changed_signal.emit(x, y)
-        self._event_bus.send_coordinates_signal.emit(x, y)
+        self._event_bus.publish(Topic.COORDINATES, (x, y))
 
     def toggle_playback(self) -> bool:
         self._is_playing = not self._is_playing
-        state_text = "playing" if self._is_playing else "paused"
-        self._logger.log(ConstStrings.LOG_NAME_DEBUG, f"Video {state_text}")
+        if self._is_playing:
+            self._stop_reverse()
+        self._record(SessionEventType.PLAYBACK, self._is_playing)
+        if self._video_manager and not self._session_manager.is_replaying():
+            self._video_manager.set_paused(not self._is_playing)
+        self.playback_state_changed_signal.emit(self._is_playing)
+        state_text = LoggerMessages.PLAYBACK_PLAYING if self._is_playing else LoggerMessages.PLAYBACK_PAUSED
+        playback_stats = self.get_playback_stats()
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.PLAYBACK_STATE, logging.DEBUG, state_text,
+                         self._render_stats.performed, self._render_stats.skipped, playback_stats.dropped_frames,
+                         playback_stats.late_frames, playback_stats.drift_ms)
         return self._is_playing       
 
 
+    @pyqtSlot(int, int)
+    def remove_annotation_slot(self, x: int, y: int) -> None:
+        if not self._video_manager:
+            return
+        source_point = self._video_manager.map_to_source(x, y)
+        if source_point:
+            x, y = source_point
+        self._remove_point(x, y)
+
+    def _remove_point(self, x: int, y: int) -> None:
+        self._record(SessionEventType.REMOVE, x, y)
+        if self._tracking_manager is not None:
+            if self._tracking_manager.remove_nearest(x, y, self._video_manager.get_frame_position()) is None:
+                self.status_message_signal.emit(ConstStrings.TRACKED_POINT_NOT_FOUND_TEXT)
+                return
+            self._invalidate(RenderReason.POINT_CHANGED)
+            self.status_message_signal.emit(ConstStrings.TRACKED_POINT_REMOVED_TEXT)
+            return
+        removed_id = self._annotation_store.remove_nearest(self._video_manager.get_frame_position(), x, y)
+        if removed_id is None:
+            self.status_message_signal.emit(ConstStrings.POINT_NOT_FOUND_TEXT)
+            return
+        self._invalidate(RenderReason.POINT_CHANGED)
+        self.status_message_signal.emit(ConstStrings.POINT_REMOVED_TEXT.format(len(self._annotation_store)))
+
+    def undo_annotation(self) -> None:
+        self._record(SessionEventType.UNDO)
+        if not self._annotation_store.undo():
+            self.status_message_signal.emit(ConstStrings.UNDO_EMPTY_TEXT)
+            return
+        self._invalidate(RenderReason.POINT_CHANGED)
+        self.status_message_signal.emit(ConstStrings.UNDONE_TEXT.format(len(self._annotation_store)))
+
+    def export_annotations(self, path: str) -> None:
+        if not AnnotationStore.is_supported_file(path):
+            self.status_message_signal.emit(ConstStrings.EXPORT_UNSUPPORTED_TEXT)
+            return
+        try:
+            count = self._annotation_store.export_file(path)
+        except OSError as error:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANNOTATION_EXPORT_FAILED, logging.DEBUG, error)
+            self.status_message_signal.emit(ConstStrings.EXPORT_FAILED_TEXT)
+            return
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANNOTATIONS_EXPORTED, logging.DEBUG, count, path)
+        self.status_message_signal.emit(ConstStrings.EXPORTED_TEXT.format(count))
+
+    def has_annotations(self) -> bool:
+        return len(self._annotation_store) > 0
+
+    def import_annotations(self, path: str, is_replacing: bool = False) -> None:
+        self._record(SessionEventType.IMPORT, is_replacing, path)
+        if not AnnotationStore.is_supported_file(path):
+            self.status_message_signal.emit(ConstStrings.IMPORT_UNSUPPORTED_TEXT)
+            return
+        try:
+            count = self._annotation_store.import_file(path, is_replacing)
+        except (OSError, ValueError, KeyError) as error:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANNOTATION_IMPORT_FAILED, logging.DEBUG, error)
+            self.status_message_signal.emit(ConstStrings.IMPORT_FAILED_TEXT)
+            return
+        self._invalidate(RenderReason.POINT_CHANGED)
+        self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANNOTATIONS_IMPORTED, logging.DEBUG, count, path)
+        self.status_message_signal.emit(ConstStrings.IMPORTED_TEXT.format(count))
+
+    def _import_replayed_annotations(self, is_replacing: bool, path: str) -> None:
+        # ? The event keeps the flag first, its sized path last
+        self.import_annotations(path, is_replacing)
+
+    def _restore_annotations(self, snapshot: bytes) -> None:
+        try:
+            self._annotation_store.restore_snapshot(snapshot)
+        except (OSError, ValueError, KeyError) as error:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.ANNOTATION_RESTORE_FAILED, logging.DEBUG,
+                             error)
+            self._annotation_store.reset()
+        self._invalidate(RenderReason.POINT_CHANGED)
+
     def clear_point(self):
-        if self._current_click_point is None:
-            self._logger.log(ConstStrings.LOG_NAME_DEBUG, "No point to clear")
-            self.status_message_signal.emit("No point to clear")
+        self._record(SessionEventType.CLEAR)
+        has_tracks = self._tracking_manager is not None and self._tracked_point is not None
+        if self._tracking_manager is not None:
+            self._tracking_manager.clear()
+            self._tracked_point = None
+        if self._current_click_point is None and not len(self._annotation_store) and not has_tracks:
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.NO_POINT_TO_CLEAR)
+            self.status_message_signal.emit(ConstStrings.NO_POINT_TO_CLEAR_TEXT)
         else:
             self._current_click_point = None
-            self._logger.log(ConstStrings.LOG_NAME_DEBUG, "Point cleared")
-            self.status_message_signal.emit("Point cleared")
+            # ? Clearing the store is one undo step, so an accidental clear is recoverable
+            self._annotation_store.clear()
+            self._invalidate(RenderReason.POINT_CHANGED)
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.POINT_CLEARED)
+            self.status_message_signal.emit(ConstStrings.POINT_CLEARED_TEXT)
 
     
  
\ No newline at end of file
@@ -0,0 +1,38 @@
+from typing import Dict
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.consts import Consts
+from globals.enums.enums import MetricGauge, PipelineStage
+from model.data_classes.frame_cache_stats import FrameCacheStats
+from model.data_classes.metrics_snapshot import MetricsSnapshot
+from model.data_classes.task_stats import TaskStats
+from model.data_classes.topic_stats import TopicStats
+
+
+class MetricsTextFormatter:
+    @staticmethod
+    def format(snapshot: MetricsSnapshot, topic_stats: Dict[str, TopicStats], task_stats: TaskStats,
+               frame_cache_stats: FrameCacheStats) -> str:
+        queue_depth = snapshot.gauges.get(MetricGauge.QUEUE_DEPTH.value)
+        lines = [ConstStrings.METRICS_PLAYBACK_LINE.format(
+                     snapshot.fps, int(snapshot.gauges.get(MetricGauge.DROPPED_FRAMES.value, 0)),
+                     ConstStrings.METRICS_MISSING_VALUE if queue_depth is None else int(queue_depth)),
+                 ConstStrings.METRICS_STAGE_HEADER]
+        for stage in PipelineStage:
+            stats = snapshot.stages.get(stage.value)
+            if stats is not None:
+                lines.append(ConstStrings.METRICS_STAGE_LINE.format(stage.value, stats.p50_ms, stats.p99_ms))
+        active_topics = [(topic, stats) for topic, stats in topic_stats.items() if stats.published]
+        if active_topics:
+            lines.append(ConstStrings.METRICS_TOPIC_HEADER)
+            for topic, stats in active_topics:
+                lines.append(ConstStrings.METRICS_TOPIC_LINE.format(topic, stats.publish_rate, stats.deliver_rate,
+                                                                    stats.dropped))
+        if task_stats.run.count:
+            lines.append(ConstStrings.METRICS_TASK_LINE.format(task_stats.queued, task_stats.wait.p99_ms,
+                                                               task_stats.run.p99_ms))
+        if frame_cache_stats.budget_bytes:
+            lines.append(ConstStrings.METRICS_CACHE_LINE.format(
+                frame_cache_stats.entries, frame_cache_stats.used_bytes / Consts.BYTES_PER_MEGABYTE,
+                frame_cache_stats.budget_bytes / Consts.BYTES_PER_MEGABYTE, frame_cache_stats.hit_rate))
+        return "\n".join(lines)
@@ -0,0 +1,64 @@
+import time
+from typing import Callable, List
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from globals.enums.enums import SessionEventType
+from model.data_classes.replay_stats import ReplayStats
+from model.data_classes.session_event import SessionEvent
+
+
+class SessionReplayer(QObject):
+    # ? Hands recorded events back to the view model, either paced like the recording on the GUI
+    # ? thread's timer or back to back, where the run time measures the view model path itself
+    finished_signal = pyqtSignal(object)
+
+    def __init__(self, events: List[SessionEvent], apply_event: Callable[[SessionEvent], None]) -> None:
+        super().__init__()
+        self._events = events
+        self._apply_event = apply_event
+        self._next_event = 0
+        self._stats = ReplayStats()
+        self._start = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+
+    def run(self) -> ReplayStats:
+        start = time.perf_counter()
+        for event in self._events:
+            self._apply(event)
+        self._stats.elapsed_seconds = time.perf_counter() - start
+        return self._stats
+
+    def start(self) -> None:
+        self._next_event = 0
+        self._start = time.perf_counter()
+        self._timer.start(0)
+
+    def stop(self) -> None:
+        if self._timer.isActive():
+            self._timer.stop()
+            self._finish()
+
+    def _on_timer(self) -> None:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000.0
+        # ? Everything due is applied at once, a slow step delays the events behind it instead of dropping them
+        while self._next_event < len(self._events) and self._events[self._next_event].elapsed_ms <= elapsed_ms:
+            self._apply(self._events[self._next_event])
+            self._next_event += 1
+        if self._next_event >= len(self._events):
+            self._finish()
+            return
+        delay_ms = self._events[self._next_event].elapsed_ms - (time.perf_counter() - self._start) * 1000.0
+        self._timer.start(max(int(delay_ms), 0))
+
+    def _apply(self, event: SessionEvent) -> None:
+        self._apply_event(event)
+        self._stats.events += 1
+        if event.event_type is SessionEventType.FRAME:
+            self._stats.frames += 1
+
+    def _finish(self) -> None:
+        self._stats.elapsed_seconds = time.perf_counter() - self._start
+        self.finished_signal.emit(self._stats)
@@ -0,0 +1,58 @@
+from functools import partial
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from infrastructure.factories.manager_factory import ManagerFactory
+
+
+class ThumbnailStripViewModel(QObject):
+    # Signals to view
+    # ? Thumbnails of the video and its frame count, None clears the strip
+    thumbnails_changed_signal = pyqtSignal(object, int)
+    # ? Slot of the thumbnails just filled
+    thumbnail_ready_signal = pyqtSignal(int)
+    # ? Bridges the thumbnail task's callback onto the GUI thread, with the generation it belongs to
+    _thumbnail_filled_signal = pyqtSignal(int, int)
+
+    def __init__(self):
+        super().__init__()
+        self._thumbnail_manager = None
+        # ? Bumped for every video, slots filled for an earlier one are ignored
+        self._generation = 0
+        self._frame_count = 0
+        self._is_strip_set = False
+        self._thumbnail_filled_signal.connect(self._on_thumbnail_filled)
+
+    def start(self, video_path: str, frame_count: int, is_playing: bool) -> None:
+        self.stop()
+        self._frame_count = frame_count
+        self._thumbnail_manager = ManagerFactory.create_thumbnail_manager(video_path)
+        self._thumbnail_manager.set_thumbnail_callback(partial(self._thumbnail_filled_signal.emit, self._generation))
+        self._thumbnail_manager.set_playing(is_playing)
+        thumbnails = self._thumbnail_manager.get_thumbnails()
+        # ? A cached strip is shown at once, a new one when its first thumbnail is filled
+        self._is_strip_set = thumbnails is not None
+        if self._is_strip_set:
+            self.thumbnails_changed_signal.emit(thumbnails, frame_count)
+        self._thumbnail_manager.start()
+
+    def stop(self) -> None:
+        self._generation += 1
+        if self._thumbnail_manager is None:
+            return
+        self._thumbnail_manager.cancel()
+        self._thumbnail_manager = None
+        self.thumbnails_changed_signal.emit(None, 0)
+
+    def set_playing(self, is_playing: bool) -> None:
+        if self._thumbnail_manager is not None:
+            self._thumbnail_manager.set_playing(is_playing)
+
+    def _on_thumbnail_filled(self, generation: int, slot: int) -> None:
+        if generation != self._generation or self._thumbnail_manager is None:
+            return
+        if not self._is_strip_set:
+            self._is_strip_set = True
+            self.thumbnails_changed_signal.emit(self._thumbnail_manager.get_thumbnails(), self._frame_count)
+            return
+        self.thumbnail_ready_signal.emit(slot)
@@ -0,0 +1,88 @@
+import logging
+import os
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from globals.consts.const_strings import ConstStrings
+from globals.consts.logger_messages import LoggerMessages
+from globals.enums.enums import DecodePriority, RenderReason, Topic
+from infrastructure.factories.infrastructure_factory import InfrastructureFactory
+from infrastructure.factories.logger_factory import LoggerFactory
+from infrastructure.factories.manager_factory import ManagerFactory
+from model.data_classes.point import Point
+from model.pipeline.decode_scheduler import DecodeScheduler
+
+
+class VideoTileViewModel(QObject):
+    # Signals to view
+    coordinates_changed_signal = pyqtSignal(int, int)
+    frame_ready_signal = pyqtSignal(object)
+
+    def __init__(self, tile_index: int, decode_scheduler: DecodeScheduler):
+        super().__init__()
+        self._logger = LoggerFactory.get_logger_manager()
+        self._event_bus = InfrastructureFactory.create_event_bus()
+        self._tile_index = tile_index
+        self._decode_scheduler = decode_scheduler
+        self._video_manager = None
+        self._current_click_point = None
+        self._display_size = None
+        self._dirty = RenderReason.NONE
+
+    @property
+    def tile_index(self) -> int:
+        return self._tile_index
+
+    def load_video(self, video_path: str) -> bool:
+        if not os.path.exists(video_path):
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.TILE_VIDEO_NOT_FOUND, logging.DEBUG,
+                             self._tile_index, video_path)
+            return False
+        self.release()
+        self._video_manager = ManagerFactory.create_video_manager(video_path, self._decode_scheduler)
+        if not self._video_manager.load_video():
+            self._logger.log(ConstStrings.LOG_NAME_DEBUG, LoggerMessages.TILE_VIDEO_OPEN_FAILED, logging.DEBUG,
+                             self._tile_index)
+            self._video_manager = None
+            return False
+        self._video_manager.set_decode_downscaled(True)
+        if self._display_size:
+            self._video_manager.set_display_size(*self._display_size)
+        self._video_manager.start_decoding()
+        return True
+
+    def set_display_size(self, width: int, height: int) -> None:
+        self._display_size = (width, height)
+        if self._video_manager:
+            self._video_manager.set_display_size(width, height)
+        self._dirty |= RenderReason.RESIZED
+
+    def set_priority(self, priority: DecodePriority) -> None:
+        if self._video_manager:
+            self._video_manager.set_decode_priority(priority)
+
+    def update_frame(self) -> None:
+        if not self._video_manager:
+            return
+        if self._video_manager.read_frame():
+            self._dirty |= RenderReason.NEW_FRAME
+        if not self._dirty:
+            return
+        self._dirty = RenderReason.NONE
+        frame_rgb = self._video_manager.get_display_frame(self._current_click_point)
+        if frame_rgb is not None:
+            self.frame_ready_signal.emit(frame_rgb)
+
+    @pyqtSlot(int, int)
+    def update_coordinates_slot(self, x: int, y: int) -> None:
+        source_point = self._video_manager.map_to_source(x, y) if self._video_manager else None
+        if source_point:
+            x, y = source_point
+        self._current_click_point = Point(x, y)
+        self._dirty |= RenderReason.POINT_CHANGED
+        self.coordinates_changed_signal.emit(x, y)
+        self._event_bus.publish(Topic.COORDINATES, (x, y))
+
+    def release(self) -> None:
+        if self._video_manager:
+            self._video_manager.release()
+            self._video_manager = None